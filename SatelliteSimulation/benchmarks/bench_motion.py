@@ -0,0 +1,93 @@
+"""
+Benchmarks of fitting the trajectories the collision prediction is based on, in the style of airspeed velocity (asv).
+"""
+
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import numpy as np
+
+from benchmarks.common import SATELLITE_AMOUNTS, SEED
+from model.basic_math.motion import Trajectory, TrajectoryBatch
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# single Trajectory objects are fitted one after the other, more of them take too long
+MAX_SINGLE_TRAJECTORIES = 2000
+
+# shares of the trajectories that move uniformly, accelerate and change their acceleration,
+# most satellites fly with their constant navigation velocity
+TRAJECTORY_KIND_SHARES = (0.7, 0.2, 0.1)
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TrajectorySuite:
+    """
+    Trajectories of 4 recorded centres each, fitted one by one as in Satellite.update_possible_collisions.
+    """
+    params = SATELLITE_AMOUNTS
+    param_names = ["trajectories"]
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def setup(self, trajectory_amount: int):
+        if trajectory_amount > MAX_SINGLE_TRAJECTORIES:
+            # asv convention for skipping a parameter
+            raise NotImplementedError(f"more than {MAX_SINGLE_TRAJECTORIES} trajectories take too long")
+        self.point_lists: list = create_point_lists(trajectory_amount)
+
+
+    def time_trajectories(self, trajectory_amount: int):
+        for points in self.point_lists:
+            Trajectory(points)
+
+
+class TrajectoryBatchSuite:
+    """
+    Trajectories of 4 recorded centres each, fitted in one batch as in Space.avoid_possible_future_collisions.
+    """
+    params = SATELLITE_AMOUNTS
+    param_names = ["trajectories"]
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def setup(self, trajectory_amount: int):
+        self.point_lists: list = create_point_lists(trajectory_amount)
+
+
+    def time_trajectory_batch(self, trajectory_amount: int):
+        TrajectoryBatch(self.point_lists)
+
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+
+def create_point_lists(amount: int, seed: int = SEED) -> list:
+    """
+    The velocities and accelerations are multiples of powers of two like the ones of the satellites that fly
+    straight, so the differences of the uniform and accelerated trajectories have no jerk.
+    """
+    rng = np.random.default_rng(seed)
+    kinds = rng.choice(len(TRAJECTORY_KIND_SHARES), size=amount, p=TRAJECTORY_KIND_SHARES)
+    t = np.arange(4)[:, None]
+    point_lists: list = []
+    for kind in kinds:
+        velocity = rng.integers(-32, 33, 2) / 8
+        acceleration = rng.integers(-16, 17, 2) / 64 if kind >= 1 else np.zeros(2)
+        jerk = rng.uniform(-0.05, 0.05, 2) if kind == 2 else np.zeros(2)
+        points = rng.integers(0, 1920, 2) + velocity * t + acceleration / 2 * t ** 2 + jerk / 6 * t ** 3
+        point_lists.append([tuple(point) for point in points])
+    return point_lists
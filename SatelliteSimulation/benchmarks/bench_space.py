@@ -0,0 +1,183 @@
+"""
+Benchmarks of the model hot paths, in the style of airspeed velocity (asv): every method starting with
+time_ is measured after setup for every value of params.
+"""
+
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import numpy as np
+
+from benchmarks.common import LATTICE_SPACING, SATELLITE_AMOUNTS, SEED, create_space, traced_peak_memory
+from model.border import create_gui_border
+from model.collision.collision_handler import check_and_handle_border_collisions, resolve_border_collisions
+from model.model import GUI_SATELLITE_SIZE, Space
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# the overlap shifts of the border collisions compare every satellite pair,
+# one frame with more satellites takes minutes
+MAX_BORDER_COLLISION_SATELLITES = 200
+
+# share of the satellites that are pushed out of the border
+OUT_OF_BORDER_SHARE = 0.01
+
+# lattice columns of satellites that are pushed against the left border, into a cluster of overlapping satellites
+CLUSTER_COLUMNS = 4
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class SpaceSuite:
+    """
+    The steps of Space.next_frame, which is the model portion of Presenter.next_frame.
+    """
+    params = SATELLITE_AMOUNTS
+    param_names = ["satellites"]
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def setup(self, satellite_amount: int):
+        self.space: Space = create_space(satellite_amount)
+
+
+    def time_update_satellite_observance(self, satellite_amount: int):
+        self.space.update_satellite_observance()
+
+
+    def time_check_and_handle_collisions(self, satellite_amount: int):
+        self.space.check_and_handle_collisions()
+
+
+    def time_avoid_possible_future_collisions(self, satellite_amount: int):
+        self.space.avoid_possible_future_collisions()
+
+
+    def time_move_satellites(self, satellite_amount: int):
+        self.space.move_satellites()
+
+
+    def time_get_velocity_arrows(self, satellite_amount: int):
+        self.space.get_velocity_arrows()
+
+
+    def time_next_frame(self, satellite_amount: int):
+        self.space.next_frame()
+
+
+class AllocationSuite:
+    """
+    Peak memory in bytes traced by tracemalloc during the steps that create many small objects,
+    e.g. the vectors of the velocity arrows.
+    """
+    params = SATELLITE_AMOUNTS
+    param_names = ["satellites"]
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def setup(self, satellite_amount: int):
+        self.space: Space = create_space(satellite_amount)
+
+
+    def track_get_velocity_arrows_peak_memory(self, satellite_amount: int) -> int:
+        return traced_peak_memory(self.space.get_velocity_arrows)
+
+
+    def track_next_frame_peak_memory(self, satellite_amount: int) -> int:
+        return traced_peak_memory(self.space.next_frame)
+
+
+class BorderCollisionSuite:
+    """
+    Border collisions of a space with some satellites out of the border.
+    """
+    params = SATELLITE_AMOUNTS
+    param_names = ["satellites"]
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def setup(self, satellite_amount: int):
+        if satellite_amount > MAX_BORDER_COLLISION_SATELLITES:
+            # asv convention for skipping a parameter
+            raise NotImplementedError(f"more than {MAX_BORDER_COLLISION_SATELLITES} satellites take too long")
+        self.space: Space = create_space(satellite_amount)
+        border = self.space.get_border()
+        satellites: list = self.space.get_satellites()
+        for satellite in satellites[:max(1, int(len(satellites) * OUT_OF_BORDER_SHARE))]:
+            satellite.position.set_x(border.left() - satellite.radius())
+
+
+    def time_check_and_handle_border_collisions(self, satellite_amount: int):
+        check_and_handle_border_collisions(self.space.get_border(), self.space.get_satellites())
+
+
+class BorderClusterSuite:
+    """
+    Relaxation of the border collisions of a cluster pushed against the left border: the satellites of the first
+    lattice columns are moved out of the border, so that they overlap once they are clamped into it.
+    The track_ methods record the convergence of the relaxation.
+    """
+    params = SATELLITE_AMOUNTS
+    param_names = ["satellites"]
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def setup(self, satellite_amount: int):
+        self.space: Space = create_space(satellite_amount)
+        border = self.space.get_border()
+        for satellite in self.space.get_satellites():
+            if satellite.position.x() < border.left() + CLUSTER_COLUMNS * LATTICE_SPACING:
+                satellite.position.add_to_x(-CLUSTER_COLUMNS * LATTICE_SPACING)
+
+
+    def time_resolve_border_collisions(self, satellite_amount: int):
+        self.__resolve_border_collisions()
+
+
+    def track_relaxation_passes(self, satellite_amount: int) -> int:
+        return self.__resolve_border_collisions()[0]
+
+
+    def track_remaining_overlap(self, satellite_amount: int) -> float:
+        return self.__resolve_border_collisions()[1]
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    def __resolve_border_collisions(self) -> tuple:
+        return resolve_border_collisions(self.space.get_border(), self.space.get_satellites(), self.space.get_store())
+
+
+class PlacementSuite:
+    """
+    The random placement of the satellites when a space is created, in a border as densely filled as the GUI.
+    """
+    params = SATELLITE_AMOUNTS
+    param_names = ["satellites"]
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def setup(self, satellite_amount: int):
+        self.border = create_gui_border(satellite_amount)
+
+
+    def time_create_space(self, satellite_amount: int):
+        Space(satellite_amount=satellite_amount, border=self.border, satellite_size=GUI_SATELLITE_SIZE,
+              rng=np.random.default_rng(SEED))
@@ -0,0 +1,97 @@
+"""
+Shared set up of the benchmarks: seeded spaces with any amount of moving satellites.
+"""
+
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import functools
+import math
+import pickle
+import tracemalloc
+
+import numpy as np
+
+from model.basic_math.vector import Vector
+from model.border import Border
+from model.model import GUI_SATELLITE_SIZE, SATELLITE_TYPES, Space
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# amounts of satellites every benchmark runs with
+SATELLITE_AMOUNTS = [20, 200, 2000, 20000]
+
+SEED = 8
+
+# distance of the lattice points the satellites are placed around: most neighbours observe each other,
+# but even two of the largest satellites do not overlap
+LATTICE_SPACING = 180
+LATTICE_JITTER = 30
+BORDER_PADDING = 30
+
+# frames calculated before the measurement, so that the satellites have a recorded trajectory
+WARM_UP_FRAMES = 5
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+
+def create_space(satellite_amount: int, seed: int = SEED) -> Space:
+    """
+    A space with satellites on a jittered lattice, moving into random directions.
+    The lattice keeps the layout the same for every commit, unlike the random placement of Space.
+    Every call returns a new copy of the same space, the space is only built once per process.
+    """
+    return pickle.loads(_build_pickled_space(satellite_amount, seed))
+
+
+def traced_peak_memory(function) -> int:
+    """
+    Peak memory in bytes that tracemalloc traced during one call of the function.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_pickled_space(satellite_amount: int, seed: int) -> bytes:
+    rng: np.random.Generator = np.random.default_rng(seed)
+    columns: int = math.ceil(math.sqrt(satellite_amount * 16 / 9))
+    rows: int = math.ceil(satellite_amount / columns)
+    # one free lattice row around the satellites, so the warm up frames do not move them out of the border
+    border = Border(x=0, y=0, width=(columns + 2) * LATTICE_SPACING + 2 * BORDER_PADDING,
+                    height=(rows + 2) * LATTICE_SPACING + 2 * BORDER_PADDING, padding=BORDER_PADDING)
+    space = Space(satellite_amount=0, border=border, satellite_size=GUI_SATELLITE_SIZE, rng=rng)
+
+    satellites: list = []
+    for index in range(satellite_amount):
+        row, column = divmod(index, columns)
+        satellite_class, size_factor = SATELLITE_TYPES[rng.integers(len(SATELLITE_TYPES))]
+        size: int = math.ceil(GUI_SATELLITE_SIZE * size_factor)
+        x: float = border.left() + (column + 1) * LATTICE_SPACING + (LATTICE_SPACING - size) / 2
+        y: float = border.top() + (row + 1) * LATTICE_SPACING + (LATTICE_SPACING - size) / 2
+        satellite = satellite_class(Vector(x + rng.uniform(-LATTICE_JITTER, LATTICE_JITTER),
+                                           y + rng.uniform(-LATTICE_JITTER, LATTICE_JITTER)), size)
+        if not satellite.is_crashed():
+            satellite.velocity_handler.set_navigation_velocity(Vector(rng.uniform(-4, 4), rng.uniform(-4, 4)))
+        satellites.append(satellite)
+    space.add_satellites(satellites)
+
+    for _ in range(WARM_UP_FRAMES):
+        space.move_satellites()
+        space.update_satellite_observance()
+        space.check_and_handle_collisions()
+    return pickle.dumps(space)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Runs the asv style benchmarks of this package and writes the results to a JSON file.
+Execute this from the SatelliteSimulation directory:
+
+    python -m benchmarks.run --output benchmark_results.json --satellites 20 200 --filter next_frame
+"""
+
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import platform
+import statistics
+import subprocess
+import time
+
+import numpy as np
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+ABSOLUTE_PATH = os.path.abspath(os.path.dirname(__file__))
+
+BENCHMARK_MODULE_PREFIX = "bench_"
+BENCHMARK_METHOD_PREFIX = "time_"
+# asv convention for benchmarks that return a value to record instead of being timed
+TRACK_METHOD_PREFIX = "track_"
+
+DEFAULT_REPEAT = 5
+# time after which no further samples of a benchmark are taken, including the set up
+DEFAULT_MAX_TIME = 20.0
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+
+def find_benchmarks() -> list:
+    """
+    All (name, class, method name) of the time_ and track_ methods of the classes in the bench_ modules.
+    """
+    benchmarks: list = []
+    for module_info in sorted(pkgutil.iter_modules([ABSOLUTE_PATH]), key=lambda info: info.name):
+        if not module_info.name.startswith(BENCHMARK_MODULE_PREFIX):
+            continue
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for class_name, benchmark_class in inspect.getmembers(module, inspect.isclass):
+            if benchmark_class.__module__ != module.__name__:
+                continue
+            for method_name in sorted(vars(benchmark_class)):
+                if method_name.startswith((BENCHMARK_METHOD_PREFIX, TRACK_METHOD_PREFIX)):
+                    benchmarks.append((f"{module_info.name}.{class_name}.{method_name}", benchmark_class,
+                                       method_name))
+    return benchmarks
+
+
+def measure(benchmark_class, method_name: str, param, repeat: int, max_time: float) -> dict:
+    """
+    Calls setup before every sample and measures one call of the benchmark method per sample.
+    A track_ method is called once and its result is recorded as value.
+    """
+    if method_name.startswith(TRACK_METHOD_PREFIX):
+        benchmark = benchmark_class()
+        try:
+            benchmark.setup(param)
+        except NotImplementedError as skip_reason:
+            return {"skipped": str(skip_reason)}
+        return {"value": getattr(benchmark, method_name)(param)}
+
+    samples: list = []
+    start: float = time.perf_counter()
+    while len(samples) < repeat and (not samples or time.perf_counter() - start < max_time):
+        benchmark = benchmark_class()
+        try:
+            benchmark.setup(param)
+        except NotImplementedError as skip_reason:
+            return {"skipped": str(skip_reason)}
+        method = getattr(benchmark, method_name)
+        sample_start: float = time.perf_counter()
+        method(param)
+        samples.append(time.perf_counter() - sample_start)
+    return {"min": min(samples), "median": statistics.median(samples), "max": max(samples),
+            "samples": len(samples)}
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ABSOLUTE_PATH, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(satellite_amounts: list = None, name_filter: str = None, repeat: int = DEFAULT_REPEAT,
+                   max_time: float = DEFAULT_MAX_TIME) -> dict:
+    results: dict = {}
+    for name, benchmark_class, method_name in find_benchmarks():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = {}
+        for param in benchmark_class.params:
+            if satellite_amounts and param not in satellite_amounts:
+                continue
+            result: dict = measure(benchmark_class, method_name, param, repeat, max_time)
+            results[name][str(param)] = result
+            if "skipped" in result:
+                print(f"{name}[{param}]: skipped, {result['skipped']}")
+            elif "value" in result:
+                print(f"{name}[{param}]: {result['value']}")
+            else:
+                print(f"{name}[{param}]: {result['median'] * 1000:.3f} ms")
+
+    return {"revision": git_revision(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "machine": {"platform": platform.platform(), "processor": platform.processor(),
+                        "python": platform.python_version(), "numpy": np.__version__},
+            # of the timed benchmarks, the tracked values have their own unit
+            "unit": "seconds",
+            "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs the benchmarks and writes the results to a JSON file.")
+    parser.add_argument("--output", default="benchmark_results.json", help="path of the JSON file")
+    parser.add_argument("--satellites", type=int, nargs="*", help="only run these satellite amounts")
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="samples per benchmark")
+    parser.add_argument("--max-time", type=float, default=DEFAULT_MAX_TIME,
+                        help="seconds after which no further samples of a benchmark are taken")
+    arguments = parser.parse_args()
+
+    report: dict = run_benchmarks(arguments.satellites, arguments.filter, arguments.repeat, arguments.max_time)
+    with open(arguments.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
+if __name__ == '__main__':
+    main()
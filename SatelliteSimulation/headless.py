@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Runs the satellite simulation without a display and prints its throughput.
+Execute this from the SatelliteSimulation directory:
+
+    python -m headless --satellites 200 --steps 500 --seed 1
+"""
+
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import argparse
+import math
+import time
+
+import numpy as np
+
+from model.border import GUI_SATELLITE_AMOUNT, create_gui_border
+from model.disturbance.disturbance_type import DisturbanceType
+from model.model import GUI_SATELLITE_SIZE, Space
+from presenter.auto_disturbances import DISTURBANCE_TYPE_WEIGHTS
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+
+def run(satellite_amount: int, steps: int, seed: int = None, disturbance_interval: int = 0) -> float:
+    """
+    Runs the frames of Presenter.next_frame without the conversion to view objects.
+
+    Returns
+    -------
+    float
+        the duration of the steps in seconds, without the creation of the space
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    space: Space = Space(satellite_amount=satellite_amount, border=create_gui_border(satellite_amount),
+                         satellite_size=GUI_SATELLITE_SIZE, rng=rng)
+    disturbance_types: list = list(DisturbanceType)
+
+    start: float = time.perf_counter()
+    for step in range(steps):
+        if disturbance_interval and step % disturbance_interval == 0:
+            space.create_disturbance(rng.choice(disturbance_types, p=DISTURBANCE_TYPE_WEIGHTS))
+        space.next_frame()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs the satellite simulation without a display.")
+    parser.add_argument("--satellites", type=int, default=GUI_SATELLITE_AMOUNT, help="amount of satellites")
+    parser.add_argument("--steps", type=int, default=1000, help="amount of simulated frames")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the random number generator")
+    parser.add_argument("--disturbance-interval", type=int, default=0,
+                        help="frames between two random disturbances, 0 for no disturbances")
+    arguments = parser.parse_args()
+
+    duration: float = run(arguments.satellites, arguments.steps, arguments.seed, arguments.disturbance_interval)
+    steps_per_second: float = arguments.steps / duration if duration > 0 else math.inf
+    print(f"{arguments.satellites} satellites, {arguments.steps} steps in {duration:.3f}s")
+    print(f"{steps_per_second:.1f} steps/s")
+    print(f"{steps_per_second * arguments.satellites:.1f} satellite steps/s")
+
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
+if __name__ == '__main__':
+    main()
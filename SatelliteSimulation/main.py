@@ -10,6 +10,7 @@ Main module for the satellite simulation. Execute this to start the program.
 # =========================================================================== #
 #  SECTION: Imports
 # =========================================================================== #
+import argparse
 import logging
 import os
 import pandas as pd
@@ -22,6 +23,8 @@ from presenter.presenter import Presenter
 #  SECTION: Global definitions
 # =========================================================================== #
 ABSOLUTE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__)))
+# the phase durations of the frames are written to this file when the program is closed
+PROFILE_FILE_NAME = "frame_profile.csv"
 
 # =========================================================================== #
 #  SECTION: Class definitions
@@ -36,9 +39,15 @@ def read_excel_file(file: str) -> pd.DataFrame:
     return pd.read_excel(file, header=0, engine='openpyxl', index_col=0)
 
 def main():
+    parser = argparse.ArgumentParser(description="Starts the satellite simulation.")
+    parser.add_argument("--threaded", action="store_true",
+                        help="calculate the simulation on its own thread, independent of the drawing")
+    arguments = parser.parse_args()
+
     config_file_path: str = os.path.join(ABSOLUTE_PATH, "config.xlsx")
     config_data: pd.DataFrame = read_excel_file(file=config_file_path)
-    Presenter(config_data=config_data)
+    Presenter(config_data=config_data, profile_file_path=os.path.join(ABSOLUTE_PATH, PROFILE_FILE_NAME),
+              threaded_simulation=arguments.threaded)
 
 
 # =========================================================================== #
@@ -108,19 +108,24 @@ class Arrow:
 
 
     def __shift_vector_by_length(self, start_position: Vector, direction_vector: Vector, length: float) -> Vector:
-        distance: float = calculate_distance(direction_vector, start_position)
-        dx_dy: Vector = subtract(direction_vector, start_position)
-        unit_normal_direction_vector: Vector = divide(dx_dy, distance)
-        scaled_direction_vector: Vector = multiply(unit_normal_direction_vector, length)
-        return add(start_position, scaled_direction_vector)
+        # add(start, multiply(divide(subtract(direction, start), distance), length)) on the coordinates
+        start_x, start_y = start_position.get_as_tuple()
+        dx: float = direction_vector.x() - start_x
+        dy: float = direction_vector.y() - start_y
+        distance: float = math.sqrt(dx * dx + dy * dy)
+        if distance == 0:
+            distance = 10 ** (-100)
+        return Vector(start_x + dx / distance * length, start_y + dy / distance * length)
 
 
     def __rotate_point_around_axis(self, point: Vector, axis: Vector, theta: float) -> Vector:
         sin: float = math.sin(theta)
         cos: float = math.cos(theta)
-        d: Vector = subtract(point, axis)  # (dx, dy)
-        x: float = cos * d.x() - sin * d.y() + axis.x()
-        y: float = sin * d.x() + cos * d.y() + axis.y()
+        axis_x, axis_y = axis.get_as_tuple()
+        dx: float = point.x() - axis_x
+        dy: float = point.y() - axis_y
+        x: float = cos * dx - sin * dy + axis_x
+        y: float = sin * dx + cos * dy + axis_y
         return Vector(x, y)
 
 
@@ -0,0 +1,75 @@
+"""
+Distance comparisons on squared distances. A distance that is only compared with a threshold does not need its
+square root: for a threshold that is not negative, like a sum of radii, the squared distance and the squared
+threshold compare the same way, apart from the last bit of rounding.
+The scalar predicates repeat calculate_distance_squared of the vector module, they are called for every pair of
+satellites and a second function call costs more than the square root.
+"""
+
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import numpy as np
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+def within_distance(x1: float, y1: float, x2: float, y2: float, distance: float) -> bool:
+    """
+    True if the two points are at most the given distance apart.
+    """
+    dx: float = x1 - x2
+    dy: float = y1 - y2
+    return dx * dx + dy * dy <= distance * distance
+
+
+def closer_than(x1: float, y1: float, x2: float, y2: float, distance: float) -> bool:
+    """
+    True if the two points are less than the given distance apart.
+    """
+    dx: float = x1 - x2
+    dy: float = y1 - y2
+    return dx * dx + dy * dy < distance * distance
+
+
+def squared_lengths(vectors: np.ndarray) -> np.ndarray:
+    """
+    Squared lengths (...) of the vectors (..., 2).
+    """
+    return vectors[..., 0] * vectors[..., 0] + vectors[..., 1] * vectors[..., 1]
+
+
+def coordinates_within_distances(x: np.ndarray, y: np.ndarray, distances: np.ndarray) -> np.ndarray:
+    """
+    True for the vectors given by their coordinates x and y (...) that are at most as long as their distance (...),
+    without stacking the coordinates.
+    """
+    return x * x + y * y <= distances * distances
+
+
+def within_distances(vectors: np.ndarray, distances: np.ndarray) -> np.ndarray:
+    """
+    True for the vectors (..., 2), e.g. the differences of two centres, that are at most as long as their
+    distance (...).
+    """
+    return coordinates_within_distances(vectors[..., 0], vectors[..., 1], distances)
+
+
+def closer_than_distances(vectors: np.ndarray, distances: np.ndarray) -> np.ndarray:
+    """
+    True for the vectors (..., 2) that are shorter than their distance (...).
+    """
+    return squared_lengths(vectors) < distances * distances
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
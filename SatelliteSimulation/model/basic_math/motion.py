@@ -1,8 +1,11 @@
 # =========================================================================== #
 #  SECTION: Imports
 # =========================================================================== #
+import math
+
 import numpy as np
 
+from model.basic_math.distance_predicates import coordinates_within_distances, within_distance
 from model.basic_math.math_basic import StraightLineEquation
 from model.basic_math.vector import Vector
 from model.collision.future_collision_data import FutureCollisionData
@@ -11,6 +14,11 @@ from model.collision.future_collision_data import FutureCollisionData
 # =========================================================================== #
 #  SECTION: Global definitions
 # =========================================================================== #
+UNLIMITED_MOTION_DURATION = 1E5  # value faaaar in the future
+
+# the time from 0 to the end of the motions is split at these moments to bound the distance of a pair in each part,
+# the parts get longer with the time as the acceleration and jerk move the pair further away from its linear motion
+APPROACH_INTERVAL_BOUNDS = (0,) + tuple(2.0 ** exponent for exponent in range(18)) + (math.inf,)
 
 # =========================================================================== #
 #  SECTION: Class definitions
@@ -25,7 +33,7 @@ class Trajectory:
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Constructor
     # ----------------------------------------------------------------------- #
-    def __init__(self, points: list):
+    def __init__(self, points: list, motion_duration: float = None):
         self.points: list = [np.array(point) for point in points]
         self.direction_vector: np.array = None
         self.type: int = 1
@@ -33,9 +41,13 @@ class Trajectory:
         self.velocity: np.array = None
         self.acceleration: np.array = None
         self.jerk = None
-        self.motion_duration: float = 1E5  # value faaaar in the future
+        self.motion_duration: float = UNLIMITED_MOTION_DURATION
         self._set_basic_features()
-        self._set_motion_duration()
+        if motion_duration is None:
+            self._set_motion_duration()
+        else:
+            # already calculated by a TrajectoryBatch
+            self.motion_duration = motion_duration
 
 
     # ----------------------------------------------------------------------- #
@@ -92,16 +104,19 @@ class Trajectory:
 
 
     def _set_motion_duration(self):
+        if self.type < 4 or not self.jerk.any():
+            self.motion_duration = calculate_motion_duration_without_jerk(self.velocity, self.acceleration)
+            return
         j_x, j_y = self.jerk
         a_x, a_y = self.acceleration
         v_x0, v_y0 = self.velocity
 
-        coeff_1 = (j_x ** 2 + j_y ** 2) / 4
+        coeff_1 = (j_x * j_x + j_y * j_y) / 4
         coeff_2 = j_x * a_x + j_y * a_y
         coeff_3 = j_x * v_x0 + j_y * v_y0
-        coeff_4 = a_x ** 2 + a_y ** 2
+        coeff_4 = a_x * a_x + a_y * a_y
         coeff_5 = 2 * (a_x * v_x0 + a_y * v_y0)
-        coeff_6 = v_x0 ** 2 + v_y0 ** 2
+        coeff_6 = v_x0 * v_x0 + v_y0 * v_y0
 
         velocity_equation = np.array([coeff_1, coeff_2,
                                       coeff_3 + coeff_4,
@@ -112,6 +127,102 @@ class Trajectory:
             self.motion_duration = rational_roots_from_zero[1]
 
 
+class TrajectoryCache:
+    """
+    The trajectories of one frame, keyed by satellite id and the points they are fitted to.
+    Every FutureCollisionDetector of a frame shares the trajectory of a satellite instead of fitting it again,
+    the trajectories of the previous frame are dropped as soon as a trajectory of a new frame is requested.
+    """
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self):
+        self.__frame: int = None
+        self.__trajectories: dict = {}
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    def __len__(self) -> int:
+        return len(self.__trajectories)
+
+
+    def get_trajectory(self, satellite_id: int, frame: int, points: list) -> Trajectory:
+        if frame != self.__frame:
+            self.__trajectories.clear()
+            self.__frame = frame
+        key: tuple = (satellite_id, tuple(points))
+        trajectory: Trajectory = self.__trajectories.get(key)
+        if trajectory is None:
+            trajectory = Trajectory(points)
+            self.__trajectories[key] = trajectory
+        return trajectory
+
+
+class TrajectoryBatch:
+    """
+    K trajectories as arrays of shape (K, 2). The features are calculated with the same differences as in
+    Trajectory and the motion durations of all trajectories with one batched root search.
+    Rows with the same key, e.g. (satellite id, points), share one calculation of their features.
+    """
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, point_lists: list, keys: list = None):
+        self.__point_lists: list = point_lists
+        unique_point_lists, rows = share_rows(point_lists, keys)
+        amount: int = len(unique_point_lists)
+        self.support_vectors: np.ndarray = np.zeros((amount, 2))
+        self.velocities: np.ndarray = np.zeros((amount, 2))
+        self.accelerations: np.ndarray = np.zeros((amount, 2))
+        self.jerks: np.ndarray = np.zeros((amount, 2))
+        self.__set_basic_features(unique_point_lists)
+        self.motion_durations: np.ndarray = calculate_motion_durations(self.velocities, self.accelerations,
+                                                                       self.jerks)
+        if rows is not None:
+            self.support_vectors = self.support_vectors[rows]
+            self.velocities = self.velocities[rows]
+            self.accelerations = self.accelerations[rows]
+            self.jerks = self.jerks[rows]
+            self.motion_durations = self.motion_durations[rows]
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    def __len__(self) -> int:
+        return len(self.__point_lists)
+
+
+    def trajectory(self, index: int) -> Trajectory:
+        return Trajectory(self.__point_lists[index], motion_duration=self.motion_durations[index])
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    def __set_basic_features(self, point_lists: list):
+        lengths = np.array([len(points) for points in point_lists])
+        for length in np.unique(lengths):
+            rows = np.flatnonzero(lengths == length)
+            points = np.array([point_lists[row] for row in rows], dtype=float)
+            self.support_vectors[rows] = points[:, -1]
+            if length >= 2:
+                self.velocities[rows] = points[:, 1] - points[:, 0]
+            if length >= 3:
+                velocities2 = points[:, 2] - points[:, 1]
+                self.accelerations[rows] = velocities2 - self.velocities[rows]
+            if length >= 4:
+                velocities3 = points[:, 3] - points[:, 2]
+                accelerations2 = velocities3 - velocities2
+                self.jerks[rows] = accelerations2 - self.accelerations[rows]
+
+
 class FutureCollisionDetector:
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Constructor
@@ -138,6 +249,8 @@ class FutureCollisionDetector:
     #  SUBSECTION: Public Methods
     # ----------------------------------------------------------------------- #
     def is_collision_possible(self) -> FutureCollisionData:
+        if self._collision_impossible():
+            return None
         return self._solve_distance_equation_for_four()
 
 
@@ -153,6 +266,44 @@ class FutureCollisionDetector:
                 print(f"\tx_{i + 1} = {z.real:.2} {z.imag:+.2}")
 
 
+    def _collision_impossible(self) -> bool:
+        """
+        collisions_impossible for this pair, with python floats instead of arrays of one pair.
+        """
+        j_x, j_y = ((self._trajectory2.jerk - self._trajectory1.jerk) / 3).tolist()
+        a_x, a_y = ((self._trajectory2.acceleration - self._trajectory1.acceleration) / 2).tolist()
+        v_x, v_y = (self._trajectory2.velocity - self._trajectory1.velocity).tolist()
+        p_x, p_y = (self._trajectory2.support_vector - self._trajectory1.support_vector).tolist()
+        end_of_motions: float = float(self._end_of_motions)
+        if end_of_motions <= 0:
+            return True
+
+        coefficients: list = [j_x * j_x + j_y * j_y,
+                              2 * (a_x * j_x + a_y * j_y),
+                              2 * (j_x * v_x + j_y * v_y) + a_x * a_x + a_y * a_y,
+                              2 * (j_x * p_x + j_y * p_y) + 2 * (v_x * a_x + v_y * a_y),
+                              2 * (a_x * p_x + a_y * p_y) + v_x * v_x + v_y * v_y,
+                              2 * (v_x * p_x + v_y * p_y),
+                              p_x * p_x + p_y * p_y - self._min_distance * self._min_distance]
+        if has_no_positive_root(coefficients):
+            return True
+
+        speed: float = v_x * v_x + v_y * v_y
+        approach_moment: float = -(v_x * p_x + v_y * p_y) / speed if speed > 0 else 0
+        deviation: float = math.hypot(a_x, a_y)
+        jerk_deviation: float = math.hypot(j_x, j_y)
+        for start, end in zip(APPROACH_INTERVAL_BOUNDS[:-1], APPROACH_INTERVAL_BOUNDS[1:]):
+            end = min(end, end_of_motions)
+            closest_moment: float = min(max(approach_moment, start), end)
+            # the relative position at the closest approach, compared with its distance to the origin
+            if within_distance(p_x + v_x * closest_moment, p_y + v_y * closest_moment, 0, 0,
+                               self._min_distance + (deviation + jerk_deviation * end) * end * end):
+                return has_no_positive_root(shift_polynomial(coefficients, start))
+            if end == end_of_motions:
+                return True
+        return True
+
+
     def _get_point_of_crash(self, point1: tuple, point2: tuple) -> tuple:
         radial_vector: Vector = StraightLineEquation(
             point2, point1).get_point_in_distance(self.radius1)
@@ -246,16 +397,16 @@ class FutureCollisionDetector:
         p_x = p_x2 - p_x1
         p_y = p_y2 - p_y1
 
-        coeff_1 = j_x ** 2 + j_y ** 2
+        coeff_1 = j_x * j_x + j_y * j_y
         coeff_2 = 2 * (a_x * j_x + a_y * j_y)
         coeff_3 = 2 * (j_x * v_x + j_y * v_y)
-        coeff_4 = a_x ** 2 + a_y ** 2
+        coeff_4 = a_x * a_x + a_y * a_y
         coeff_5 = 2 * (j_x * p_x + j_y * p_y)
         coeff_6 = 2 * (v_x * a_x + v_y * a_y)
         coeff_7 = 2 * (a_x * p_x + a_y * p_y)
-        coeff_8 = v_x ** 2 + v_y ** 2
+        coeff_8 = v_x * v_x + v_y * v_y
         coeff_9 = 2 * (v_x * p_x + v_y * p_y)
-        coeff_10 = p_x ** 2 + p_y ** 2 - self._min_distance ** 2
+        coeff_10 = p_x * p_x + p_y * p_y - self._min_distance * self._min_distance
 
         distance_equation = np.array(
             [coeff_1, coeff_2,
@@ -268,10 +419,10 @@ class FutureCollisionDetector:
                             0 and 0 < z.real <= self._end_of_motions]
         if critical_moments:
             t = min(critical_moments)
-            x1_crash = j_x1 / 3 * t ** 3 + a_x1 / 2 * t ** 2 + v_x1 * t + p_x1
-            x2_crash = j_x2 / 3 * t ** 3 + a_x2 / 2 * t ** 2 + v_x2 * t + p_x2
-            y1_crash = j_y1 / 3 * t ** 3 + a_y1 / 2 * t ** 2 + v_y1 * t + p_y1
-            y2_crash = j_y2 / 3 * t ** 3 + a_y2 / 2 * t ** 2 + v_y2 * t + p_y2
+            x1_crash = j_x1 / 3 * (t * t * t) + a_x1 / 2 * (t * t) + v_x1 * t + p_x1
+            x2_crash = j_x2 / 3 * (t * t * t) + a_x2 / 2 * (t * t) + v_x2 * t + p_x2
+            y1_crash = j_y1 / 3 * (t * t * t) + a_y1 / 2 * (t * t) + v_y1 * t + p_y1
+            y2_crash = j_y2 / 3 * (t * t * t) + a_y2 / 2 * (t * t) + v_y2 * t + p_y2
             point_of_crash = self._get_point_of_crash(
                 (x1_crash, y1_crash), (x2_crash, y2_crash))
             return FutureCollisionData(point_of_crash, t, self._trajectory2)
@@ -281,6 +432,252 @@ class FutureCollisionDetector:
 # =========================================================================== #
 #  SECTION: Function definitions
 # =========================================================================== #
+def polynomial_roots(coefficients: np.ndarray) -> np.ndarray:
+    """
+    np.roots for K polynomials at once, the coefficients (K, n + 1) start with the highest power.
+    The polynomials are grouped by their leading and trailing zeros and the eigenvalues of the companion
+    matrices of each group are calculated with one call, so the roots are the same as the ones of np.roots.
+
+    Returns
+    -------
+    np.ndarray
+        complex roots (K, n) in the order of np.roots, filled up with nan for polynomials of lower degree
+    """
+    amount, width = coefficients.shape
+    roots = np.full((amount, width - 1), np.nan, dtype=complex)
+    non_zero = coefficients != 0
+    has_non_zero = non_zero.any(axis=1)
+    leading_zeros = np.argmax(non_zero, axis=1)
+    trailing_zeros = np.argmax(non_zero[:, ::-1], axis=1)
+    patterns = leading_zeros * width + trailing_zeros
+
+    for pattern in np.unique(patterns[has_non_zero]):
+        rows = np.flatnonzero(has_non_zero & (patterns == pattern))
+        leading, trailing = divmod(int(pattern), width)
+        polynomials = coefficients[rows, leading:width - trailing]
+        degree: int = polynomials.shape[1] - 1
+        if degree > 0:
+            companion_matrices = np.zeros((len(rows), degree, degree))
+            companion_matrices[:, np.arange(1, degree), np.arange(degree - 1)] = 1
+            companion_matrices[:, 0, :] = -polynomials[:, 1:] / polynomials[:, :1]
+            roots[rows, :degree] = np.linalg.eigvals(companion_matrices)
+        roots[rows, degree:degree + trailing] = 0
+    return roots
+
+
+def share_rows(point_lists: list, keys: list = None) -> tuple:
+    """
+    The point lists of the first row of every key and the index of its key for every row,
+    None instead of the indices if there are no keys.
+    """
+    if keys is None:
+        return point_lists, None
+    key_rows: dict = {}
+    rows = np.array([key_rows.setdefault(key, len(key_rows)) for key in keys], dtype=np.int64)
+    unique_point_lists: list = [None] * len(key_rows)
+    for row, points in zip(rows, point_lists):
+        if unique_point_lists[row] is None:
+            unique_point_lists[row] = points
+    return unique_point_lists, rows
+
+
+def calculate_motion_duration_without_jerk(velocity: np.ndarray, acceleration: np.ndarray) -> float:
+    """
+    The motion duration of a trajectory without jerk, without a root search.
+    Its speed polynomial |acceleration|^2 t^2 + 2 (acceleration . velocity) t + |velocity|^2 has a double root
+    at 0 only if the trajectory starts at rest and accelerates, which gives a motion duration of 0.
+    Otherwise there are no roots, complex ones or a double root of a decelerating trajectory,
+    none of which ends the motion.
+    """
+    v_x, v_y = velocity
+    a_x, a_y = acceleration
+    if v_x * v_x + v_y * v_y == 0 and a_x * v_x + a_y * v_y == 0 and a_x * a_x + a_y * a_y != 0:
+        return 0
+    return UNLIMITED_MOTION_DURATION
+
+
+def calculate_motion_durations(velocities: np.ndarray, accelerations: np.ndarray, jerks: np.ndarray) -> np.ndarray:
+    """
+    Trajectory._set_motion_duration for K trajectories given by their features (K, 2).
+    Only the trajectories with jerk need the batched root search.
+    """
+    v_x0, v_y0 = velocities[:, 0], velocities[:, 1]
+    a_x, a_y = accelerations[:, 0], accelerations[:, 1]
+    motion_durations = np.full(len(velocities), UNLIMITED_MOTION_DURATION)
+    starts_at_rest = (v_x0 * v_x0 + v_y0 * v_y0 == 0) & (a_x * v_x0 + a_y * v_y0 == 0) & (a_x * a_x + a_y * a_y != 0)
+    motion_durations[starts_at_rest] = 0
+
+    with_jerk = jerks.any(axis=1)
+    if with_jerk.any():
+        motion_durations[with_jerk] = calculate_motion_durations_with_jerk(
+            velocities[with_jerk], accelerations[with_jerk], jerks[with_jerk])
+    return motion_durations
+
+
+def calculate_motion_durations_with_jerk(velocities: np.ndarray, accelerations: np.ndarray,
+                                         jerks: np.ndarray) -> np.ndarray:
+    j_x, j_y = jerks[:, 0], jerks[:, 1]
+    a_x, a_y = accelerations[:, 0], accelerations[:, 1]
+    v_x0, v_y0 = velocities[:, 0], velocities[:, 1]
+
+    coeff_1 = (j_x * j_x + j_y * j_y) / 4
+    coeff_2 = j_x * a_x + j_y * a_y
+    coeff_3 = j_x * v_x0 + j_y * v_y0
+    coeff_4 = a_x * a_x + a_y * a_y
+    coeff_5 = 2 * (a_x * v_x0 + a_y * v_y0)
+    coeff_6 = v_x0 * v_x0 + v_y0 * v_y0
+
+    roots = polynomial_roots(np.stack([coeff_1, coeff_2, coeff_3 + coeff_4, coeff_5, coeff_6], axis=1))
+    # nan roots fail both comparisons
+    rational_roots_from_zero = (roots.imag == 0) & (roots.real >= 0)
+    rows = np.arange(len(roots))
+    first = np.argmax(rational_roots_from_zero, axis=1)
+    second = np.argmax(rational_roots_from_zero & (np.arange(roots.shape[1]) > first[:, None]), axis=1)
+
+    motion_durations = np.full(len(roots), UNLIMITED_MOTION_DURATION)
+    ends = (rational_roots_from_zero.sum(axis=1) == 2) & (roots.real[rows, first] == 0)
+    motion_durations[ends] = roots.real[rows, second][ends]
+    return motion_durations
+
+
+def calculate_distance_coefficients(j: np.ndarray, a: np.ndarray, v: np.ndarray, p: np.ndarray,
+                                    min_distances: np.ndarray) -> np.ndarray:
+    """
+    The coefficients (K, 7), highest power first, of the squared distance minus the squared minimum distance
+    |j t^3 + a t^2 + v t + p|^2 - min_distance^2 of K pairs, given by their relative motions (K, 2)
+    with the jerks already divided by 3 and the accelerations by 2.
+    """
+    j_x, j_y, a_x, a_y = j[:, 0], j[:, 1], a[:, 0], a[:, 1]
+    v_x, v_y, p_x, p_y = v[:, 0], v[:, 1], p[:, 0], p[:, 1]
+
+    coeff_1 = j_x * j_x + j_y * j_y
+    coeff_2 = 2 * (a_x * j_x + a_y * j_y)
+    coeff_3 = 2 * (j_x * v_x + j_y * v_y)
+    coeff_4 = a_x * a_x + a_y * a_y
+    coeff_5 = 2 * (j_x * p_x + j_y * p_y)
+    coeff_6 = 2 * (v_x * a_x + v_y * a_y)
+    coeff_7 = 2 * (a_x * p_x + a_y * p_y)
+    coeff_8 = v_x * v_x + v_y * v_y
+    coeff_9 = 2 * (v_x * p_x + v_y * p_y)
+    coeff_10 = p_x * p_x + p_y * p_y - min_distances * min_distances
+
+    return np.stack([coeff_1, coeff_2, coeff_3 + coeff_4, coeff_5 + coeff_6, coeff_7 + coeff_8, coeff_9, coeff_10],
+                    axis=1)
+
+
+def has_no_positive_root(coefficients: list) -> bool:
+    """
+    True if the coefficients have no sign change and the polynomial is not 0 at 0,
+    by the rule of signs of Descartes it has no positive root then.
+    """
+    return coefficients[-1] > 0 and all(coefficient >= 0 for coefficient in coefficients)
+
+
+def shift_polynomial(coefficients: list, shift: float) -> list:
+    """
+    The coefficients of p(t + shift) for the coefficients of p(t), highest power first, by repeated Horner steps.
+    """
+    shifted_coefficients: list = list(coefficients)
+    degree: int = len(coefficients) - 1
+    for step in range(degree):
+        for index in range(1, degree + 1 - step):
+            shifted_coefficients[index] += shift * shifted_coefficients[index - 1]
+    return shifted_coefficients
+
+
+def shift_polynomials(coefficients: np.ndarray, shifts: np.ndarray) -> np.ndarray:
+    """
+    shift_polynomial for K polynomials (K, n + 1) and their shifts (K,) at once.
+    """
+    shifted_coefficients = coefficients.copy()
+    degree: int = coefficients.shape[1] - 1
+    for step in range(degree):
+        for index in range(1, degree + 1 - step):
+            shifted_coefficients[:, index] += shifts * shifted_coefficients[:, index - 1]
+    return shifted_coefficients
+
+
+def collisions_impossible(coefficients: np.ndarray, j: np.ndarray, a: np.ndarray, v: np.ndarray, p: np.ndarray,
+                          min_distances: np.ndarray, end_of_motions: np.ndarray) -> np.ndarray:
+    """
+    Conservative test which of K pairs can not get closer than their minimum distance before the end of their
+    motions, so that their distance polynomial has no root to search for.
+    The time until the end of the motions is split into parts at APPROACH_INTERVAL_BOUNDS. In each part the distance
+    is at least the closest approach of the linear part of the motion, minus the distance the acceleration and jerk
+    can add until the end of the part. A pair is excluded if this bound is larger than the minimum distance in all
+    parts, or in all parts before a part whose start s has no root after it: the coefficients of the distance
+    polynomial shifted by s have no sign change, so by the rule of signs of Descartes it has no positive root.
+    Without shift this already excludes e.g. the pairs that move apart.
+
+    Returns
+    -------
+    np.ndarray
+        True for the pairs (K,) that do not collide
+    """
+    ends_immediately = end_of_motions <= 0
+    no_positive_root = (coefficients >= 0).all(axis=1) & (coefficients[:, -1] > 0)
+
+    end_of_motions = end_of_motions[:, None]
+    starts = np.minimum(np.array(APPROACH_INTERVAL_BOUNDS[:-1]), end_of_motions)
+    ends = np.minimum(np.array(APPROACH_INTERVAL_BOUNDS[1:]), end_of_motions)
+    speeds = (v * v).sum(axis=1)[:, None]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        closest_moments = np.where(speeds > 0, -(v * p).sum(axis=1)[:, None] / speeds, 0)
+    closest_moments = np.clip(closest_moments, starts, ends)
+    closest_x = p[:, :1] + v[:, :1] * closest_moments
+    closest_y = p[:, 1:] + v[:, 1:] * closest_moments
+    max_deviations = (np.hypot(a[:, :1], a[:, 1:]) + np.hypot(j[:, :1], j[:, 1:]) * ends) * ends * ends
+    misses = ~coordinates_within_distances(closest_x, closest_y, min_distances[:, None] + max_deviations)
+
+    # the polynomial is shifted to the start of the first part the bound does not exclude
+    first_hits = np.argmin(misses, axis=1)
+    shifted_coefficients = shift_polynomials(coefficients, starts[np.arange(len(starts)), first_hits])
+    no_root_after_hit = (shifted_coefficients >= 0).all(axis=1) & (shifted_coefficients[:, -1] > 0)
+
+    return ends_immediately | no_positive_root | misses.all(axis=1) | no_root_after_hit
+
+
+def predict_collisions(radii1: np.ndarray, radii2: np.ndarray,
+                       trajectories1: TrajectoryBatch, trajectories2: TrajectoryBatch) -> tuple:
+    """
+    FutureCollisionDetector.is_collision_possible for K pairs of trajectories with one batched root search.
+
+    Returns
+    -------
+    tuple
+        the earliest critical moments (K,), nan for pairs without a possible collision,
+        and the points of crash (K, 2)
+    """
+    j = (trajectories2.jerks - trajectories1.jerks) / 3
+    a = (trajectories2.accelerations - trajectories1.accelerations) / 2
+    v = trajectories2.velocities - trajectories1.velocities
+    p = trajectories2.support_vectors - trajectories1.support_vectors
+    min_distances = radii1 + radii2
+    end_of_motions = trajectories1.motion_durations + trajectories2.motion_durations
+
+    coefficients = calculate_distance_coefficients(j, a, v, p, min_distances)
+    # most pairs move apart, only the others need the root search
+    possible = ~collisions_impossible(coefficients, j, a, v, p, min_distances, end_of_motions)
+    roots = np.full((len(coefficients), coefficients.shape[1] - 1), np.nan, dtype=complex)
+    roots[possible] = polynomial_roots(coefficients[possible])
+    critical_moments = (roots.imag == 0) & (roots.real > 0) & (roots.real <= end_of_motions[:, None])
+    moments = np.where(critical_moments, roots.real, np.inf).min(axis=1)
+    moments[~critical_moments.any(axis=1)] = np.nan
+
+    t = moments[:, None]
+    crash_points1 = trajectories1.jerks / 3 * (t * t * t) + trajectories1.accelerations / 2 * (t * t) + \
+                    trajectories1.velocities * t + trajectories1.support_vectors
+    crash_points2 = trajectories2.jerks / 3 * (t * t * t) + trajectories2.accelerations / 2 * (t * t) + \
+                    trajectories2.velocities * t + trajectories2.support_vectors
+    # same as FutureCollisionDetector._get_point_of_crash: radius1 away from point2 in direction of point1
+    directions = crash_points1 - crash_points2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        unit_normals = directions / np.sqrt(directions[:, :1] * directions[:, :1] +
+                                            directions[:, 1:] * directions[:, 1:])
+    points_of_crash = unit_normals * radii1[:, None] + crash_points2
+    return moments, points_of_crash
+
+
 def direction_changed(points: list) -> bool:
     """
     checks if first, last and second last points are in one line
@@ -16,7 +16,10 @@ import math
 class Vector:
     """
     a 2 dimensional vector class
+    The slots keep every vector as small as two floats, the in-place methods and the functions on coordinates
+    avoid new vectors in the hot paths.
     """
+    __slots__ = ("_x", "_y")
 
 
     # ----------------------------------------------------------------------- #
@@ -67,7 +70,11 @@ class Vector:
 
 
     def magnitude(self) -> float:
-        return math.sqrt(self._x ** 2 + self._y ** 2)
+        return math.sqrt(self._x * self._x + self._y * self._y)
+
+
+    def magnitude_squared(self) -> float:
+        return self._x * self._x + self._y * self._y
 
 
     def tangent(self):
@@ -103,6 +110,19 @@ class Vector:
         self.add_to_y(vector.y())
 
 
+    def subtract_vector(self, vector):
+        self._x -= vector.x()
+        self._y -= vector.y()
+
+
+    def scale(self, scalar: float):
+        """
+        In-place variant of multiply.
+        """
+        self._x *= scalar
+        self._y *= scalar
+
+
     def __str__(self):
         return f"({self._x}, {self._y})"
     # ----------------------------------------------------------------------- #
@@ -135,8 +155,25 @@ def divide(vector: Vector, scalar: float) -> Vector:
 
 
 def calculate_distance(vector1: Vector, vector2: Vector) -> float:
-    vector: Vector = subtract(vector1, vector2)
-    return vector.magnitude()
+    return calculate_coordinate_distance(vector1.x(), vector1.y(), vector2.x(), vector2.y())
+
+
+def calculate_coordinate_distance(x1: float, y1: float, x2: float, y2: float) -> float:
+    """
+    calculate_distance of two points given by their coordinates, without a vector in between.
+    """
+    dx: float = x1 - x2
+    dy: float = y1 - y2
+    return math.sqrt(dx * dx + dy * dy)
+
+
+def calculate_distance_squared(x1: float, y1: float, x2: float, y2: float) -> float:
+    """
+    Squared distance of two points given by their coordinates, enough to compare it with a squared distance.
+    """
+    dx: float = x1 - x2
+    dy: float = y1 - y2
+    return dx * dx + dy * dy
 
 
 def tuple_to_vector(given_tuple: tuple) -> Vector:
@@ -25,48 +25,55 @@ class Velocity(Vector):
     # ----------------------------------------------------------------------- #
     def __init__(self, x: float, y: float):
         super().__init__(x, y)
-        self.__t = 0
-        self.__v1 = 0
-        self.__v2 = 0
-        self.__magnitude = 0
+        self._t = 0
+        self._v1 = 0
+        self._v2 = 0
+        self._magnitude = 0
 
 
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Getter/Setter
     # ----------------------------------------------------------------------- #
     def update(self):
-        if self.__v1 != 0 or self.__v2 != 0:
+        if self._v1 != 0 or self._v2 != 0:
             self.increment_t()
             self.update_magnitude()
-            if self.__t > 0 and self.__magnitude <= 0:
-                self.__t = 0
-                self.__v1 = 0
-                self.__v2 = 0
-                self.__magnitude = 0
+            if self._t > 0 and self._magnitude <= 0:
+                self._t = 0
+                self._v1 = 0
+                self._v2 = 0
+                self._magnitude = 0
                 self.set_xy(0, 0)
             else:
-                self.set_vector(multiply(self.unit_normal(), self.__magnitude))
+                self.set_vector(multiply(self.unit_normal(), self._magnitude))
 
 
     def dummy_update(self, moments_in_future: int) -> Vector:
-        if self.__v1 != 0 or self.__v2 != 0:
-            t = self.__t + moments_in_future
-            future_magnitude = self.__v1 * t ** 2 + self.__v2 * t
+        if self._v1 != 0 or self._v2 != 0:
+            t = self._t + moments_in_future
+            future_magnitude = self._v1 * t ** 2 + self._v2 * t
             if t > 0 and future_magnitude <= 0:
                 return Vector(0, 0)
             return multiply(self.unit_normal(), future_magnitude)
 
 
     def t(self):
-        return self.__t
+        return self._t
+
+
+    def curve_state(self) -> tuple:
+        """
+        (t, v1, v2, magnitude) of the curve v1 * t^2 + v2 * t the velocity follows.
+        """
+        return self._t, self._v1, self._v2, self._magnitude
 
 
     def set_t(self, new_t: float):
-        self.__t: float = new_t
+        self._t: float = new_t
 
 
     def increment_t(self):
-        self.__t += 1
+        self._t += 1
 
 
     def update_scale(self, scale_factor: float):
@@ -80,12 +87,12 @@ class Velocity(Vector):
         matrix_A = np.array([[t_vertex ** 2, t_vertex], [(2 * t_vertex) ** 2, 2 * t_vertex]])
         matrix_B = np.array([v_max, 0])
         result = np.linalg.inv(matrix_A).dot(matrix_B)
-        self.__v1 = result[0]
-        self.__v2 = result[1]
+        self._v1 = result[0]
+        self._v2 = result[1]
 
 
     def update_magnitude(self):
-        self.__magnitude = self.__v1 * self.__t ** 2 + self.__v2 * self.__t
+        self._magnitude = self._v1 * self._t ** 2 + self._v2 * self._t
 
 # ----------------------------------------------------------------------- #
 #  SUBSECTION: Private Methods
@@ -1,6 +1,8 @@
 # =========================================================================== #
 #  SECTION: Imports
 # =========================================================================== #
+import math
+
 from model.basic_math.math_basic import StraightLineEquation
 from model.basic_math.vector import Vector
 
@@ -9,6 +11,12 @@ from model.basic_math.vector import Vector
 #  SECTION: Global definitions
 # =========================================================================== #
 
+# border of the GUI, which fits about 20 satellites
+GUI_BORDER_WIDTH = 1920
+GUI_BORDER_HEIGHT = 1080
+GUI_BORDER_PADDING = 30
+GUI_SATELLITE_AMOUNT = 20
+
 # =========================================================================== #
 #  SECTION: Class definitions
 # =========================================================================== #
@@ -108,6 +116,15 @@ class Border:
 # =========================================================================== #
 #  SECTION: Function definitions
 # =========================================================================== #
+def create_gui_border(satellite_amount: int = GUI_SATELLITE_AMOUNT) -> Border:
+    """
+    A border with the aspect ratio of the GUI and enough space for the given amount of satellites,
+    so the satellites are as densely packed as in the GUI. Up to GUI_SATELLITE_AMOUNT it is the border of the GUI.
+    """
+    scale: float = math.sqrt(max(satellite_amount, GUI_SATELLITE_AMOUNT) / GUI_SATELLITE_AMOUNT)
+    return Border(x=0, y=0, width=math.ceil(GUI_BORDER_WIDTH * scale), height=math.ceil(GUI_BORDER_HEIGHT * scale),
+                  padding=GUI_BORDER_PADDING)
+
 
 # =========================================================================== #
 #  SECTION: Main Body
@@ -1,10 +1,10 @@
 # =========================================================================== #
 #  SECTION: Imports
 # =========================================================================== #
-import random
+import numpy as np
 
 from model.basic_math.math_basic import vector_to_degree
-from model.basic_math.vector import Vector, add, calculate_distance, multiply
+from model.basic_math.vector import Vector, add, calculate_distance_squared, multiply
 
 
 # =========================================================================== #
@@ -36,8 +36,8 @@ from model.basic_math.vector import Vector, add, calculate_distance, multiply
 # =========================================================================== #
 #  SECTION: Function definitions
 # =========================================================================== #
-def calculate_random_degrees():
-    return random.randint(0, 360)
+def calculate_random_degrees(rng: np.random.Generator) -> int:
+    return int(rng.integers(0, 361))
 
 def calculate_degrees_which_avoids_object_by_90_degrees(observed_object_direction: Vector,
                                                         observed_object_center: Vector,
@@ -48,16 +48,16 @@ def calculate_degrees_which_avoids_object_by_90_degrees(observed_object_directio
     else:
         avoidance_direction: Vector = satellite_direction.tangent()
 
-    initial_distance: float = calculate_distance(vector1=satellite_center,
-                                                 vector2=observed_object_center)
+    initial_distance_squared: float = calculate_distance_squared(*satellite_center.get_as_tuple(),
+                                                                 *observed_object_center.get_as_tuple())
 
     temp_new_satellite_position: Vector = add(vector1=satellite_center,
                                               vector2=avoidance_direction.unit_normal())
 
-    test_distance: float = calculate_distance(vector1=temp_new_satellite_position,
-                                              vector2=observed_object_center)
+    test_distance_squared: float = calculate_distance_squared(*temp_new_satellite_position.get_as_tuple(),
+                                                              *observed_object_center.get_as_tuple())
 
-    if test_distance >= initial_distance:
+    if test_distance_squared >= initial_distance_squared:
         return vector_to_degree(direction_vector=avoidance_direction)
     return vector_to_degree(direction_vector=multiply(vector=avoidance_direction, scalar=-1))
 
@@ -0,0 +1,145 @@
+"""
+Predicted collisions of the observed satellite pairs, kept over several frames. A pair is only predicted again
+when the trajectory of one of its satellites was perturbed, or when its prediction is due in the event queue.
+"""
+
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import heapq
+import math
+
+import numpy as np
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# frames a pair that stays apart is not predicted again, unless one of its satellites is perturbed
+PREDICTION_HORIZON = 5
+
+# second difference of the recorded centres above which a satellite does not move with a constant velocity.
+# Any rounding left in the differences makes the features of the trajectory fit tiny accelerations or jerks,
+# which take other branches in the prediction than none, so only centres without second difference are kept.
+PERTURBATION_TOLERANCE = 0
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class CollisionEventQueue:
+    """
+    The predictions of the satellite pairs, keyed by the store indices (observing satellite, observed satellite),
+    and a priority queue of the frames at which they are due.
+
+    The trajectories are fitted to the 4 newest centres with finite differences, which give the trajectory of the
+    previous frame shifted by one frame only if the satellite moves on a straight line with a constant velocity.
+    So a satellite is unperturbed while its 4 newest centres have no second difference, and the prediction of a
+    pair of unperturbed satellites is the one that would be calculated again, with the moment of crash counted
+    from the new frame. A satellite that accelerates, by a disturbance, a navigation change or a collision, is
+    perturbed. A prediction is kept until one of the two satellites is perturbed or until it is due: after the
+    horizon if the pair stays apart, at the predicted moment if it collides.
+    """
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, horizon: int = PREDICTION_HORIZON, tolerance: float = PERTURBATION_TOLERANCE):
+        self.__horizon: int = horizon
+        self.__tolerance: float = tolerance
+        # pair -> (frame of the prediction, moment of crash or nan, point of crash, frame it is due)
+        self.__predictions: dict = {}
+        # (frame the prediction is due, pair), older entries of a predicted again pair are skipped when popped
+        self.__events: list = []
+        self.__perturbation_frames: np.ndarray = np.zeros(0, dtype=int)
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    def __len__(self) -> int:
+        return len(self.__predictions)
+
+
+    def horizon(self) -> int:
+        return self.__horizon
+
+
+    def stable_prediction(self, observing_index: int, observed_index: int, frame: int) -> tuple:
+        """
+        The prediction of the pair if neither satellite was perturbed since it was made, including the frame it was
+        made in, None if the pair has to be predicted again.
+
+        Returns
+        -------
+        tuple
+            (moment of crash counted from the given frame, point of crash), the moment is nan and the point None
+            if the satellites stay apart
+        """
+        prediction: tuple = self.__predictions.get((observing_index, observed_index))
+        if prediction is None:
+            return None
+        prediction_frame, moment_of_crash, point_of_crash, _ = prediction
+        perturbation_frames: np.ndarray = self.__perturbation_frames
+        if max(perturbation_frames[observing_index], perturbation_frames[observed_index]) >= prediction_frame:
+            return None
+        return moment_of_crash - (frame - prediction_frame), point_of_crash
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def update(self, recorded_centers: np.ndarray, frame: int):
+        """
+        Drops the predictions that are due and marks the satellites whose 4 newest centres are not on a straight
+        line with equal distances as perturbed in this frame. Has to be called once per frame, before the
+        predictions of the frame are read.
+        recorded_centers: (n, 4, 2) recorded centres of all satellites, newest centre first
+        """
+        events: list = self.__events
+        while events and events[0][0] <= frame:
+            due_frame, pair = heapq.heappop(events)
+            prediction: tuple = self.__predictions.get(pair)
+            if prediction is not None and prediction[3] == due_frame:
+                del self.__predictions[pair]
+
+        length: int = len(recorded_centers)
+        tracked: int = min(length, len(self.__perturbation_frames))
+        # a satellite without predictions has no earlier frame to be perturbed in
+        perturbation_frames: np.ndarray = np.full(length, -1)
+        perturbation_frames[:tracked] = self.__perturbation_frames[:tracked]
+        second_differences: np.ndarray = (recorded_centers[:, :2] - 2 * recorded_centers[:, 1:3]
+                                          + recorded_centers[:, 2:])
+        perturbation_frames[(np.abs(second_differences) > self.__tolerance).any(axis=(1, 2))] = frame
+        self.__perturbation_frames = perturbation_frames
+
+
+    def add_prediction(self, observing_index: int, observed_index: int, frame: int, moment_of_crash: float,
+                       point_of_crash: tuple = None):
+        """
+        Keeps the prediction of a pair made in the given frame, moment_of_crash is nan if the satellites stay apart.
+        """
+        if math.isnan(moment_of_crash):
+            due_frame: int = frame + self.__horizon
+        else:
+            due_frame: int = frame + min(self.__horizon, max(1, math.ceil(moment_of_crash)))
+        pair: tuple = (observing_index, observed_index)
+        self.__predictions[pair] = (frame, moment_of_crash, point_of_crash, due_frame)
+        heapq.heappush(self.__events, (due_frame, pair))
+
+
+    def clear(self):
+        self.__predictions.clear()
+        self.__events.clear()
+
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
@@ -7,8 +7,12 @@ Handles and detects collisions between 2 circles (satellites) and border collisi
 # =========================================================================== #
 import logging
 
+import numpy as np
+
+from model.basic_math.distance_predicates import closer_than_distances, within_distance
 from model.border import Border
 from model.satellite.satellite import Satellite
+from model.satellite.satellite_store import SatelliteStore
 from model.basic_math.vector import *
 
 
@@ -16,19 +20,37 @@ from model.basic_math.vector import *
 #  SECTION: Global definitions
 # =========================================================================== #
 
+# relaxation passes of resolve_border_collisions, like the iterations of check_and_handle_border_collisions
+MAX_RELAXATION_PASSES = 20
+
+# overlap in pixels that is left after the relaxation, a larger one needs another pass
+RELAXATION_TOLERANCE = 1E-3
+
+# over-relaxation: a pair is pushed apart further than its overlap, because a satellite pushed against the border
+# or against a third satellite does not keep its share of the push. 1.6 converges about 5 times faster than 1
+# for a cluster pushed against a wall
+RELAXATION_FACTOR = 1.6
+
+# offsets of the 3x3 grid cells around a cell
+NEIGHBOUR_CELL_OFFSETS = np.array([(x, y) for x in (-1, 0, 1) for y in (-1, 0, 1)])
+
 # =========================================================================== #
 #  SECTION: Function definitions
 # =========================================================================== #
 
 
-def check_and_handle_satellite_collisions(satellite: Satellite, satellites: list):
-    for other_satellite in satellites:
+def check_and_handle_satellite_pair_collisions(satellites: list, candidate_pairs):
+    """
+    Narrow phase for the index pairs of a broad phase, or for all pairs without one. The pairs have to be sorted
+    like the pairs of a nested loop over the satellite list, so collisions are resolved in the same order
+    with and without the broad phase.
+    """
+    for index1, index2 in candidate_pairs:
+        satellite: Satellite = satellites[index1]
+        other_satellite: Satellite = satellites[index2]
         # only check for collisions with satellites that are in the observance radius
         if other_satellite in satellite.observed_satellites() and __collision_detected(satellite, other_satellite):
-            __satellite_overlap_resolution_by_shifting_both_equally(satellite, other_satellite)
-            velocity1_new, velocity2_new = __calculate_new_velocities(satellite, other_satellite)
-            __collision_resolution(satellite, velocity1_new)
-            __collision_resolution(other_satellite, velocity2_new)
+            __handle_satellite_collision(satellite, other_satellite)
 
 
 def check_and_handle_border_collisions(border: Border, satellites: list):
@@ -54,10 +76,59 @@ def check_and_handle_border_collisions(border: Border, satellites: list):
         max_iterations -= 1
 
 
+def resolve_border_collisions(border: Border, satellites: list, store: SatelliteStore,
+                              max_passes: int = MAX_RELAXATION_PASSES) -> tuple:
+    """
+    Replacement of check_and_handle_border_collisions on the arrays of the store. Clamps all satellites into the
+    border at once and clears the velocities of the clamped ones. The overlaps this creates are resolved by
+    relaxation passes: every overlapping pair with a moved satellite is pushed apart along the line between the
+    centres, each satellite by half of the over-relaxed overlap, and clamped into the border again. Only the pairs in
+    neighbouring cells of a uniform grid are compared.
+
+    Returns
+    -------
+    tuple
+        (passes, remaining overlap): the relaxation passes and the largest overlap left between a moved satellite
+        and another one, which is at most RELAXATION_TOLERANCE if the relaxation converged
+    """
+    length: int = len(satellites)
+    positions: np.ndarray = store.positions[:length]
+    sizes: np.ndarray = store.sizes[:length]
+    clamped_positions: np.ndarray = __clamp_into_border(border, positions, sizes)
+    moved: np.ndarray = (clamped_positions != positions).any(axis=1)
+    for index in np.flatnonzero(moved):
+        satellites[index].velocity_handler.clear()
+    positions[:] = clamped_positions
+
+    passes: int = 0
+    remaining_overlap: float = 0.0
+    while moved.any():
+        shifts, remaining_overlap = __relaxation_shifts(positions + sizes[:, np.newaxis] / 2, sizes / 2, moved)
+        if remaining_overlap <= RELAXATION_TOLERANCE or passes == max_passes:
+            break
+        passes += 1
+        shifted_positions: np.ndarray = __clamp_into_border(border, positions + shifts, sizes)
+        shifted: np.ndarray = (shifted_positions != positions).any(axis=1)
+        if not shifted.any():
+            # the overlapping satellites are pushed against the border
+            break
+        positions[:] = shifted_positions
+        moved |= shifted
+    store.mark_positions_changed()
+    return passes, remaining_overlap
+
+
 # =========================================================================== #
 #  SECTION: private Function definitions
 # =========================================================================== #
 
+def __handle_satellite_collision(satellite1: Satellite, satellite2: Satellite):
+    __satellite_overlap_resolution_by_shifting_both_equally(satellite1, satellite2)
+    velocity1_new, velocity2_new = __calculate_new_velocities(satellite1, satellite2)
+    __collision_resolution(satellite1, velocity1_new)
+    __collision_resolution(satellite2, velocity2_new)
+
+
 def __collision_detected(satellite1: Satellite, satellite2: Satellite) -> bool:
     if __satellites_overlap(satellite1, satellite2):
         return True
@@ -65,55 +136,54 @@ def __collision_detected(satellite1: Satellite, satellite2: Satellite) -> bool:
 
 
 def __satellites_overlap(satellite1: Satellite, satellite2: Satellite) -> bool:
-    distance = calculate_distance(satellite1.center(), satellite2.center())
     radius_sum = satellite1.radius() + satellite2.radius()
-    if distance <= radius_sum:
-        return True
-    return False
+    return within_distance(*satellite1.center_xy(), *satellite2.center_xy(), radius_sum)
 
 
 def __satellite_overlap_resolution_by_shifting_both_equally(satellite1: Satellite, satellite2: Satellite):
-    distance: float = calculate_distance(satellite1.center(), satellite2.center())
+    s1_x, s1_y = satellite1.center_xy()
+    s2_x, s2_y = satellite2.center_xy()
+    distance: float = calculate_coordinate_distance(s1_x, s1_y, s2_x, s2_y)
     radius_sum: float = satellite1.radius() + satellite2.radius()
     half_overlap: float = 0.5 * (distance - radius_sum)
 
-    s1_x: float = satellite1.center().x()
-    s2_x: float = satellite2.center().x()
     shift_x: float = (half_overlap * (s1_x - s2_x) / distance)
-
-    s1_y: float = satellite1.center().y()
-    s2_y: float = satellite2.center().y()
     shift_y: float = (half_overlap * (s1_y - s2_y) / distance)
 
-    total_shift: Vector = Vector(shift_x, shift_y)
-
-    satellite1.position.add_vector(multiply(total_shift, -1))
-    satellite2.position.add_vector(total_shift)
+    satellite1.position.add_to_x(-shift_x)
+    satellite1.position.add_to_y(-shift_y)
+    satellite2.position.add_to_x(shift_x)
+    satellite2.position.add_to_y(shift_y)
 
 
 def __calculate_new_velocities(satellite1, satellite2):
+    # the vector calculations on the coordinates, only the new velocities are vectors
     m1: float = satellite1.mass()
     m2: float = satellite2.mass()
     M: float = m1 + m2
-    p1: Vector = satellite1.center()
-    p2: Vector = satellite2.center()
-    v1: Vector = satellite1.velocity_handler.velocity()
-    v2: Vector = satellite2.velocity_handler.velocity()
+    p1_x, p1_y = satellite1.center_xy()
+    p2_x, p2_y = satellite2.center_xy()
+    v1_x, v1_y = satellite1.velocity_handler.velocity().get_as_tuple()
+    v2_x, v2_y = satellite2.velocity_handler.velocity().get_as_tuple()
 
     # Find a normal vector
-    n: Vector = subtract(p1, p2)
+    n_x: float = p1_x - p2_x
+    n_y: float = p1_y - p2_y
 
     # Find unit normal vector
-    un: Vector = multiply(n, 1 / n.magnitude())
+    inverse_magnitude: float = 1 / math.sqrt(n_x * n_x + n_y * n_y)
+    un_x: float = n_x * inverse_magnitude
+    un_y: float = n_y * inverse_magnitude
 
     # Find unit tangent vector
-    ut: Vector = un.tangent()
+    ut_x: float = -un_y
+    ut_y: float = un_x
 
     # Project velocities onto the unit normal and unit tangent vectors.
-    v1n: float = un.dot_product(v1)
-    v1t: float = ut.dot_product(v1)
-    v2n: float = un.dot_product(v2)
-    v2t: float = ut.dot_product(v2)
+    v1n: float = un_x * v1_x + un_y * v1_y
+    v1t: float = ut_x * v1_x + ut_y * v1_y
+    v2n: float = un_x * v2_x + un_y * v2_y
+    v2t: float = ut_x * v2_x + ut_y * v2_y
 
     # Find new normal velocities
     # v1` = (v1 * (m1 - m2) + 2 * m2 * v2) / (m1 + m2)
@@ -121,21 +191,17 @@ def __calculate_new_velocities(satellite1, satellite2):
     # v2` = (v2 * (m2 - m1) + 2 * m1 * v1) / (m1 + m2)
     v2n_tag: float = (v2n * (m2 - m1) + 2 * m1 * v1n) / M
 
-    # Convert the scalar normal and scalar tangential velocities into vectors
-    v1n_tag_vec: Vector = multiply(un, v1n_tag)
-    v1t_tag: Vector = multiply(ut, v1t)
-    v2n_tag_vec: Vector = multiply(un, v2n_tag)
-    v2t_tag: Vector = multiply(ut, v2t)
-
-    # calculate new velocities
-    v1_new: Vector = add(v1n_tag_vec, v1t_tag)
-    v2_new: Vector = add(v2n_tag_vec, v2t_tag)
+    # calculate new velocities from the scalar normal and scalar tangential velocities
+    v1_new: Vector = Vector(un_x * v1n_tag + ut_x * v1t, un_y * v1n_tag + ut_y * v1t)
+    v2_new: Vector = Vector(un_x * v2n_tag + ut_x * v2t, un_y * v2n_tag + ut_y * v2t)
 
     # calculate momentum before and after
-    momentum_before: Vector = add(multiply(v1, m1), multiply(v2, m2))
-    mag1 = momentum_before.magnitude()
-    momentum_after: Vector = add(multiply(v1_new, m1), multiply(v2_new, m2))
-    mag2 = momentum_after.magnitude()
+    momentum_before_x: float = v1_x * m1 + v2_x * m2
+    momentum_before_y: float = v1_y * m1 + v2_y * m2
+    mag1 = math.sqrt(momentum_before_x * momentum_before_x + momentum_before_y * momentum_before_y)
+    momentum_after_x: float = v1_new.x() * m1 + v2_new.x() * m2
+    momentum_after_y: float = v1_new.y() * m1 + v2_new.y() * m2
+    mag2 = math.sqrt(momentum_after_x * momentum_after_x + momentum_after_y * momentum_after_y)
 
     if not math.isclose(mag1, mag2):
         logging.error("impulses not the same")
@@ -152,8 +218,9 @@ def __collision_resolution(satellite: Satellite, velocity_new: Vector):
 def __set_collision_velocity(satellite, velocity_new):
     # subtract the disturbance velocity from the new velocity
     # because the disturbance velocity might increase or decrease next frame.
-    collision_velocity: Vector = subtract(velocity_new, satellite.velocity_handler.disturbance_velocity())
-    satellite.velocity_handler.collision_velocity().set_vector(collision_velocity)
+    disturbance_velocity: Vector = satellite.velocity_handler.disturbance_velocity()
+    satellite.velocity_handler.collision_velocity().set_xy(velocity_new.x() - disturbance_velocity.x(),
+                                                           velocity_new.y() - disturbance_velocity.y())
 
 
 def __add_deceleration(satellite):
@@ -230,6 +297,65 @@ def __shift_y(sat1: Satellite, sat2: Satellite, y_shift: float):
         sat2.position.add_to_y(y_shift)
 
 
+def __clamp_into_border(border: Border, positions: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    # like __calculate_new_xy_for_satellite, the left and top border win if a satellite is larger than the border
+    upper_bounds: np.ndarray = np.array([border.right(), border.bottom()]) - sizes[:, np.newaxis]
+    return np.maximum(np.minimum(positions, upper_bounds), np.array([border.left(), border.top()]))
+
+
+def __relaxation_shifts(centers: np.ndarray, radii: np.ndarray, moved: np.ndarray) -> tuple:
+    """
+    Shifts (n, 2) that push every overlapping pair with a moved satellite apart, and the largest overlap.
+    """
+    first, second = __neighbour_pairs(centers, 2 * radii.max(), np.flatnonzero(moved))
+    # a pair of two moved satellites is found from both sides
+    unique: np.ndarray = (first < second) | ~moved[second]
+    first, second = first[unique], second[unique]
+    differences: np.ndarray = centers[second] - centers[first]
+    radius_sums: np.ndarray = radii[first] + radii[second]
+    # only the overlapping pairs need their distance
+    overlapping: np.ndarray = closer_than_distances(differences, radius_sums)
+    first, second = first[overlapping], second[overlapping]
+    differences = differences[overlapping]
+    distances: np.ndarray = np.hypot(differences[:, 0], differences[:, 1])
+    overlaps: np.ndarray = radius_sums[overlapping] - distances
+
+    # satellites on the same centre are pushed apart horizontally
+    directions: np.ndarray = np.zeros_like(differences)
+    directions[:, 0] = 1
+    apart: np.ndarray = distances > 0
+    directions[apart] = differences[apart] / distances[apart, np.newaxis]
+    half_shifts: np.ndarray = directions * (overlaps * RELAXATION_FACTOR / 2)[:, np.newaxis]
+    shifts: np.ndarray = np.zeros_like(centers)
+    np.add.at(shifts, first, -half_shifts)
+    np.add.at(shifts, second, half_shifts)
+    return shifts, float(overlaps.max()) if len(overlaps) else 0.0
+
+
+def __neighbour_pairs(centers: np.ndarray, cell_size: float, indices: np.ndarray) -> tuple:
+    """
+    All index pairs (index, other index) of the given satellites and the other satellites in the 3x3 cells
+    around them, on a uniform grid with the given cell size.
+    """
+    cells: np.ndarray = np.floor(centers / max(cell_size, 1.0)).astype(np.int64)
+    # one key per cell, the offset keeps the neighbouring cells of the border cells apart
+    cell_rows: int = int(cells[:, 1].max() - cells[:, 1].min()) + 3
+    keys: np.ndarray = (cells[:, 0] - cells[:, 0].min() + 1) * cell_rows + cells[:, 1] - cells[:, 1].min() + 1
+    order: np.ndarray = np.argsort(keys, kind="stable")
+    sorted_keys: np.ndarray = keys[order]
+
+    neighbour_keys: np.ndarray = (keys[indices, np.newaxis] + NEIGHBOUR_CELL_OFFSETS[:, 0] * cell_rows
+                                  + NEIGHBOUR_CELL_OFFSETS[:, 1]).ravel()
+    starts: np.ndarray = np.searchsorted(sorted_keys, neighbour_keys, side="left")
+    counts: np.ndarray = np.searchsorted(sorted_keys, neighbour_keys, side="right") - starts
+    first: np.ndarray = np.repeat(np.repeat(indices, len(NEIGHBOUR_CELL_OFFSETS)), counts)
+    # positions in the sorted keys: the start of every cell plus the running count inside the cell
+    offsets: np.ndarray = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    second: np.ndarray = order[np.repeat(starts, counts) + offsets]
+    different: np.ndarray = first != second
+    return first[different], second[different]
+
+
 def __no_shift_or_positions_equal(p1, p2, shift):
     return shift == 0 or p1 == p2
 
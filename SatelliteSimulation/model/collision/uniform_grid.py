@@ -0,0 +1,116 @@
+"""
+Uniform grid (spatial hash) over the satellite centres, used to find satellites that are close to each other
+without comparing every satellite with every other satellite.
+"""
+
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# relative padding of the cell size, so that rounding in the cell calculation
+# can never move two satellites in reach of each other two cells apart
+CELL_SIZE_PADDING = 1E-6
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class UniformGrid:
+    """
+    Sorts the satellites by their centre into square cells. The cell size is the largest distance at which
+    one satellite can observe another one, so every observed satellite lies in the 3x3 cells around the
+    cell of the observing satellite.
+    Satellites are referenced by their index in the list the grid was built from.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self):
+        self.__cell_size: float = 1
+        self.__cells: dict = {}
+        self.__satellite_cells: list = []
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    def cell_size(self) -> float:
+        return self.__cell_size
+
+
+    def cell_count(self) -> int:
+        return len(self.__cells)
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def rebuild(self, satellites: list):
+        self.__cells = {}
+        self.__satellite_cells = []
+        if not satellites:
+            return
+
+        max_radius: float = max(satellite.radius() for satellite in satellites)
+        max_observance_reach: float = max(satellite.radius() + satellite.observance_radius for satellite in satellites)
+        self.__cell_size = max(1.0, (max_observance_reach + max_radius) * (1 + CELL_SIZE_PADDING))
+
+        for index, satellite in enumerate(satellites):
+            cell: tuple = self.__cell_of(*satellite.center_xy())
+            self.__satellite_cells.append(cell)
+            if cell in self.__cells:
+                self.__cells[cell].append(index)
+            else:
+                self.__cells[cell] = [index]
+
+
+    def neighbour_indices(self, index: int) -> list:
+        """
+        Indices of all satellites in the 3x3 cells around the satellite with the given index, including the
+        satellite itself. The indices are sorted, so they keep the order of the satellite list.
+        """
+        cell_x, cell_y = self.__satellite_cells[index]
+        cells: dict = self.__cells
+        indices: list = []
+        for x in (cell_x - 1, cell_x, cell_x + 1):
+            for y in (cell_y - 1, cell_y, cell_y + 1):
+                if (x, y) in cells:
+                    indices.extend(cells[(x, y)])
+        indices.sort()
+        return indices
+
+
+    def candidate_pairs(self) -> list:
+        """
+        Broad phase: all index pairs (i, j) with i < j of satellites in neighbouring cells, sorted like the
+        pairs of a nested loop over the satellite list. Every pair of satellites that observe each other is
+        part of the result.
+        """
+        pairs: list = []
+        for index in range(len(self.__satellite_cells)):
+            pairs.extend((index, other_index) for other_index in self.neighbour_indices(index) if other_index > index)
+        return pairs
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    def __cell_of(self, x: float, y: float) -> tuple:
+        return int(x // self.__cell_size), int(y // self.__cell_size)
+
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
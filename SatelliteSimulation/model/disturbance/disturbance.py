@@ -5,9 +5,10 @@ Disturbances that can occur in space
 # =========================================================================== #
 #  SECTION: Imports
 # =========================================================================== #
-import random
 from abc import ABC
 
+import numpy as np
+
 from model.basic_math.vector import Vector
 from model.basic_math.velocity import Velocity
 
@@ -22,14 +23,19 @@ from model.basic_math.velocity import Velocity
 
 
 class Disturbance(ABC):
-    """Abstract Disturbance class"""
+    """
+    Abstract Disturbance class.
+    All random values are drawn from the given generator. The base class requires it,
+    the disturbances use a new unseeded generator when they are created without one.
+    The generator is only used during the construction and not kept, so copies of a disturbance stay cheap.
+    """
 
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Constructor
     # ----------------------------------------------------------------------- #
-    def __init__(self):
+    def __init__(self, rng: np.random.Generator):
         # duration in frames
-        self._duration: int = random.randrange(60, 120, 1)
+        self._duration: int = int(rng.integers(60, 120))
 
         # value vector in Pixel
         self._velocity: Velocity = Velocity(0, 0)
@@ -43,6 +49,10 @@ class Disturbance(ABC):
         return self._velocity
 
 
+    def set_velocity(self, velocity: Velocity):
+        self._velocity = velocity
+
+
     def _set_velocity_trajectory(self, v_max: float):
         self._velocity.solve_equation_and_set_v1_v2(v_max=v_max, t_vertex=self._duration / 2)
 
@@ -50,8 +60,9 @@ class Disturbance(ABC):
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Public Methods
     # ----------------------------------------------------------------------- #
-    def _random_value(self) -> float:
-        return random.uniform(-1, 1) * random.randint(1, 5)
+    @staticmethod
+    def _random_value(rng: np.random.Generator) -> float:
+        return rng.uniform(-1, 1) * int(rng.integers(1, 6))
 
 
 # ----------------------------------------------------------------------- #
@@ -64,20 +75,22 @@ class Disturbance(ABC):
 
 
 class Malfunction(Disturbance):
-    def __init__(self):
-        super().__init__()
-        self.velocity().set_vector(Vector(x=self._random_value(), y=self._random_value()))
-        self._set_velocity_trajectory(random.randint(1, 3))
+    def __init__(self, rng: np.random.Generator = None):
+        rng = default_rng_if_none(rng)
+        super().__init__(rng)
+        self.velocity().set_vector(Vector(x=self._random_value(rng), y=self._random_value(rng)))
+        self._set_velocity_trajectory(int(rng.integers(1, 4)))
 
 
 class SolarRadiationDisturbance(Disturbance):
-    def __init__(self, max_surface: float):
-        super().__init__()
+    def __init__(self, max_surface: float, rng: np.random.Generator = None):
+        rng = default_rng_if_none(rng)
+        super().__init__(rng)
         self.__max_surface = max_surface
-        self.__strength = random.randint(50, 100)
+        self.__strength = int(rng.integers(50, 101))
 
-        velocity_x: float = self._random_value()
-        velocity_y: float = self._random_value()
+        velocity_x: float = self._random_value(rng)
+        velocity_y: float = self._random_value(rng)
         self._velocity.set_xy(velocity_x, velocity_y)
 
 
@@ -90,11 +103,12 @@ class SolarRadiationDisturbance(Disturbance):
 
 
 class GravitationalDisturbance(Disturbance):
-    def __init__(self, max_mass: float):
-        super().__init__()
+    def __init__(self, max_mass: float, rng: np.random.Generator = None):
+        rng = default_rng_if_none(rng)
+        super().__init__(rng)
         self._max_mass = max_mass
-        self._strength = random.randint(2, 4)
-        self._velocity.set_y(self._random_value())
+        self._strength = int(rng.integers(2, 5))
+        self._velocity.set_y(self._random_value(rng))
 
 
     def update_trajectory(self, mass: float):
@@ -110,9 +124,10 @@ class GravitationalDisturbance(Disturbance):
 
 
 class MagneticDisturbance(GravitationalDisturbance):
-    def __init__(self, max_mass: float):
-        super().__init__(max_mass)
-        self._velocity.set_x(self._random_value())
+    def __init__(self, max_mass: float, rng: np.random.Generator = None):
+        rng = default_rng_if_none(rng)
+        super().__init__(max_mass, rng)
+        self._velocity.set_x(self._random_value(rng))
 
 
     def update_trajectory(self, mass: float):
@@ -129,6 +144,9 @@ class MagneticDisturbance(GravitationalDisturbance):
 # =========================================================================== #
 #  SECTION: Function definitions
 # =========================================================================== #
+def default_rng_if_none(rng: np.random.Generator) -> np.random.Generator:
+    return rng if rng is not None else np.random.default_rng()
+
 
 # =========================================================================== #
 #  SECTION: Main Body
@@ -1,18 +1,26 @@
 # =========================================================================== #
 #  SECTION: Imports
 # =========================================================================== #
+import contextlib
 import copy
+import itertools
 import os
 from types import new_class
 import pandas as pd
 
 from model.arrow import Arrow
-from model.border import Border
-from model.collision.collision_handler import check_and_handle_satellite_collisions, \
-    check_and_handle_border_collisions
+from model.basic_math.distance_predicates import within_distance
+from model.basic_math.motion import TrajectoryBatch, predict_collisions
+from model.border import Border, GUI_BORDER_HEIGHT
+from model.collision.collision_event_queue import CollisionEventQueue
+from model.collision.collision_handler import check_and_handle_satellite_pair_collisions, \
+    check_and_handle_border_collisions, resolve_border_collisions
+from model.collision.uniform_grid import UniformGrid
 from model.disturbance.disturbance import *
 from model.disturbance.disturbance_type import DisturbanceType
 from model.satellite.satellite import *
+from model.satellite.poisson_disk_placer import PoissonDiskPlacer
+from model.satellite.satellite_store import SatelliteStore, DEFAULT_OBSERVANCE_RADIUS, PREVIOUS_CENTER_AMOUNT
 from model.arrow import ArrowType
 
 # =========================================================================== #
@@ -20,7 +28,24 @@ from model.arrow import ArrowType
 # =========================================================================== #
 
 ABSOLUTE_PATH = os.path.abspath(os.path.dirname(__file__))
-SATELLITE_TYPE_AMOUNT = 5
+# satellite classes and their size relative to the satellite size of the space
+SATELLITE_TYPES = [(SatelliteA, 1), (SatelliteB, 0.8), (SatelliteC, 1.2), (SatelliteD, 0.6), (SpaceJunk, 0.2)]
+SATELLITE_TYPE_AMOUNT = len(SATELLITE_TYPES)
+# placements of all satellites tried before the space gives up
+PLACEMENT_TRIES = 5
+# types drawn for one satellite, a crowded border may still fit a smaller type
+PLACEMENT_TYPE_DRAWS = 20
+# the satellites scale with the border, so many of them fit into its height
+SATELLITES_PER_BORDER_HEIGHT = 14
+# size of the satellites in the border of the GUI
+GUI_SATELLITE_SIZE = GUI_BORDER_HEIGHT // SATELLITES_PER_BORDER_HEIGHT
+
+# the delta time of the Space counts frames of this rate
+EXPECTED_FRAME_RATE = 60
+# duration of one physics step of Space.advance, in frames of the expected frame rate like the delta time
+FIXED_STEP_DURATION = 1
+# steps Space.advance runs at most to catch up with slow frames, the remaining time is dropped
+MAX_CATCH_UP_STEPS = 4
 
 
 # =========================================================================== #
@@ -38,11 +63,31 @@ class Space:
     #  SUBSECTION: Constructor
     # ----------------------------------------------------------------------- #
 
-    def __init__(self, satellite_amount: int, border: Border, config_data: pd.DataFrame = None):
+    def __init__(self, satellite_amount: int, border: Border, config_data: pd.DataFrame = None,
+                 use_spatial_index: bool = True, use_vectorised_step: bool = True, satellite_size: float = None,
+                 rng: np.random.Generator = None, use_collision_events: bool = False,
+                 use_border_relaxation: bool = True):
+        # every random draw of the model goes through this generator, so a seeded generator makes runs reproducible
+        self.__rng: np.random.Generator = rng if rng is not None else np.random.default_rng()
         self.__config_data: pd.DataFrame = config_data
         self.__border: Border = border
+        # the satellites scale with the border, unless a fixed size is given
+        self.__satellite_size: float = satellite_size if satellite_size is not None \
+            else border.height() // SATELLITES_PER_BORDER_HEIGHT
+        self.__use_spatial_index: bool = use_spatial_index
+        self.__use_vectorised_step: bool = use_vectorised_step
+        self.__use_collision_events: bool = use_collision_events
+        self.__collision_events: CollisionEventQueue = CollisionEventQueue()
+        self.__use_border_relaxation: bool = use_border_relaxation
+        self.__grid: UniformGrid = UniformGrid()
+        self.__grid_matches_observance: bool = False
         self.__satellites: list = self.__create_satellites(satellite_amount)
+        self.__store: SatelliteStore = SatelliteStore(capacity=len(self.__satellites))
+        self.__store.adopt(self.__satellites)
         self.__delta_time = 1
+        self.__fixed_step_duration: float = FIXED_STEP_DURATION
+        self.__accumulated_time: float = 0
+        self.__positions_before_step: np.ndarray = None
         self.update_satellite_observance()
 
 
@@ -58,6 +103,14 @@ class Space:
         return self.__border
 
 
+    def get_store(self) -> SatelliteStore:
+        return self.__store
+
+
+    def get_rng(self) -> np.random.Generator:
+        return self.__rng
+
+
     def delta_time(self) -> float:
         return self.__delta_time
 
@@ -66,83 +119,231 @@ class Space:
         self.__delta_time = delta_time
 
 
+    def fixed_step_duration(self) -> float:
+        return self.__fixed_step_duration
+
+
+    def set_fixed_step_duration(self, fixed_step_duration: float):
+        """
+        Shorter steps make the physics run at a higher rate than the frames are drawn.
+        The velocities are per step, so the simulation runs faster as well.
+        """
+        self.__fixed_step_duration = fixed_step_duration
+
+
+    def interpolation_factor(self) -> float:
+        """
+        Share of the next fixed step that has already elapsed, between 0 and 1.
+        """
+        return self.__accumulated_time / self.__fixed_step_duration
+
+
+    def is_spatial_index_enabled(self) -> bool:
+        return self.__use_spatial_index
+
+
+    def set_spatial_index_enabled(self, enabled: bool):
+        """
+        The brute force observance search stays available to cross-check the results of the spatial index.
+        """
+        self.__use_spatial_index = enabled
+
+
+    def is_vectorised_step_enabled(self) -> bool:
+        return self.__use_vectorised_step
+
+
+    def set_vectorised_step_enabled(self, enabled: bool):
+        """
+        Moving every satellite on its own stays available to cross-check the results of the vectorised step.
+        """
+        self.__use_vectorised_step = enabled
+
+
+    def is_collision_event_queue_enabled(self) -> bool:
+        return self.__use_collision_events
+
+
+    def set_collision_event_queue_enabled(self, enabled: bool):
+        """
+        The event queue only keeps the predictions of satellites that move with a constant velocity, so it gives the
+        results of predicting every observed pair in every frame, but in the benchmark space it keeps too few of them
+        to save more than it costs, it is disabled by default.
+        The queue does not track the satellites while it is disabled, so its predictions are dropped.
+        """
+        self.__use_collision_events = enabled
+        self.__collision_events.clear()
+
+
+    def is_border_relaxation_enabled(self) -> bool:
+        return self.__use_border_relaxation
+
+
+    def set_border_relaxation_enabled(self, enabled: bool):
+        """
+        The iterative shifts of the border collisions stay available to compare them with the relaxation.
+        """
+        self.__use_border_relaxation = enabled
+
+
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Public Methods
     # ----------------------------------------------------------------------- #
 
+    def add_satellites(self, satellites: list):
+        """
+        Adds satellites that are already placed, without checking their positions.
+        """
+        self.__satellites.extend(satellites)
+        self.__store.adopt(satellites)
+        self.update_satellite_observance()
+
+
     def create_disturbance(self, disturbance_type: DisturbanceType):
         if disturbance_type == DisturbanceType.MALFUNCTION:
             not_crashed_satellites = [satellite for satellite in self.__satellites if not satellite.is_crashed()]
             if not_crashed_satellites:
-                satellite = random.choice(not_crashed_satellites)
-                satellite.append_disturbance(Malfunction())
+                satellite = not_crashed_satellites[self.__rng.integers(len(not_crashed_satellites))]
+                satellite.append_disturbance(Malfunction(self.__rng))
         elif disturbance_type == DisturbanceType.SOLAR_RADIATION:
             max_surface: float = (self.__border.height() // 10 * 1.2) ** 2
-            disturbance = SolarRadiationDisturbance(max_surface)
+            disturbance = SolarRadiationDisturbance(max_surface, self.__rng)
             for satellite in self.__satellites:
                 append_disturbance_to_satellite(disturbance, satellite, satellite.surface())
         elif disturbance_type == DisturbanceType.GRAVITATIONAL:
-            disturbance = GravitationalDisturbance(max_mass=120)
+            disturbance = GravitationalDisturbance(max_mass=120, rng=self.__rng)
             for satellite in self.__satellites:
                 append_disturbance_to_satellite(disturbance, satellite, satellite.mass())
         elif disturbance_type == DisturbanceType.MAGNETIC:
-            disturbance = MagneticDisturbance(max_mass=120)
+            disturbance = MagneticDisturbance(max_mass=120, rng=self.__rng)
             for satellite in self.__satellites:
                 append_disturbance_to_satellite(disturbance, satellite, satellite.mass())
 
 
-    def move_satellites(self):
-        for satellite in self.__satellites:
-            satellite.move()
-
+    def next_frame(self, profiler=None):
+        """
+        Calculates the next frame of the simulation.
+        Every step is timed with the phase context manager of the optional profiler.
+        """
+        phase = profiler.phase if profiler is not None else untimed_phase
+        with phase("avoidance"):
+            self.avoid_possible_future_collisions()
+        with phase("move"):
+            self.move_satellites()
+        with phase("observance"):
+            self.update_satellite_observance()
+        with phase("collisions"):
+            self.check_and_handle_collisions()
+
+
+    def advance(self, profiler=None) -> int:
+        """
+        Adds the delta time to the accumulated time and calculates a frame for every fixed step that fits into it,
+        so that slow frames do not slow down the simulation. At most MAX_CATCH_UP_STEPS steps are calculated,
+        the time that could not be caught up is dropped.
+        Returns the amount of calculated steps.
+        """
+        self.__accumulated_time += self.__delta_time
+        steps: int = 0
+        while self.__accumulated_time >= self.__fixed_step_duration and steps < MAX_CATCH_UP_STEPS:
+            self.__positions_before_step = self.__store.positions[:len(self.__satellites)].copy()
+            self.next_frame(profiler)
+            self.__accumulated_time -= self.__fixed_step_duration
+            steps += 1
+        if self.__accumulated_time >= self.__fixed_step_duration:
+            self.__accumulated_time %= self.__fixed_step_duration
+        return steps
+
+
+    def previous_positions(self) -> np.ndarray:
+        """
+        Satellite positions (n, 2) before the last step of advance, the current positions if there was none.
+        """
+        positions: np.ndarray = self.__store.positions[:len(self.__satellites)]
+        if self.__positions_before_step is None or len(self.__positions_before_step) != len(positions):
+            return positions.copy()
+        return self.__positions_before_step
+
+
+    def interpolated_position_offsets(self) -> np.ndarray:
+        """
+        Offsets (n, 2) from the current satellite positions to the positions interpolated between the last two steps
+        with the interpolation factor, e.g. to draw the satellites in between two fixed steps.
+        """
+        positions: np.ndarray = self.__store.positions[:len(self.__satellites)]
+        return (self.previous_positions() - positions) * (1 - self.interpolation_factor())
 
-    def get_velocity_arrows(self) -> list:
-        arrows = list(map(satellite_to_total_velocity_arrow, [satellite for satellite in self.__satellites if
-                                                              satellite.velocity_handler.velocity().magnitude() != 0]))
 
-        arrows += list(map(satellite_to_navigation_velocity_arrow, [satellite for satellite in self.__satellites if
-                                                                    satellite.velocity_handler.navigation_velocity().magnitude() != 0]))
+    def move_satellites(self):
+        if self.__use_vectorised_step:
+            for index in self.__store.step():
+                self.__satellites[index].remove_finished_disturbances()
+        else:
+            for satellite in self.__satellites:
+                satellite.move()
 
-        arrows += list(map(satellite_to_disturbance_velocity_arrow, [satellite for satellite in self.__satellites if
-                                                                     satellite.velocity_handler.disturbance_velocity().magnitude() != 0]))
 
-        return arrows
+    def get_velocity_arrows(self) -> list:
+        return self.get_velocity_arrows_with_owners()[0]
+
+
+    def get_velocity_arrows_with_owners(self) -> tuple:
+        """
+        The velocity arrows and the index of the satellite every arrow belongs to.
+        """
+        arrow_kinds: tuple = ((satellite_to_total_velocity_arrow, lambda handler: handler.velocity()),
+                              (satellite_to_navigation_velocity_arrow, lambda handler: handler.navigation_velocity()),
+                              (satellite_to_disturbance_velocity_arrow, lambda handler: handler.disturbance_velocity()))
+        arrows: list = []
+        owners: list = []
+        for to_arrow, velocity_of in arrow_kinds:
+            for index, satellite in enumerate(self.__satellites):
+                if velocity_of(satellite.velocity_handler).magnitude() != 0:
+                    arrows.append(to_arrow(satellite))
+                    owners.append(index)
+        return arrows, owners
 
 
     def check_and_handle_collisions(self):
-        for index, satellite in enumerate(self.__satellites):
-            # [index + 1] prevents checking previously compared satellites
-            check_and_handle_satellite_collisions(satellite, self.__satellites[index + 1:])
-
-        check_and_handle_border_collisions(self.__border, self.__satellites)
+        if self.__use_spatial_index and self.__grid_matches_observance:
+            # the grid was built from the same positions as the observed satellites,
+            # so it contains every pair that can collide
+            candidate_pairs = self.__grid.candidate_pairs()
+        else:
+            # (i, j) with i < j prevents checking previously compared satellites
+            candidate_pairs = itertools.combinations(range(len(self.__satellites)), 2)
+        check_and_handle_satellite_pair_collisions(self.__satellites, candidate_pairs)
+
+        if not self.__store.inside_border(self.__border).all():
+            if self.__use_border_relaxation:
+                resolve_border_collisions(self.__border, self.__satellites, self.__store)
+            else:
+                check_and_handle_border_collisions(self.__border, self.__satellites)
 
 
     def update_satellite_observance(self):
-        for satellite in self.__satellites:
-            observed_satellites = self.__get_observed_satellites(satellite)
-            previous_observed_satellites = satellite.observed_satellites()
-            # clean old observance
-            observance_dict = {
-                k: previous_observed_satellites[k] for k in observed_satellites if k in previous_observed_satellites}
-            # update and adding new
-            for observed_satellite in observed_satellites:
-                if observed_satellite in observance_dict:
-                    observance_dict[observed_satellite].insert(0, observed_satellite.center().get_as_tuple())
-                    limit = min(len(observance_dict[observed_satellite]), 4)
-                    observance_dict[observed_satellite] = observance_dict[observed_satellite][:limit]
-                else:
-                    observance_dict[observed_satellite] = [
-                        observed_satellite.center().get_as_tuple()]
-            satellite.update_observed_satellites(observance_dict)
+        if self.__use_spatial_index:
+            self.__grid.rebuild(self.__satellites)
+        self.__grid_matches_observance = self.__use_spatial_index
+        # the centres were recorded when the satellites moved, a new frame makes them part of the observed history
+        self.__store.observance_frame += 1
 
+        for index, satellite in enumerate(self.__satellites):
+            if self.__use_spatial_index:
+                observed_satellites = self.__get_observed_satellites_from_grid(index)
+            else:
+                observed_satellites = self.__get_observed_satellites(satellite)
+            satellite.update_observance(observed_satellites)
 
-    def avoid_possible_future_collisions(self):
-        for satellite in self.__satellites:
-            if not satellite.is_crashed():
-                satellite.update_possible_collisions()
 
-                if satellite.possible_collisions():
-                    satellite.avoid_possible_collisions()
+    def avoid_possible_future_collisions(self):
+        # the possible collisions of a satellite do not depend on the avoidance of the others,
+        # so all of them can be predicted before the first satellite avoids
+        not_crashed_satellites: list = [satellite for satellite in self.__satellites if not satellite.is_crashed()]
+        self.__update_possible_collisions(not_crashed_satellites)
+        for satellite in not_crashed_satellites:
+            if satellite.possible_collisions():
+                satellite.avoid_possible_collisions()
 
 
     def manually_steer_satellite(self, pressed_left: bool, pressed_up: bool, pressed_right: bool, pressed_down: bool):
@@ -154,51 +355,141 @@ class Space:
     #  SUBSECTION: Private Methods
     # ----------------------------------------------------------------------- #
 
+    def __update_possible_collisions(self, satellites: list):
+        """
+        Satellite.update_possible_collisions for all given satellites, with one batched prediction for all
+        observed satellite pairs instead of one root search per pair.
+        """
+        possible_collisions: dict = {satellite: {} for satellite in satellites}
+        if self.__use_collision_events:
+            candidates: dict = self.__collision_candidates_from_event_queue(satellites, possible_collisions)
+        else:
+            candidates: dict = {satellite: satellite.collision_candidates() for satellite in satellites}
+        observing_satellites, observed_satellites, observed_positions, satellite_positions = [], [], [], []
+        # a satellite observed by several satellites, or observing several ones, has the same trajectory in
+        # all of its pairs, the batches fit it once per key
+        observed_keys, satellite_keys = [], []
+        for satellite in satellites:
+            for observed_satellite, observed_points, satellite_points in candidates[satellite]:
+                observing_satellites.append(satellite)
+                observed_satellites.append(observed_satellite)
+                observed_positions.append(observed_points)
+                satellite_positions.append(satellite_points)
+                observed_keys.append((observed_satellite.satellite_id, len(observed_points)))
+                satellite_keys.append(satellite.satellite_id)
+
+        if observing_satellites:
+            satellite_trajectories: TrajectoryBatch = TrajectoryBatch(satellite_positions, satellite_keys)
+            moments, points_of_crash = predict_collisions(
+                np.array([satellite.radius() for satellite in observing_satellites]),
+                np.array([satellite.radius() for satellite in observed_satellites]),
+                TrajectoryBatch(observed_positions, observed_keys), satellite_trajectories)
+            for index in np.flatnonzero(~np.isnan(moments)):
+                possible_collisions[observing_satellites[index]][observed_satellites[index]] = FutureCollisionData(
+                    tuple(points_of_crash[index]), moments[index], satellite_trajectories.trajectory(index))
+            if self.__use_collision_events:
+                self.__add_predictions(observing_satellites, observed_satellites, observed_positions, moments,
+                                       points_of_crash)
+
+        for satellite in satellites:
+            satellite.set_possible_collisions(possible_collisions[satellite])
+
+
+    def __collision_candidates_from_event_queue(self, satellites: list, possible_collisions: dict) -> dict:
+        """
+        The collision candidates of the observed pairs without a stable prediction in the event queue.
+        The stable predicted collisions are added to the possible collisions, with the trajectory of this frame.
+        A pair whose observed centres were recorded for less than 4 frames, e.g. since the observance started again,
+        is fitted to fewer centres than its prediction, it is predicted again.
+        """
+        store: SatelliteStore = self.__store
+        frame: int = store.observance_frame
+        collision_events: CollisionEventQueue = self.__collision_events
+        collision_events.update(store.previous_centers[:len(self.__satellites)], frame)
+        candidates: dict = {}
+        for satellite in satellites:
+            index: int = satellite.store_index()
+            unpredicted_satellites: list = []
+            for observed_satellite, observance_start in satellite.observed_satellites().items():
+                if frame - observance_start + 1 < PREVIOUS_CENTER_AMOUNT:
+                    unpredicted_satellites.append(observed_satellite)
+                    continue
+                prediction: tuple = collision_events.stable_prediction(index, observed_satellite.store_index(), frame)
+                if prediction is None:
+                    unpredicted_satellites.append(observed_satellite)
+                elif prediction[1] is not None:
+                    moment_of_crash, point_of_crash = prediction
+                    possible_collisions[satellite][observed_satellite] = FutureCollisionData(
+                        point_of_crash, moment_of_crash,
+                        store.trajectory_cache.get_trajectory(satellite.satellite_id, frame,
+                                                              satellite.previous_positions()))
+            candidates[satellite] = satellite.collision_candidates(unpredicted_satellites)
+        return candidates
+
+
+    def __add_predictions(self, observing_satellites: list, observed_satellites: list, observed_positions: list,
+                          moments: np.ndarray, points_of_crash: np.ndarray):
+        # a pair with a shorter observed history is fitted to more points in the next frame, it is predicted again
+        frame: int = self.__store.observance_frame
+        for index, observed_points in enumerate(observed_positions):
+            if len(observed_points) == PREVIOUS_CENTER_AMOUNT:
+                moment_of_crash: float = float(moments[index])
+                self.__collision_events.add_prediction(
+                    observing_satellites[index].store_index(), observed_satellites[index].store_index(), frame,
+                    moment_of_crash, None if math.isnan(moment_of_crash) else tuple(points_of_crash[index]))
+
+
     def __create_satellites(self, satelliteAmount: int) -> list:
-        satellites = list()
-        for satellite in range(satelliteAmount):
-            while True:
-                satellite = self.__create_random_satellite()
-
-                inside_border = self.__border.is_object_inside_border(satellite.center(), satellite.radius())
-                if self.__no_observance_radius_overlap(satellite, satellites) and inside_border:
-                    satellites.append(satellite)
-                    break
+        # a random placement can get stuck with free space left that is too small for another satellite,
+        # a new placement usually fits the satellites
+        most_placed: int = 0
+        for _ in range(PLACEMENT_TRIES):
+            placements: list = self.__place_satellites(satelliteAmount)
+            if len(placements) == satelliteAmount:
+                break
+            most_placed = max(most_placed, len(placements))
+        else:
+            raise ValueError(f"could not place {satelliteAmount} satellites after {PLACEMENT_TRIES} tries "
+                             f"(at most {most_placed} placed)")
+
+        satellites = [satellite_class(Vector(x, y), size) for satellite_class, size, x, y in placements]
         if self.__config_data is not None:
             _ = [self.__update_config_observance_radius(satellite) for satellite in satellites]
         return satellites
 
 
-    def __create_random_satellite(self) -> Satellite:
-        border: Border = self.__border
-        default_size: float = border.height() // 14
-        satellite_type: int = random.randint(1, SATELLITE_TYPE_AMOUNT)
-        x = random.randrange(int(border.left()), int(border.right()), 1)
-        y = random.randrange(int(border.top()), int(border.bottom()), 1)
-        position: Vector = Vector(x, y)
-
-        if satellite_type == 1:
-            return SatelliteA(position, math.ceil(default_size))
-        elif satellite_type == 2:
-            return SatelliteB(position, math.ceil(default_size * 0.8))
-        elif satellite_type == 3:
-            return SatelliteC(position, math.ceil(default_size * 1.2))
-        elif satellite_type == 4:
-            return SatelliteD(position, math.ceil(default_size * 0.6))
-        elif satellite_type == 5:
-            return SpaceJunk(position, math.ceil(default_size * 0.2))
-
-
-    def __no_observance_radius_overlap(self, new_satellite: Satellite, satellites: list) -> bool:
-        if not satellites:
-            return True
-
-        for satellite in satellites:
-            distance: float = calculate_distance(new_satellite.center(), satellite.center())
-            minimal_distance = satellite.radius() + satellite.observance_radius + new_satellite.radius() + new_satellite.observance_radius
-            if distance < minimal_distance:
-                return False
-        return True
+    def __place_satellites(self, satellite_amount: int) -> list:
+        """
+        Random types and positions (satellite class, size, x, y) of the satellites, fewer than the given amount
+        if the border is full. The placement keeps the observance areas of the satellites apart, as the
+        observance radius of the config is only set afterwards every satellite has the default one.
+        A satellite that does not fit gets a new random type, like every retry of the placement did before.
+        """
+        max_size: int = max(self.__type_size(size_factor) for _, size_factor in SATELLITE_TYPES)
+        placer = PoissonDiskPlacer(self.__border, max_size / 2 + DEFAULT_OBSERVANCE_RADIUS, self.__rng)
+        placements: list = []
+        for _ in range(satellite_amount):
+            placement: tuple = self.__place_satellite(placer)
+            if placement is None:
+                break
+            placements.append(placement)
+        return placements
+
+
+    def __place_satellite(self, placer: PoissonDiskPlacer) -> tuple:
+        for _ in range(PLACEMENT_TYPE_DRAWS):
+            satellite_class, size_factor = SATELLITE_TYPES[int(self.__rng.integers(SATELLITE_TYPE_AMOUNT))]
+            size: int = self.__type_size(size_factor)
+            try:
+                x, y = placer.place(size, size / 2 + DEFAULT_OBSERVANCE_RADIUS)
+            except ValueError:
+                continue
+            return satellite_class, size, x, y
+        return None
+
+
+    def __type_size(self, size_factor: float) -> int:
+        return math.ceil(self.__satellite_size * size_factor)
 
 
     def __update_config_observance_radius(self, satellite: Satellite) -> None:
@@ -212,10 +503,27 @@ class Space:
 
     def __get_observed_satellites(self, observing_satellite: Satellite) -> list:
         observed_satellites = []
+        observing_x, observing_y = observing_satellite.center_xy()
+        observance_reach: float = observing_satellite.radius() + observing_satellite.observance_radius
         for satellite in self.__satellites:
             if satellite is not observing_satellite:
-                distance = calculate_distance(satellite.center(), observing_satellite.center())
-                if distance - satellite.radius() <= observing_satellite.radius() + observing_satellite.observance_radius:
+                center_x, center_y = satellite.center_xy()
+                if within_distance(center_x, center_y, observing_x, observing_y, satellite.radius() + observance_reach):
+                    observed_satellites.append(satellite)
+        return observed_satellites
+
+
+    def __get_observed_satellites_from_grid(self, observing_index: int) -> list:
+        # same test as __get_observed_satellites, but only for the satellites in the neighbouring cells
+        observing_satellite: Satellite = self.__satellites[observing_index]
+        observed_satellites = []
+        observing_x, observing_y = observing_satellite.center_xy()
+        observance_reach: float = observing_satellite.radius() + observing_satellite.observance_radius
+        for index in self.__grid.neighbour_indices(observing_index):
+            if index != observing_index:
+                satellite: Satellite = self.__satellites[index]
+                center_x, center_y = satellite.center_xy()
+                if within_distance(center_x, center_y, observing_x, observing_y, satellite.radius() + observance_reach):
                     observed_satellites.append(satellite)
         return observed_satellites
 
@@ -224,6 +532,10 @@ class Space:
         # =========================================================================== #
 
 
+def untimed_phase(name: str):
+    return contextlib.nullcontext()
+
+
 def append_disturbance_to_satellite(disturbance, satellite, influence_attribute):
     disturbance_copy = copy.deepcopy(disturbance)
     disturbance_copy.update_trajectory(influence_attribute)
@@ -231,39 +543,35 @@ def append_disturbance_to_satellite(disturbance, satellite, influence_attribute)
 
 
 def satellite_to_total_velocity_arrow(satellite: Satellite) -> Arrow:
-    magnitude: float = satellite.velocity_handler.velocity().magnitude()
-    unit_normal: Vector = satellite.velocity_handler.velocity().unit_normal()
-    radius: float = satellite.radius()
-    center: Vector = satellite.center()
-
-    start_vector: Vector = Vector(center.x() + radius * unit_normal.x(), center.y() + radius * unit_normal.y())
-    unit_normal_direction_vector: Vector = add(start_vector, unit_normal)
-
-    return Arrow(start_vector, unit_normal_direction_vector, magnitude, ArrowType.TOTAL_VELOCITY)
+    return velocity_to_arrow(satellite, satellite.velocity_handler.velocity(), ArrowType.TOTAL_VELOCITY)
 
 
 def satellite_to_navigation_velocity_arrow(satellite: Satellite) -> Arrow:
-    magnitude: float = satellite.velocity_handler.navigation_velocity().magnitude()
-    unit_normal: Vector = satellite.velocity_handler.navigation_velocity().unit_normal()
-    radius: float = satellite.radius()
-    center: Vector = satellite.center()
+    return velocity_to_arrow(satellite, satellite.velocity_handler.navigation_velocity(),
+                             ArrowType.NAVIGATION_VELOCITY)
 
-    start_vector: Vector = Vector(center.x() + radius * unit_normal.x(), center.y() + radius * unit_normal.y())
-    unit_normal_direction_vector: Vector = add(start_vector, unit_normal)
 
-    return Arrow(start_vector, unit_normal_direction_vector, magnitude, ArrowType.NAVIGATION_VELOCITY)
+def satellite_to_disturbance_velocity_arrow(satellite: Satellite) -> Arrow:
+    return velocity_to_arrow(satellite, satellite.velocity_handler.disturbance_velocity(),
+                             ArrowType.DISTURBANCE_VELOCITY)
 
 
-def satellite_to_disturbance_velocity_arrow(satellite: Satellite) -> Arrow:
-    magnitude: float = satellite.velocity_handler.disturbance_velocity().magnitude()
-    unit_normal: Vector = satellite.velocity_handler.disturbance_velocity().unit_normal()
+def velocity_to_arrow(satellite: Satellite, velocity: Vector, arrow_type: ArrowType) -> Arrow:
+    """
+    Arrow of the velocity that starts at the edge of the satellite, in the direction of the velocity.
+    """
+    magnitude: float = velocity.magnitude()
+    # Vector.unit_normal on the coordinates
+    divisor: float = magnitude if magnitude != 0 else 10 ** (-100)
+    unit_normal_x: float = velocity.x() / divisor
+    unit_normal_y: float = velocity.y() / divisor
     radius: float = satellite.radius()
-    center: Vector = satellite.center()
+    center_x, center_y = satellite.center_xy()
 
-    start_vector: Vector = Vector(center.x() + radius * unit_normal.x(), center.y() + radius * unit_normal.y())
-    unit_normal_direction_vector: Vector = add(start_vector, unit_normal)
+    start_vector: Vector = Vector(center_x + radius * unit_normal_x, center_y + radius * unit_normal_y)
+    unit_normal_direction_vector: Vector = Vector(start_vector.x() + unit_normal_x, start_vector.y() + unit_normal_y)
 
-    return Arrow(start_vector, unit_normal_direction_vector, magnitude, ArrowType.DISTURBANCE_VELOCITY)
+    return Arrow(start_vector, unit_normal_direction_vector, magnitude, arrow_type)
 
 # =========================================================================== #
 #  SECTION: Main Body
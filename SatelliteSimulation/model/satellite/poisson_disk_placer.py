@@ -0,0 +1,215 @@
+"""
+Places satellites at random positions inside the border so that their observance areas do not overlap,
+in the manner of the Poisson-disk sampling of Bridson with a radius per satellite.
+"""
+
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import math
+
+import numpy as np
+
+from model.basic_math.distance_predicates import closer_than
+from model.border import Border
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# random positions tried anywhere in the border, before the placer searches around the placed satellites
+PLACEMENT_ATTEMPTS = 30
+
+# relative distance a satellite placed next to another one is kept further away,
+# so that the rounding of the angle functions never lets the two overlap
+PLACEMENT_CLEARANCE = 1E-9
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class PoissonDiskPlacer:
+    """
+    Every satellite has a reach, its radius plus its observance radius, and two satellites are placed at least
+    the sum of their reaches apart. The placed centres are sorted into square cells as large as two of the largest
+    reaches, so a new centre is only compared with the centres in the 3x3 cells around it.
+
+    A satellite is placed at the first of PLACEMENT_ATTEMPTS random positions in the border that is free, which
+    spreads the satellites evenly over the border while it is sparsely filled. When all of them are taken, the
+    placer searches around the placed satellites that are still active for this reach, like Bridson, but instead of
+    random positions in a ring it calculates the free arcs of the circle the new centre would touch: the circle is
+    split at its intersections with the circles of the neighbours and with the border, and every part is either
+    free or taken as a whole. A satellite without a free arc is inactive for this reach. If some position is free,
+    one of the circles around the free area has a free arc, so a ValueError is only raised when the border is full.
+    """
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, border: Border, max_reach: float, rng: np.random.Generator,
+                 attempts: int = PLACEMENT_ATTEMPTS):
+        self.__border: Border = border
+        self.__cell_size: float = max(1.0, 2 * max_reach)
+        self.__max_reach: float = max_reach
+        self.__rng: np.random.Generator = rng
+        self.__attempts: int = attempts
+        # cell -> [(centre x, centre y, reach)] of the placed satellites
+        self.__cells: dict = {}
+        self.__placed: list = []
+        # reach -> [(centre x, centre y, reach)] of the placed satellites that may have a free arc for this reach
+        self.__active: dict = {}
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    def __len__(self) -> int:
+        return len(self.__placed)
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def place(self, size: int, reach: float) -> tuple:
+        """
+        Finds a free position for a satellite of the given size and reach and keeps it as placed.
+
+        Returns
+        -------
+        tuple
+            (x, y) of the top left corner of the satellite
+
+        Raises
+        ------
+        ValueError
+            if the reach is larger than the one the placer was created for, or if no position is free
+        """
+        if reach > self.__max_reach:
+            raise ValueError(f"a reach of {reach} is larger than the largest reach {self.__max_reach}")
+        border: Border = self.__border
+        radius: float = size / 2
+        left, top = int(border.left()), int(border.top())
+        right, bottom = int(border.right()) - size, int(border.bottom()) - size
+        if right < left or bottom < top:
+            raise ValueError(f"a satellite of size {size} does not fit into the border")
+        # the centre has to stay in these bounds, so that the satellite is inside the border
+        bounds: tuple = (left + radius, top + radius, right + radius, bottom + radius)
+
+        # whole positions anywhere in the border, as drawn for a single satellite before
+        xs: np.ndarray = self.__rng.integers(left, right + 1, size=self.__attempts)
+        ys: np.ndarray = self.__rng.integers(top, bottom + 1, size=self.__attempts)
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            if self.__is_free(x + radius, y + radius, reach):
+                self.__add(x + radius, y + radius, reach)
+                return x, y
+
+        if reach not in self.__active:
+            self.__active[reach] = list(self.__placed)
+        active: list = self.__active[reach]
+        while active:
+            active_index: int = int(self.__rng.integers(len(active)))
+            center: tuple = self.__free_center_around(active[active_index], reach, bounds)
+            if center is not None:
+                self.__add(center[0], center[1], reach)
+                return center[0] - radius, center[1] - radius
+            # the last active satellite takes the place of the one without a free arc
+            active[active_index] = active[-1]
+            active.pop()
+        raise ValueError(f"no free position for a satellite with a reach of {reach} "
+                         f"after {len(self.__placed)} placed satellites")
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    def __cell_of(self, x: float, y: float) -> tuple:
+        return math.floor(x / self.__cell_size), math.floor(y / self.__cell_size)
+
+
+    def __neighbours(self, x: float, y: float, cell_reach: int):
+        cell_x, cell_y = self.__cell_of(x, y)
+        for offset_x in range(-cell_reach, cell_reach + 1):
+            for offset_y in range(-cell_reach, cell_reach + 1):
+                yield from self.__cells.get((cell_x + offset_x, cell_y + offset_y), ())
+
+
+    def __is_free(self, center_x: float, center_y: float, reach: float) -> bool:
+        for placed_x, placed_y, placed_reach in self.__neighbours(center_x, center_y, 1):
+            if closer_than(center_x, center_y, placed_x, placed_y, placed_reach + reach):
+                return False
+        return True
+
+
+    def __free_center_around(self, placed: tuple, reach: float, bounds: tuple) -> tuple:
+        """
+        A random centre on a free arc of the circle of centres that touch the given placed satellite,
+        None if the whole circle is taken.
+        """
+        placed_x, placed_y, placed_reach = placed
+        distance: float = (placed_reach + reach) * (1 + PLACEMENT_CLEARANCE)
+        min_x, min_y, max_x, max_y = bounds
+
+        # the angles at which the circle crosses the bounds of the centre
+        angles: list = []
+        for bound, ratio_of in ((min_x, math.acos), (max_x, math.acos), (min_y, math.asin), (max_y, math.asin)):
+            coordinate: float = placed_x if ratio_of is math.acos else placed_y
+            ratio: float = (bound - coordinate) / distance
+            if -1 < ratio < 1:
+                angle: float = ratio_of(ratio)
+                angles.extend((angle, -angle) if ratio_of is math.acos else (angle, math.pi - angle))
+        # the angles at which it crosses the circles of the centres that are too close to the neighbours
+        for neighbour_x, neighbour_y, neighbour_reach in self.__neighbours(placed_x, placed_y, 2):
+            neighbour_distance: float = math.hypot(neighbour_x - placed_x, neighbour_y - placed_y)
+            minimal_distance: float = neighbour_reach + reach
+            if abs(distance - minimal_distance) < neighbour_distance < distance + minimal_distance:
+                direction: float = math.atan2(neighbour_y - placed_y, neighbour_x - placed_x)
+                half_angle: float = math.acos((distance * distance + neighbour_distance * neighbour_distance
+                                               - minimal_distance * minimal_distance)
+                                              / (2 * distance * neighbour_distance))
+                angles.extend((direction - half_angle, direction + half_angle))
+
+        # between two neighbouring crossings the arc is free or taken as a whole, its middle tells which
+        angles = sorted(angle % (2 * math.pi) for angle in angles) or [0.0]
+        free_arcs: list = []
+        for start, end in zip(angles, angles[1:] + [angles[0] + 2 * math.pi]):
+            middle: float = (start + end) / 2
+            if self.__is_free_center(placed_x + distance * math.cos(middle), placed_y + distance * math.sin(middle),
+                                     reach, bounds):
+                free_arcs.append((start, end))
+        if not free_arcs:
+            return None
+
+        start, end = free_arcs[int(self.__rng.integers(len(free_arcs)))]
+        for angle in (start + (end - start) * self.__rng.random(), (start + end) / 2):
+            center_x: float = placed_x + distance * math.cos(angle)
+            center_y: float = placed_y + distance * math.sin(angle)
+            # a random angle very close to a crossing can be taken after the rounding, the middle is free
+            if self.__is_free_center(center_x, center_y, reach, bounds):
+                return center_x, center_y
+        return None
+
+
+    def __is_free_center(self, center_x: float, center_y: float, reach: float, bounds: tuple) -> bool:
+        min_x, min_y, max_x, max_y = bounds
+        return min_x <= center_x <= max_x and min_y <= center_y <= max_y and self.__is_free(center_x, center_y, reach)
+
+
+    def __add(self, center_x: float, center_y: float, reach: float):
+        placed: tuple = (center_x, center_y, reach)
+        self.__cells.setdefault(self.__cell_of(center_x, center_y), []).append(placed)
+        self.__placed.append(placed)
+        for active in self.__active.values():
+            active.append(placed)
+
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
@@ -9,12 +9,14 @@ import random
 from abc import ABC
 
 from model.basic_math.math_basic import *
-from model.basic_math.motion import FutureCollisionDetector, Trajectory, direction_changed
+from model.basic_math.motion import FutureCollisionDetector, Trajectory, TrajectoryCache, direction_changed
 from model.basic_math.vector import *
 from model.collision.future_collision_data import FutureCollisionData
 from model.collision.collision_avoidance_handler import \
     calculate_degrees_which_avoids_object_by_90_degrees
 from model.disturbance.disturbance import Disturbance
+from model.satellite.satellite_store import SatelliteStore, PositionView, VelocityView, NAVIGATION, DISTURBANCE, \
+    COLLISION
 from model.satellite.satellite_velocity_handler import SatelliteVelocityHandler
 
 
@@ -32,49 +34,75 @@ from model.satellite.satellite_velocity_handler import SatelliteVelocityHandler
 
 
 class Satellite(ABC):
-    """Abstract Satellite class should not be instantiated directly"""
+    """
+    Abstract Satellite class should not be instantiated directly.
+    The state of the satellite lives in a row of a SatelliteStore. Without a given store
+    the satellite gets a store of its own, until a Space adopts it into the shared store.
+    """
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Constructor
     # ----------------------------------------------------------------------- #
     satellite_id = 0
 
 
-    def __init__(self, position: Vector, mass: float, size: int, observed_satellites: dict = {}):
-        self.position: Vector = position
+    def __init__(self, position: Vector, mass: float, size: int, observed_satellites: dict = None,
+                 store: SatelliteStore = None):
+        self.__store: SatelliteStore = store if store is not None else SatelliteStore()
+        self.__index: int = self.__store.allocate()
+        # centre and radius, valid while the position version of the store does not change
+        self.__center_version: int = -1
+        self.__center: Vector = None
+        self.__center_xy: tuple = None
+        self.__radius: float = None
+        self.__position: PositionView = PositionView(self.__store, self.__index)
+        self.__position.set_vector(position)
         Satellite.satellite_id += 1
         self.satellite_id = Satellite.satellite_id
-        self.velocity_handler: SatelliteVelocityHandler = SatelliteVelocityHandler(max_navigation_velocity_magnitude=4)
-        self.__observance_radius: float = 100
-        self.__is_crashed: bool = False
-        self.__mass = mass
-        self.__size = size
-        self.__observed_satellites: dict = observed_satellites
+        self.velocity_handler: SatelliteVelocityHandler = SatelliteVelocityHandler(
+            max_navigation_velocity_magnitude=4,
+            navigation_velocity=VelocityView(self.__store, self.__index, NAVIGATION),
+            disturbance_velocity=VelocityView(self.__store, self.__index, DISTURBANCE),
+            collision_velocity=VelocityView(self.__store, self.__index, COLLISION))
+        self.observance_radius = 100
+        self.__store.crashed[self.__index] = False
+        self.__store.masses[self.__index] = mass
+        self.__store.sizes[self.__index] = size
+        self.__store.previous_centers[self.__index] = self.center_xy()
+        # observed satellite -> observance frame of the store in which this satellite started to observe it
+        self.__observed_satellites: dict = observed_satellites if observed_satellites is not None else {}
         self.__possible_collisions: dict = {}
         self.__disturbances: list = []
-        self.__previous_four_positions: list = [self.position] * 4
 
 
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Getter/Setter
     # ----------------------------------------------------------------------- #
+    @property
+    def position(self) -> Vector:
+        return self.__position
+
+    @position.setter
+    def position(self, position: Vector):
+        self.__position.set_vector(position)
+
     @property
     def observance_radius(self):
-        return self.__observance_radius
+        return self.__store.observance_radii[self.__index]
 
     @observance_radius.setter
     def observance_radius(self, new_radius: float):
-        self.__observance_radius = min(300, max(new_radius, 0))
-        
+        self.__store.observance_radii[self.__index] = min(300, max(new_radius, 0))
+
     def mass(self) -> float:
-        return self.__mass
+        return self.__store.masses[self.__index]
 
 
-    def size(self) -> int:
-        return self.__size
+    def size(self) -> float:
+        return self.__store.sizes[self.__index]
 
 
     def surface(self) -> float:
-        return (self.__size / 2) * math.pi
+        return (self.size() / 2) * math.pi
 
 
     def observed_satellites(self) -> dict:
@@ -86,25 +114,69 @@ class Satellite(ABC):
 
 
     def center(self) -> Vector:
-        return Vector(self.position.x() + self.radius(), self.position.y() + self.radius())
+        """
+        The cached centre, it is shared by all callers until the position changes and must not be changed.
+        """
+        if self.__center_version != self.__store.position_version:
+            self.__update_center()
+        return self.__center
+
+
+    def center_xy(self) -> tuple:
+        """
+        The coordinates of the cached centre as plain floats.
+        """
+        if self.__center_version != self.__store.position_version:
+            self.__update_center()
+        return self.__center_xy
 
 
     def radius(self) -> float:
-        return self.__size / 2
+        if self.__center_version != self.__store.position_version:
+            self.__update_center()
+        return self.__radius
 
 
     def is_crashed(self) -> bool:
-        return self.__is_crashed
+        return bool(self.__store.crashed[self.__index])
 
 
     def append_disturbance(self, disturbance: Disturbance):
+        self.__store.append_disturbance(self.__index, disturbance)
         self.__disturbances.append(disturbance)
 
 
+    def disturbances(self) -> list:
+        return self.__disturbances
+
+
     def get_id(self) -> int:
         return self.satellite_id
 
 
+    def store(self) -> SatelliteStore:
+        return self.__store
+
+
+    def store_index(self) -> int:
+        return self.__index
+
+
+    def bind_to_store(self, store: SatelliteStore, index: int):
+        """
+        Points the satellite and its views to another row, the state has to be copied into the row beforehand.
+        """
+        self.__store = store
+        self.__index = index
+        self.__center_version = -1
+        self.__position.bind(store, index)
+        self.velocity_handler.navigation_velocity().bind(store, index)
+        self.velocity_handler.disturbance_velocity().bind(store, index)
+        self.velocity_handler.collision_velocity().bind(store, index)
+        for disturbance in self.__disturbances:
+            store.append_disturbance(index, disturbance)
+
+
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Public Methods
     # ----------------------------------------------------------------------- #
@@ -113,8 +185,8 @@ class Satellite(ABC):
 
 
     def update_crashed_status(self):
-        if not self.__is_crashed:
-            self.__is_crashed = True
+        if not self.is_crashed():
+            self.__store.crashed[self.__index] = True
             self.velocity_handler.navigation_velocity().clear()
 
 
@@ -122,13 +194,52 @@ class Satellite(ABC):
         self.__observed_satellites = new_observed_satellites
 
 
+    def update_observance(self, observed_satellites: list):
+        """
+        Forgets the satellites that are not observed anymore and remembers the current observance frame of the store
+        for the newly observed ones. The satellites that are still observed are not touched, their recorded centres
+        are read from the store.
+        """
+        previous_observed_satellites: dict = self.__observed_satellites
+        if len(previous_observed_satellites) > len(observed_satellites) or any(
+                satellite not in previous_observed_satellites for satellite in observed_satellites):
+            still_observed: set = set(observed_satellites)
+            for satellite in [satellite for satellite in previous_observed_satellites if satellite not in still_observed]:
+                del previous_observed_satellites[satellite]
+            for satellite in observed_satellites:
+                previous_observed_satellites.setdefault(satellite, self.__store.observance_frame)
+
+
+    def recorded_centers(self, observed_satellite) -> list:
+        """
+        The centres of an observed satellite recorded since this satellite observes it, at most 4,
+        ordered from the oldest to the newest one.
+        """
+        frames: int = self.__store.observance_frame - self.__observed_satellites[observed_satellite] + 1
+        recorded_centers = self.__store.recorded_centers(observed_satellite.store_index(), frames)
+        return [tuple(center) for center in recorded_centers[::-1]]
+
+
     def move(self):
+        """
+        Moves the satellite by one frame. SatelliteStore.step does the same for all satellites of a store at once.
+        """
         self.velocity_handler.update_velocities(self.__disturbances)
-        self.__disturbances = [disturbance for disturbance in self.__disturbances if disturbance.velocity().t() > 0]
+        self.remove_finished_disturbances()
 
         self.position.add_to_x(self.velocity_handler.velocity().x())
         self.position.add_to_y(self.velocity_handler.velocity().y())
-        self.__update_previous_four_position()
+        self.__store.record_center(self.__index)
+
+
+    def remove_finished_disturbances(self):
+        disturbances: list = []
+        for disturbance in self.__disturbances:
+            if disturbance.velocity().t() > 0:
+                disturbances.append(disturbance)
+            else:
+                self.__store.release_disturbance(disturbance)
+        self.__disturbances = disturbances
 
 
     def navigate_to_in_degree(self, direction_in_degrees: int):
@@ -140,10 +251,10 @@ class Satellite(ABC):
         :param direction_in_degrees:
         :return:
         """
-        angle_in_radians = np.math.radians(direction_in_degrees)
+        angle_in_radians = math.radians(direction_in_degrees)
         max_nav_velocity = self.velocity_handler.max_navigation_velocity()
-        x = max_nav_velocity * np.math.cos(angle_in_radians)
-        y = max_nav_velocity * np.math.sin(angle_in_radians)
+        x = max_nav_velocity * math.cos(angle_in_radians)
+        y = max_nav_velocity * math.sin(angle_in_radians)
         self.velocity_handler.set_navigation_velocity(Vector(x, y))
         self.velocity_handler.navigation_velocity().solve_equation_and_set_v1_v2(self.velocity_handler.max_navigation_velocity(), 20)
 
@@ -165,25 +276,46 @@ class Satellite(ABC):
 
     def update_possible_collisions(self):
         possible_collisions: dict = {}
-        for observed_satellite in self.__observed_satellites:
-            recorded_positions: list = self.__observed_satellites[observed_satellite]
+        frame: int = self.__store.observance_frame
+        trajectory_cache: TrajectoryCache = self.__store.trajectory_cache
+        for observed_satellite, observed_positions, satellite_positions in self.collision_candidates():
+            collision: FutureCollisionData = FutureCollisionDetector(
+                self.radius(), observed_satellite.radius(),
+                trajectory_cache.get_trajectory(observed_satellite.satellite_id, frame, observed_positions),
+                trajectory_cache.get_trajectory(self.satellite_id, frame, satellite_positions)).is_collision_possible()
+            if collision:
+                possible_collisions[observed_satellite] = collision
+        self.set_possible_collisions(possible_collisions)
+
+
+    def collision_candidates(self, observed_satellites: list = None) -> list:
+        """
+        The observed satellites whose trajectories have to be checked for a possible collision.
+        observed_satellites: only these of the observed satellites are checked, all of them if None
+
+        Returns
+        -------
+        list
+            tuples (observed satellite, recorded positions of the observed satellite, previous positions of this
+            satellite), the positions are ordered from the oldest to the newest one
+        """
+        candidates: list = []
+        # the same for every observed satellite
+        satellite_positions: list = None
+        for observed_satellite in self.__observed_satellites if observed_satellites is None else observed_satellites:
+            recorded_positions: list = self.recorded_centers(observed_satellite)
             if self.__list_length_valid_and_at_least_one_sat_moving(recorded_positions, 4):
                 if direction_changed(recorded_positions):
+                    # only the two newest centres are part of the new trajectory, forget the older ones
                     recorded_positions = recorded_positions[-2:]
-                    self.__observed_satellites[observed_satellite] = recorded_positions
-                recorded_positions.reverse()
-                observed_trajectory: Trajectory = Trajectory(recorded_positions)
-                satellite_trajectory: Trajectory = Trajectory(
-                    [self.center().get_as_tuple()] * 4)
-                if self.velocity_handler.velocity().magnitude() != 0:
-                    previous_positions = [p.get_as_tuple() for p in self.__previous_four_positions]
-                    previous_positions.reverse()
-                    satellite_trajectory: Trajectory = Trajectory(previous_positions)
-                collision: FutureCollisionData = FutureCollisionDetector(
-                    self.radius(), observed_satellite.radius(),
-                    observed_trajectory, satellite_trajectory).is_collision_possible()
-                if collision:
-                    possible_collisions[observed_satellite] = collision
+                    self.__observed_satellites[observed_satellite] = self.__store.observance_frame - 1
+                if satellite_positions is None:
+                    satellite_positions = self.previous_positions()
+                candidates.append((observed_satellite, recorded_positions, satellite_positions))
+        return candidates
+
+
+    def set_possible_collisions(self, possible_collisions: dict):
         self.__possible_collisions = {k: v for k, v in
                                       sorted(possible_collisions.items(), key=lambda item: item[1].time())}
 
@@ -198,13 +330,26 @@ class Satellite(ABC):
                                                                 self.center()))
 
 
+    def previous_positions(self) -> list:
+        """
+        The positions the trajectory of this satellite is fitted to, ordered from the oldest to the newest one.
+        A satellite without velocity stays at its centre.
+        """
+        if self.velocity_handler.velocity().magnitude() == 0:
+            return [self.center_xy()] * 4
+        return [tuple(center) for center in self.__store.previous_centers[self.__index, ::-1]]
+
 
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Private Methods
     # ----------------------------------------------------------------------- #
-    def __update_previous_four_position(self):
-        self.__previous_four_positions.insert(0, self.center())
-        self.__previous_four_positions = self.__previous_four_positions[:4]
+    def __update_center(self):
+        x, y = self.__store.positions[self.__index].tolist()
+        radius: float = float(self.__store.sizes[self.__index]) / 2
+        self.__radius = radius
+        self.__center_xy = (x + radius, y + radius)
+        self.__center = Vector(x + radius, y + radius)
+        self.__center_version = self.__store.position_version
 
 
     def __list_length_valid_and_at_least_one_sat_moving(self, positions: list, min_list_length=4) -> bool:
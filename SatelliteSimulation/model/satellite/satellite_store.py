@@ -0,0 +1,552 @@
+"""
+Structure of arrays with the state of all satellites and the views that let the Satellite objects read and write
+their row of the arrays.
+"""
+
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import numpy as np
+
+from model.basic_math.motion import TrajectoryCache
+from model.basic_math.vector import Vector
+from model.basic_math.velocity import Velocity
+from model.border import Border
+from model.disturbance.disturbance import Disturbance
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# first axis of SatelliteStore.velocities and SatelliteStore.velocity_curves
+NAVIGATION = 0
+DISTURBANCE = 1
+COLLISION = 2
+VELOCITY_KINDS = 3
+
+# columns of SatelliteStore.velocity_curves, the state of the curve v1 * t^2 + v2 * t
+T = 0
+V1 = 1
+V2 = 2
+MAGNITUDE = 3
+CURVE_COLUMNS = 4
+
+DEFAULT_OBSERVANCE_RADIUS = 100
+
+# number of recorded centres in SatelliteStore.previous_centers
+PREVIOUS_CENTER_AMOUNT = 4
+
+# value of SatelliteStore.disturbance_owners for released rows
+NO_OWNER = -1
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class SatelliteStore:
+    """
+    Holds the state of satellites in contiguous float64 arrays, one row per satellite.
+    The Satellite objects only keep their row index and access their state through views,
+    so bulk operations can work on the whole arrays at once.
+    The velocities of the active disturbances live in a second table with one row per disturbance.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, capacity: int = 1):
+        capacity = max(1, capacity)
+        self.positions: np.ndarray = np.zeros((capacity, 2))
+        self.sizes: np.ndarray = np.zeros(capacity)
+        self.masses: np.ndarray = np.zeros(capacity)
+        self.observance_radii: np.ndarray = np.full(capacity, float(DEFAULT_OBSERVANCE_RADIUS))
+        self.crashed: np.ndarray = np.zeros(capacity, dtype=bool)
+        self.velocities: np.ndarray = np.zeros((VELOCITY_KINDS, capacity, 2))
+        self.velocity_curves: np.ndarray = np.zeros((VELOCITY_KINDS, capacity, CURVE_COLUMNS))
+        # newest centre first
+        self.previous_centers: np.ndarray = np.zeros((capacity, PREVIOUS_CENTER_AMOUNT, 2))
+        # number of observance updates, the observers remember in which one they started to observe a satellite
+        self.observance_frame: int = 0
+        # changes with every write of the positions, the satellites cache their centre until it changes
+        self.position_version: int = 0
+        self.trajectory_cache: TrajectoryCache = TrajectoryCache()
+        self.__length: int = 0
+
+        self.disturbance_owners: np.ndarray = np.full(capacity, NO_OWNER, dtype=np.int64)
+        self.disturbance_velocities: np.ndarray = np.zeros((capacity, 2))
+        self.disturbance_curves: np.ndarray = np.zeros((capacity, CURVE_COLUMNS))
+        self.__disturbances: list = []
+        self.__released_disturbance_amount: int = 0
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    def __len__(self) -> int:
+        return self.__length
+
+
+    def capacity(self) -> int:
+        return len(self.sizes)
+
+
+    def disturbance_amount(self) -> int:
+        return len(self.__disturbances) - self.__released_disturbance_amount
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def allocate(self) -> int:
+        """
+        Adds an empty row and returns its index. The arrays double their size when they are full.
+        """
+        if self.__length == self.capacity():
+            self.__grow(2 * self.capacity())
+        index: int = self.__length
+        self.__length += 1
+        return index
+
+
+    def adopt(self, satellites: list):
+        """
+        Copies the state of the satellites into new rows of this store and binds the satellites to them.
+        """
+        if self.__length + len(satellites) > self.capacity():
+            self.__grow(self.__length + len(satellites))
+        for satellite in satellites:
+            index: int = self.allocate()
+            self.copy_row(index, satellite.store(), satellite.store_index())
+            satellite.bind_to_store(self, index)
+
+
+    def copy_row(self, index: int, source, source_index: int):
+        self.mark_positions_changed()
+        self.positions[index] = source.positions[source_index]
+        self.sizes[index] = source.sizes[source_index]
+        self.masses[index] = source.masses[source_index]
+        self.observance_radii[index] = source.observance_radii[source_index]
+        self.crashed[index] = source.crashed[source_index]
+        self.velocities[:, index] = source.velocities[:, source_index]
+        self.velocity_curves[:, index] = source.velocity_curves[:, source_index]
+        self.previous_centers[index] = source.previous_centers[source_index]
+
+
+    def append_disturbance(self, index: int, disturbance: Disturbance):
+        """
+        Copies the velocity of the disturbance into a new row of the disturbance table and replaces it
+        with a view on that row. Rows are used in the order the disturbances are appended.
+        """
+        row: int = len(self.__disturbances)
+        if row == len(self.disturbance_owners):
+            if self.__released_disturbance_amount >= row // 2:
+                self.__compact_disturbances()
+                row = len(self.__disturbances)
+            if row == len(self.disturbance_owners):
+                self.__grow_disturbances(2 * row)
+
+        velocity: Velocity = disturbance.velocity()
+        self.disturbance_owners[row] = index
+        self.disturbance_velocities[row] = (velocity.x(), velocity.y())
+        self.disturbance_curves[row] = velocity.curve_state()
+        self.__disturbances.append(disturbance)
+        disturbance.set_velocity(DisturbanceVelocityView(self, row))
+
+
+    def release_disturbance(self, disturbance: Disturbance):
+        row: int = disturbance.velocity().row()
+        self.disturbance_owners[row] = NO_OWNER
+        self.__disturbances[row] = None
+        self.__released_disturbance_amount += 1
+
+
+    def mark_positions_changed(self):
+        """
+        Has to be called after the positions or sizes were written without a PositionView,
+        so that the satellites calculate their centre again.
+        """
+        self.position_version += 1
+
+
+    def record_center(self, index: int):
+        centers = self.previous_centers[index]
+        centers[1:] = centers[:-1]
+        radius: float = self.sizes[index] / 2
+        centers[0] = (self.positions[index, 0] + radius, self.positions[index, 1] + radius)
+
+
+    def recorded_centers(self, index: int, amount: int) -> np.ndarray:
+        """
+        The newest amount (at most PREVIOUS_CENTER_AMOUNT) recorded centres of a satellite, newest centre first.
+        Every observer of the satellite reads its history from this view instead of keeping a copy.
+        """
+        return self.previous_centers[index, :min(amount, PREVIOUS_CENTER_AMOUNT)]
+
+
+    def step(self) -> np.ndarray:
+        """
+        Moves all satellites by one frame in one pass over the arrays. Gives the same result as calling
+        Satellite.move for every satellite: the disturbance, navigation and collision velocities follow their
+        curves, the positions move by the total velocity and the new centres are recorded.
+        The finished disturbances are not released, call Satellite.remove_finished_disturbances for the
+        returned satellite indices.
+        """
+        length: int = self.__length
+        finished_owners = np.empty(0, dtype=np.int64)
+
+        disturbance_velocities = np.zeros((length, 2))
+        rows = np.flatnonzero(self.disturbance_owners[:len(self.__disturbances)] != NO_OWNER)
+        if rows.size:
+            owners = self.disturbance_owners[rows]
+            velocities = self.disturbance_velocities[rows]
+            curves = self.disturbance_curves[rows]
+            update_velocity_curves(velocities, curves)
+            self.disturbance_velocities[rows] = velocities
+            self.disturbance_curves[rows] = curves
+            # adds the disturbances of each satellite one after the other in the order they were appended
+            np.add.at(disturbance_velocities, owners, velocities)
+            finished_owners = np.unique(owners[~(curves[:, T] > 0)])
+        self.velocities[DISTURBANCE, :length] = disturbance_velocities
+
+        update_velocity_curves(self.velocities[NAVIGATION, :length], self.velocity_curves[NAVIGATION, :length])
+        update_velocity_curves(self.velocities[COLLISION, :length], self.velocity_curves[COLLISION, :length])
+
+        self.positions[:length] += self.total_velocities()
+        self.mark_positions_changed()
+
+        self.previous_centers[:length, 1:] = self.previous_centers[:length, :-1]
+        self.previous_centers[:length, 0] = self.centers()
+        return finished_owners
+
+
+    def radii(self) -> np.ndarray:
+        return self.sizes[:self.__length] / 2
+
+
+    def centers(self) -> np.ndarray:
+        return self.positions[:self.__length] + self.radii()[:, np.newaxis]
+
+
+    def total_velocities(self) -> np.ndarray:
+        """
+        Sum of the navigation, disturbance and collision velocity, added in the same order as
+        SatelliteVelocityHandler.velocity.
+        """
+        velocities = self.velocities[:, :self.__length]
+        return velocities[NAVIGATION] + (velocities[DISTURBANCE] + velocities[COLLISION])
+
+
+    def inside_border(self, border: Border) -> np.ndarray:
+        """
+        Border.is_object_inside_border for all satellites.
+        """
+        radii = self.radii()
+        centers = self.positions[:self.__length] + radii[:, np.newaxis]
+        return (centers[:, 0] + radii <= border.right()) & \
+               (centers[:, 0] - radii >= border.left()) & \
+               (centers[:, 1] + radii <= border.bottom()) & \
+               (centers[:, 1] - radii >= border.top())
+
+
+    def distance_matrix(self) -> np.ndarray:
+        """
+        Distances between all satellite centres. Needs N x N memory, meant for small stores and cross checks.
+        """
+        centers = self.centers()
+        differences = centers[:, np.newaxis, :] - centers[np.newaxis, :, :]
+        return np.sqrt(differences[..., 0] ** 2 + differences[..., 1] ** 2)
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    def __grow(self, capacity: int):
+        def grow(array: np.ndarray, axis: int, fill=0) -> np.ndarray:
+            shape = list(array.shape)
+            shape[axis] = capacity - array.shape[axis]
+            return np.concatenate((array, np.full(shape, fill, dtype=array.dtype)), axis=axis)
+
+        self.positions = grow(self.positions, 0)
+        self.sizes = grow(self.sizes, 0)
+        self.masses = grow(self.masses, 0)
+        self.observance_radii = grow(self.observance_radii, 0, DEFAULT_OBSERVANCE_RADIUS)
+        self.crashed = grow(self.crashed, 0, False)
+        self.velocities = grow(self.velocities, 1)
+        self.velocity_curves = grow(self.velocity_curves, 1)
+        self.previous_centers = grow(self.previous_centers, 0)
+
+
+    def __grow_disturbances(self, capacity: int):
+        added: int = capacity - len(self.disturbance_owners)
+        self.disturbance_owners = np.concatenate((self.disturbance_owners, np.full(added, NO_OWNER, dtype=np.int64)))
+        self.disturbance_velocities = np.concatenate((self.disturbance_velocities, np.zeros((added, 2))))
+        self.disturbance_curves = np.concatenate((self.disturbance_curves, np.zeros((added, CURVE_COLUMNS))))
+
+
+    def __compact_disturbances(self):
+        # keeps the order of the remaining rows
+        rows = np.flatnonzero(self.disturbance_owners[:len(self.__disturbances)] != NO_OWNER)
+        amount: int = len(rows)
+        self.disturbance_owners[:amount] = self.disturbance_owners[rows]
+        self.disturbance_owners[amount:] = NO_OWNER
+        self.disturbance_velocities[:amount] = self.disturbance_velocities[rows]
+        self.disturbance_curves[:amount] = self.disturbance_curves[rows]
+        self.__disturbances = [self.__disturbances[row] for row in rows]
+        for row, disturbance in enumerate(self.__disturbances):
+            disturbance.velocity().bind(self, row)
+        self.__released_disturbance_amount = 0
+
+
+class PositionView(Vector):
+    """
+    A Vector that reads and writes the position row of a satellite in a SatelliteStore.
+    """
+    __slots__ = ("_store", "_index")
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, store: SatelliteStore, index: int):
+        # no call of the Vector constructor, x and y already live in the store
+        self._store: SatelliteStore = store
+        self._index: int = index
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    @property
+    def _x(self) -> float:
+        return self._store.positions[self._index, 0]
+
+
+    @_x.setter
+    def _x(self, x: float):
+        self._store.positions[self._index, 0] = x
+        self._store.position_version += 1
+
+
+    @property
+    def _y(self) -> float:
+        return self._store.positions[self._index, 1]
+
+
+    @_y.setter
+    def _y(self, y: float):
+        self._store.positions[self._index, 1] = y
+        self._store.position_version += 1
+
+
+    def bind(self, store: SatelliteStore, index: int):
+        self._store = store
+        self._index = index
+
+
+class VelocityView(Velocity):
+    """
+    A Velocity that reads and writes one of the three velocities of a satellite in a SatelliteStore.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, store: SatelliteStore, index: int, kind: int):
+        # no call of the Velocity constructor, the state already lives in the store
+        self._store: SatelliteStore = store
+        self._index: int = index
+        self._kind: int = kind
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    @property
+    def _x(self) -> float:
+        return self._store.velocities[self._kind, self._index, 0]
+
+
+    @_x.setter
+    def _x(self, x: float):
+        self._store.velocities[self._kind, self._index, 0] = x
+
+
+    @property
+    def _y(self) -> float:
+        return self._store.velocities[self._kind, self._index, 1]
+
+
+    @_y.setter
+    def _y(self, y: float):
+        self._store.velocities[self._kind, self._index, 1] = y
+
+
+    @property
+    def _t(self) -> float:
+        return self._store.velocity_curves[self._kind, self._index, T]
+
+
+    @_t.setter
+    def _t(self, t: float):
+        self._store.velocity_curves[self._kind, self._index, T] = t
+
+
+    @property
+    def _v1(self) -> float:
+        return self._store.velocity_curves[self._kind, self._index, V1]
+
+
+    @_v1.setter
+    def _v1(self, v1: float):
+        self._store.velocity_curves[self._kind, self._index, V1] = v1
+
+
+    @property
+    def _v2(self) -> float:
+        return self._store.velocity_curves[self._kind, self._index, V2]
+
+
+    @_v2.setter
+    def _v2(self, v2: float):
+        self._store.velocity_curves[self._kind, self._index, V2] = v2
+
+
+    @property
+    def _magnitude(self) -> float:
+        return self._store.velocity_curves[self._kind, self._index, MAGNITUDE]
+
+
+    @_magnitude.setter
+    def _magnitude(self, magnitude: float):
+        self._store.velocity_curves[self._kind, self._index, MAGNITUDE] = magnitude
+
+
+    def bind(self, store: SatelliteStore, index: int):
+        self._store = store
+        self._index = index
+
+
+class DisturbanceVelocityView(Velocity):
+    """
+    A Velocity that reads and writes the velocity of a disturbance in the disturbance table of a SatelliteStore.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, store: SatelliteStore, row: int):
+        # no call of the Velocity constructor, the state already lives in the store
+        self._store: SatelliteStore = store
+        self._row: int = row
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    @property
+    def _x(self) -> float:
+        return self._store.disturbance_velocities[self._row, 0]
+
+
+    @_x.setter
+    def _x(self, x: float):
+        self._store.disturbance_velocities[self._row, 0] = x
+
+
+    @property
+    def _y(self) -> float:
+        return self._store.disturbance_velocities[self._row, 1]
+
+
+    @_y.setter
+    def _y(self, y: float):
+        self._store.disturbance_velocities[self._row, 1] = y
+
+
+    @property
+    def _t(self) -> float:
+        return self._store.disturbance_curves[self._row, T]
+
+
+    @_t.setter
+    def _t(self, t: float):
+        self._store.disturbance_curves[self._row, T] = t
+
+
+    @property
+    def _v1(self) -> float:
+        return self._store.disturbance_curves[self._row, V1]
+
+
+    @_v1.setter
+    def _v1(self, v1: float):
+        self._store.disturbance_curves[self._row, V1] = v1
+
+
+    @property
+    def _v2(self) -> float:
+        return self._store.disturbance_curves[self._row, V2]
+
+
+    @_v2.setter
+    def _v2(self, v2: float):
+        self._store.disturbance_curves[self._row, V2] = v2
+
+
+    @property
+    def _magnitude(self) -> float:
+        return self._store.disturbance_curves[self._row, MAGNITUDE]
+
+
+    @_magnitude.setter
+    def _magnitude(self, magnitude: float):
+        self._store.disturbance_curves[self._row, MAGNITUDE] = magnitude
+
+
+    def row(self) -> int:
+        return self._row
+
+
+    def bind(self, store: SatelliteStore, row: int):
+        self._store = store
+        self._row = row
+
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+def update_velocity_curves(velocities: np.ndarray, curves: np.ndarray):
+    """
+    Velocity.update for every row of the velocity components (K, 2) and the curve states (K, 4), in place.
+    Uses the same operations in the same order as Velocity.update, so the results are bit for bit the same.
+    """
+    rows = np.flatnonzero((curves[:, V1] != 0) | (curves[:, V2] != 0))
+    if not rows.size:
+        return
+
+    t = curves[rows, T] + 1
+    v1 = curves[rows, V1]
+    v2 = curves[rows, V2]
+    magnitude = v1 * t ** 2 + v2 * t
+    stopped = (t > 0) & (magnitude <= 0)
+
+    x = velocities[rows, 0]
+    y = velocities[rows, 1]
+    length = np.sqrt(x * x + y * y)
+    # same replacement of a zero length as in vector.divide
+    length[length == 0] = 10 ** (-100)
+
+    curves[rows, T] = np.where(stopped, 0, t)
+    curves[rows, V1] = np.where(stopped, 0, v1)
+    curves[rows, V2] = np.where(stopped, 0, v2)
+    curves[rows, MAGNITUDE] = np.where(stopped, 0, magnitude)
+    velocities[rows, 0] = np.where(stopped, 0, x / length * magnitude)
+    velocities[rows, 1] = np.where(stopped, 0, y / length * magnitude)
+
+
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
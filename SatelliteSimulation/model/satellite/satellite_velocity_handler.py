@@ -24,11 +24,15 @@ class SatelliteVelocityHandler:
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Constructor
     # ----------------------------------------------------------------------- #
-    def __init__(self, max_navigation_velocity_magnitude: float):
-        self.__navigation_velocity: Velocity = Velocity(0, 0)
+    def __init__(self, max_navigation_velocity_magnitude: float, navigation_velocity: Velocity = None,
+                 disturbance_velocity: Velocity = None, collision_velocity: Velocity = None):
+        self.__navigation_velocity: Velocity = navigation_velocity \
+            if navigation_velocity is not None else Velocity(0, 0)
         self.__max_navigation_velocity_magnitude: float = max_navigation_velocity_magnitude
-        self.__disturbance_velocity: Velocity = Velocity(0, 0)
-        self.__collision_velocity: Velocity = Velocity(0, 0)
+        self.__disturbance_velocity: Velocity = disturbance_velocity \
+            if disturbance_velocity is not None else Velocity(0, 0)
+        self.__collision_velocity: Velocity = collision_velocity \
+            if collision_velocity is not None else Velocity(0, 0)
 
 
     # ----------------------------------------------------------------------- #
@@ -2,10 +2,11 @@
 #  SECTION: Imports
 # =========================================================================== #
 import logging
-import random
 import threading
 import time
-from numpy.random import choice
+
+import numpy as np
+
 from model.disturbance.disturbance_type import DisturbanceType
 
 
@@ -13,6 +14,9 @@ from model.disturbance.disturbance_type import DisturbanceType
 #  SECTION: Global definitions
 # =========================================================================== #
 
+# weights of the DisturbanceTypes in their order of definition
+DISTURBANCE_TYPE_WEIGHTS = [0.70, 0.10, 0.10, 0.10]
+
 # =========================================================================== #
 #  SECTION: Class definitions
 # =========================================================================== #
@@ -22,13 +26,15 @@ class AutoDisturbancesHandler:
     """
     A Thread class which creates at random intervals a random Disturbance type.
     The DisturbanceTypes are weighted.
+    The generator should not be shared with another thread.
     """
 
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Constructor
     # ----------------------------------------------------------------------- #
-    def __init__(self, controller):
+    def __init__(self, controller, rng: np.random.Generator = None):
         self.__controller = controller
+        self.__rng: np.random.Generator = rng if rng is not None else np.random.default_rng()
         self.__stop_thread: bool = False
         self.__thread: threading.Thread = threading.Thread()
         self.__disturbanceTypes: list = list(DisturbanceType)
@@ -59,7 +65,7 @@ class AutoDisturbancesHandler:
     def __run(self, stop):
         while True:
             self.__controller.on_disturbance_clicked(self.__get_random_disturbance().value)
-            time.sleep(random.uniform(0.3, 1.3))
+            time.sleep(self.__rng.uniform(0.3, 1.3))
 
             if stop():
                 break
@@ -68,8 +74,7 @@ class AutoDisturbancesHandler:
     #  SECTION: Function definitions
     # =========================================================================== #
     def __get_random_disturbance(self) -> DisturbanceType:
-        weights_of_the_disturbance_type = [0.70, 0.10, 0.10, 0.10]
-        return choice(self.__disturbanceTypes, 1, p=weights_of_the_disturbance_type)[0]
+        return self.__rng.choice(self.__disturbanceTypes, p=DISTURBANCE_TYPE_WEIGHTS)
 
     # =========================================================================== #
     #  SECTION: Main Body
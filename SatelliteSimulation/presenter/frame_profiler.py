@@ -0,0 +1,169 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import contextlib
+import csv
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# amount of frames the rolling statistics are calculated of, one second at 60 frames per second
+DEFAULT_WINDOW_SIZE = 60
+
+CSV_HEADER = ["phase", "frames", "total_s", "p50_ms", "p95_ms", "max_ms"]
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class PhaseStatistics:
+    """
+    Rolling statistics of the durations of one phase in milliseconds.
+    """
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, name: str, p50: float, p95: float, maximum: float, frames: int, total: float):
+        self.__name: str = name
+        self.__p50: float = p50
+        self.__p95: float = p95
+        self.__maximum: float = maximum
+        self.__frames: int = frames
+        self.__total: float = total
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    @property
+    def name(self) -> str:
+        return self.__name
+
+
+    @property
+    def p50(self) -> float:
+        return self.__p50
+
+
+    @property
+    def p95(self) -> float:
+        return self.__p95
+
+
+    @property
+    def maximum(self) -> float:
+        return self.__maximum
+
+
+    @property
+    def frames(self) -> int:
+        """
+        Amount of measured frames since the start, not only of the rolling window.
+        """
+        return self.__frames
+
+
+    @property
+    def total(self) -> float:
+        """
+        Summed duration of all measured frames in seconds.
+        """
+        return self.__total
+
+
+class FrameProfiler:
+    """
+    Registry of timers keyed by phase name. Every phase of a frame is timed with the phase context manager,
+    the last window_size durations of every phase are kept for the rolling statistics.
+    The phases may be timed on different threads.
+    """
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE):
+        self.__window_size: int = window_size
+        # insertion order is the order the phases run in the first frame
+        self.__durations: dict = {}
+        self.__frames: dict = {}
+        self.__totals: dict = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    def get_phase_names(self) -> list:
+        with self.__lock:
+            return list(self.__durations)
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+
+    def record(self, name: str, duration: float):
+        """
+        Adds the duration in seconds of one frame of the phase.
+        """
+        with self.__lock:
+            if name not in self.__durations:
+                self.__durations[name] = deque(maxlen=self.__window_size)
+                self.__frames[name] = 0
+                self.__totals[name] = 0.0
+            self.__durations[name].append(duration)
+            self.__frames[name] += 1
+            self.__totals[name] += duration
+
+
+    def statistics(self) -> list:
+        """
+        The rolling p50, p95 and maximum in milliseconds of every phase, in the order the phases were added.
+        """
+        with self.__lock:
+            phases: list = [(name, np.array(durations), self.__frames[name], self.__totals[name])
+                            for name, durations in self.__durations.items()]
+        statistics: list = []
+        for name, durations, frames, total in phases:
+            milliseconds: np.ndarray = durations * 1000
+            p50, p95 = np.percentile(milliseconds, [50, 95])
+            statistics.append(PhaseStatistics(name, float(p50), float(p95), float(milliseconds.max()), frames, total))
+        return statistics
+
+
+    def write_csv(self, file_path: str):
+        with open(file_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(CSV_HEADER)
+            for phase in self.statistics():
+                writer.writerow([phase.name, phase.frames, f"{phase.total:.6f}",
+                                 f"{phase.p50:.3f}", f"{phase.p95:.3f}", f"{phase.maximum:.3f}"])
+
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
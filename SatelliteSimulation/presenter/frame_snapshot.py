@@ -0,0 +1,174 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import time
+
+import numpy as np
+
+from model.model import Space
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class FrameSnapshot:
+    """
+    Immutable copy of everything the GUI draws of one simulation step, so that it can be drawn
+    while the Space already calculates the next steps.
+    The arrays are read only, the arrows are created for the snapshot and not shared with the Space.
+    """
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, positions: np.ndarray, previous_positions: np.ndarray, sizes: np.ndarray, types: np.ndarray,
+                 crashed: np.ndarray, observance_radii: np.ndarray, observing: np.ndarray, endangered: np.ndarray,
+                 arrows: tuple, arrow_owners: np.ndarray, interpolation_factor: float, created_at: float):
+        self.__positions: np.ndarray = read_only(positions)
+        self.__previous_positions: np.ndarray = read_only(previous_positions)
+        self.__sizes: np.ndarray = read_only(sizes)
+        self.__types: np.ndarray = read_only(types)
+        self.__crashed: np.ndarray = read_only(crashed)
+        self.__observance_radii: np.ndarray = read_only(observance_radii)
+        self.__observing: np.ndarray = read_only(observing)
+        self.__endangered: np.ndarray = read_only(endangered)
+        self.__arrows: tuple = arrows
+        self.__arrow_owners: np.ndarray = read_only(arrow_owners)
+        self.__interpolation_factor: float = interpolation_factor
+        self.__created_at: float = created_at
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    @property
+    def positions(self) -> np.ndarray:
+        return self.__positions
+
+
+    @property
+    def previous_positions(self) -> np.ndarray:
+        """
+        Positions before the last step.
+        """
+        return self.__previous_positions
+
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return self.__sizes
+
+
+    @property
+    def types(self) -> np.ndarray:
+        return self.__types
+
+
+    @property
+    def crashed(self) -> np.ndarray:
+        return self.__crashed
+
+
+    @property
+    def observance_radii(self) -> np.ndarray:
+        return self.__observance_radii
+
+
+    @property
+    def observing(self) -> np.ndarray:
+        """
+        Whether a satellite observes other satellites.
+        """
+        return self.__observing
+
+
+    @property
+    def endangered(self) -> np.ndarray:
+        """
+        Whether a satellite has possible future collisions.
+        """
+        return self.__endangered
+
+
+    @property
+    def arrows(self) -> tuple:
+        """
+        Velocity arrows, the empty tuple if they were not requested.
+        """
+        return self.__arrows
+
+
+    @property
+    def arrow_owners(self) -> np.ndarray:
+        """
+        Index of the satellite of every arrow.
+        """
+        return self.__arrow_owners
+
+
+    @property
+    def interpolation_factor(self) -> float:
+        """
+        Share of the next step that had elapsed when the snapshot was taken.
+        """
+        return self.__interpolation_factor
+
+
+    @property
+    def created_at(self) -> float:
+        """
+        time.perf_counter() when the snapshot was taken.
+        """
+        return self.__created_at
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def position_offsets(self, interpolation_factor: float) -> np.ndarray:
+        """
+        Offsets (n, 2) from the positions to the positions interpolated between the last two steps.
+        """
+        return (self.__previous_positions - self.__positions) * (1 - min(1.0, interpolation_factor))
+
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+
+def read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def create_snapshot(space: Space, with_arrows: bool) -> FrameSnapshot:
+    satellites: list = space.get_satellites()
+    store = space.get_store()
+    length: int = len(satellites)
+    arrows, arrow_owners = space.get_velocity_arrows_with_owners() if with_arrows else ((), ())
+    return FrameSnapshot(positions=store.positions[:length].copy(),
+                         previous_positions=space.previous_positions().copy(),
+                         sizes=store.sizes[:length].copy(),
+                         types=np.array([satellite.get_type() for satellite in satellites], dtype=np.int64),
+                         crashed=store.crashed[:length].copy(),
+                         observance_radii=store.observance_radii[:length].copy(),
+                         observing=np.array([bool(satellite.observed_satellites()) for satellite in satellites],
+                                            dtype=bool),
+                         endangered=np.array([bool(satellite.possible_collisions()) for satellite in satellites],
+                                             dtype=bool),
+                         arrows=tuple(arrows),
+                         arrow_owners=np.array(arrow_owners, dtype=np.int64),
+                         interpolation_factor=space.interpolation_factor(),
+                         created_at=time.perf_counter())
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
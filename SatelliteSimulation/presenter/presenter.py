@@ -3,8 +3,10 @@
 # =========================================================================== #
 
 import os
-import random
 import sys
+from collections import deque
+
+import numpy as np
 import pandas as pd
 
 
@@ -12,9 +14,11 @@ sys.dont_write_bytecode = True
 sys.path.append(os.getcwd())
 
 from presenter.auto_disturbances import AutoDisturbancesHandler
+from presenter.frame_profiler import FrameProfiler, PhaseStatistics
+from presenter.frame_snapshot import FrameSnapshot, create_snapshot
+from presenter.simulation_thread import SimulationThread
 from model.arrow import Arrow, ArrowType
 from model.basic_math.vector import multiply, Vector, add
-from model.satellite.satellite import Satellite
 from view.objects.arrow_view import ArrowView
 from view.objects.button.button_control_panel_view import ButtonControlPanelView
 from view.objects.button.button_data import ButtonData, ToggleButtonData
@@ -23,7 +27,7 @@ from view.objects.satellite_view import SatelliteView
 from view.resources import Color
 from model.disturbance.disturbance_type import DisturbanceType
 from model.model import Space
-from model.border import Border
+from model.border import Border, create_gui_border
 from view.view import GUI
 
 
@@ -51,14 +55,17 @@ class Presenter:
     #  SUBSECTION: Constructor
     # ----------------------------------------------------------------------- #
 
-    def __init__(self, debug_mode=False, config_data: pd.DataFrame=None):
+    def __init__(self, debug_mode=False, config_data: pd.DataFrame=None, seed: int = None,
+                 profile_file_path: str = None, threaded_simulation: bool = False):
         self.__debug_mode: bool = debug_mode
+        self.__rng: np.random.Generator = np.random.default_rng(seed)
         self.__config_data: pd.DataFrame = config_data
-        self.__border: Border = Border(x=0, y=0, width=1920, height=1080, padding=30)
+        self.__border: Border = create_gui_border()
 
-        self.space = Space(satellite_amount=random.randint(15, 20), 
+        self.space = Space(satellite_amount=int(self.__rng.integers(15, 21)),
                            border=self.__border,
-                           config_data=self.__config_data)
+                           config_data=self.__config_data,
+                           rng=self.__rng)
 
         button_data: list = [ButtonData(button_name=disturbance_type.value,
                                         on_click_handler=self.on_disturbance_clicked
@@ -72,6 +79,9 @@ class Presenter:
         button_data.append(ToggleButtonData(button_name="PHYSIC MODE",
                                             on_click_handler=self.on_physic_mode_clicked,
                                             is_selected=True))
+        button_data.append(ToggleButtonData(button_name="FRAME PROFILER",
+                                            on_click_handler=self.on_frame_profiler_clicked,
+                                            is_selected=False))
 
         self.gui = GUI(controller=self,
                        border_width=self.__border.width(),
@@ -79,8 +89,18 @@ class Presenter:
                        border_padding=self.__border.padding(),
                        button_data=button_data)
 
-        self.__auto_disturbance_thread: AutoDisturbancesHandler = AutoDisturbancesHandler(self)
+        self.__auto_disturbance_thread: AutoDisturbancesHandler = AutoDisturbancesHandler(self, rng=self.__rng.spawn(1)[0])
         self.__is_physic_mode_selected: bool = True
+        self.__is_frame_profiler_selected: bool = False
+        self.__profiler: FrameProfiler = FrameProfiler()
+        self.__profile_file_path: str = profile_file_path
+        # commands for the Space, e.g. of the auto disturbances thread, the GUI thread runs them before its next step
+        self.__commands: deque = deque()
+        # the Space steps on its own thread and the GUI draws the latest published snapshot
+        self.__simulation_thread: SimulationThread = None
+        if threaded_simulation:
+            self.__simulation_thread = SimulationThread(self.space, self.__profiler,
+                                                        with_arrows=self.__is_physic_mode_selected)
 
         self.__run = True
         self.start_simulation_loop()
@@ -95,13 +115,21 @@ class Presenter:
 
 
     def start_simulation_loop(self):
+        if self.__simulation_thread:
+            self.__simulation_thread.start()
         while self.__run:
-            self.set_delta_time(self.gui.calculate_delta_time())
+            delta_time: float = self.gui.calculate_delta_time()
+            if not self.__simulation_thread:
+                self.set_delta_time(delta_time)
             self.gui.handle_events()
             self.gui.calculate_button_states_and_handle_click_events()
             self.gui.handle_user_navigation()
             self.next_frame()
+        if self.__simulation_thread:
+            self.__simulation_thread.stop()
         self.gui.quit()
+        if self.__profile_file_path:
+            self.__profiler.write_csv(self.__profile_file_path)
 
 
     def quit(self):
@@ -109,7 +137,8 @@ class Presenter:
 
 
     def on_disturbance_clicked(self, disturbance_type_name: str):
-        self.space.create_disturbance(DisturbanceType(disturbance_type_name))
+        disturbance_type: DisturbanceType = DisturbanceType(disturbance_type_name)
+        self.__run_on_space(lambda space: space.create_disturbance(disturbance_type))
 
 
     def on_auto_disturbance_clicked(self, is_selected: bool):
@@ -125,12 +154,19 @@ class Presenter:
 
     def on_physic_mode_clicked(self, is_selected:bool):
         self.__is_physic_mode_selected = is_selected
+        if self.__simulation_thread:
+            self.__simulation_thread.set_with_arrows(is_selected)
+
+
+    def on_frame_profiler_clicked(self, is_selected: bool):
+        self.__is_frame_profiler_selected = is_selected
 
 
 
     def steer_satellite(self, pressed_left: bool, pressed_up: bool, pressed_right: bool, pressed_down: bool):
         if self.__debug_mode:
-            self.space.manually_steer_satellite(pressed_left, pressed_up, pressed_right, pressed_down)
+            self.__run_on_space(lambda space: space.manually_steer_satellite(pressed_left, pressed_up, pressed_right,
+                                                                             pressed_down))
 
 
     def set_delta_time(self, delta_time: float):
@@ -138,24 +174,39 @@ class Presenter:
 
 
     def next_frame(self):
+        profiler: FrameProfiler = self.__profiler
         scale_factor: float = self.gui.get_satellite_border_scale()
-        self.space.avoid_possible_future_collisions()
-        self.space.move_satellites()
-        satellites: list = self.space.get_satellites()
-        self.space.update_satellite_observance()
-        self.space.check_and_handle_collisions()
-
-        offset: float = self.gui.get_satellite_border_margin() + self.gui.get_satellite_border_padding()
-        satellite_views: list = [satellite_to_satellite_view(satellite, scale_factor, offset) for satellite in
-                                 satellites]
-        if self.__is_physic_mode_selected:
-            arrows: list = [arrow_to_arrow_view(arrow, scale_factor, offset) for arrow in self.space.get_velocity_arrows()]
-            satellite_borders: list = [satellite_to_observance_border_view(satellite, scale_factor, offset)
-                                       for satellite in satellites if not satellite.is_crashed()]
-
-            self.gui.update(satellite_views, arrows, satellite_borders)
+        # the physics runs in fixed steps, the satellites are drawn in between the last two steps
+        if self.__simulation_thread:
+            snapshot: FrameSnapshot = self.__simulation_thread.latest_snapshot()
+            interpolation_factor: float = self.__simulation_thread.interpolation_factor(snapshot)
         else:
-            self.gui.update(satellite_views)
+            self.__run_commands()
+            self.space.advance(profiler)
+            snapshot: FrameSnapshot = create_snapshot(self.space, self.__is_physic_mode_selected)
+            interpolation_factor: float = snapshot.interpolation_factor
+
+        with profiler.phase("view conversion"):
+            position_offsets: np.ndarray = snapshot.position_offsets(interpolation_factor)
+            offset: float = self.gui.get_satellite_border_margin() + self.gui.get_satellite_border_padding()
+            satellite_views: list = [satellite_to_satellite_view(snapshot, index, scale_factor, offset,
+                                                                 position_offsets[index])
+                                     for index in range(len(snapshot.positions))]
+            arrows: list = []
+            satellite_borders: list = []
+            if self.__is_physic_mode_selected:
+                arrows = [arrow_to_arrow_view(arrow, scale_factor, offset, position_offsets[owner])
+                          for arrow, owner in zip(snapshot.arrows, snapshot.arrow_owners)]
+                satellite_borders = [satellite_to_observance_border_view(snapshot, index, scale_factor, offset,
+                                                                         position_offsets[index])
+                                     for index in np.flatnonzero(~snapshot.crashed)]
+
+        profiler_rows: list = None
+        if self.__is_frame_profiler_selected:
+            profiler_rows = [phase_statistics_to_row(phase) for phase in profiler.statistics()]
+
+        with profiler.phase("gui update"):
+            self.gui.update(satellite_views, arrows, satellite_borders, profiler_rows)
 
 
     def get_satellite_border(self) -> tuple:
@@ -166,13 +217,32 @@ class Presenter:
         #  SUBSECTION: Private Methods
         # ----------------------------------------------------------------------- #
 
+
+    def __run_on_space(self, command):
+        """
+        Calls the command with the Space before its next step, on the simulation thread if there is one.
+        The command is queued in any case, a command of another thread must not change the Space during a step.
+        """
+        if self.__simulation_thread:
+            self.__simulation_thread.submit(command)
+        else:
+            self.__commands.append(command)
+
+
+    def __run_commands(self):
+        while self.__commands:
+            command = self.__commands.popleft()
+            command(self.space)
+
         # =========================================================================== #
         #  SECTION: Function definitions
         # =========================================================================== #
 
 
-def arrow_to_arrow_view(arrow: Arrow, scale_factor: float, offset: float) -> ArrowView:
-    arrow_offset: Vector = Vector(offset, offset)
+def arrow_to_arrow_view(arrow: Arrow, scale_factor: float, offset: float,
+                        position_offset: tuple = (0, 0)) -> ArrowView:
+    arrow_offset: Vector = Vector(offset + position_offset[0] * scale_factor,
+                                  offset + position_offset[1] * scale_factor)
 
     color: Color = Color.RED
     if arrow.arrow_type == ArrowType.NAVIGATION_VELOCITY:
@@ -189,33 +259,41 @@ def arrow_to_arrow_view(arrow: Arrow, scale_factor: float, offset: float) -> Arr
                      color=color)
 
 
+def phase_statistics_to_row(phase: PhaseStatistics) -> tuple:
+    return phase.name.upper(), f"{phase.p50:.1f}", f"{phase.p95:.1f}", f"{phase.maximum:.1f}"
+
+
 def scale_and_add_offset(vector: Vector, scale_factor: float, offset: Vector) -> tuple:
     return add(vector1=multiply(vector, scale_factor), vector2=offset).get_as_tuple()
 
 
-def satellite_to_satellite_view(satellite: Satellite, scale_factor: float, offset: float) -> SatelliteView:
-    x = (scale_factor * satellite.position.x()) + offset
-    y = (scale_factor * satellite.position.y()) + offset
+def satellite_to_satellite_view(snapshot: FrameSnapshot, index: int, scale_factor: float, offset: float,
+                                position_offset: tuple = (0, 0)) -> SatelliteView:
+    x = (scale_factor * (float(snapshot.positions[index, 0]) + position_offset[0])) + offset
+    y = (scale_factor * (float(snapshot.positions[index, 1]) + position_offset[1])) + offset
     return SatelliteView(x,
                          y,
-                         int(scale_factor * satellite.size()),
-                         satellite.is_crashed(),
-                         satellite.get_type())
+                         int(scale_factor * snapshot.sizes[index]),
+                         bool(snapshot.crashed[index]),
+                         int(snapshot.types[index]))
 
 
-def satellite_to_observance_border_view(satellite: Satellite, scale_factor: float,
-                                        offset: float) -> SatelliteObservanceBorderView:
-    color = Color.ORANGE if satellite.observed_satellites() else Color.GREY
+def satellite_to_observance_border_view(snapshot: FrameSnapshot, index: int, scale_factor: float, offset: float,
+                                        position_offset: tuple = (0, 0)) -> SatelliteObservanceBorderView:
+    color = Color.ORANGE if snapshot.observing[index] else Color.GREY
 
-    if satellite.possible_collisions():
+    if snapshot.endangered[index]:
         color = Color.RED
 
     line_thickness: int = max(1, int(SatelliteObservanceBorderView.DEFAULT_LINE_THICKNESS * scale_factor))
-    position = add(multiply(satellite.center(), scale_factor), Vector(offset, offset)).get_as_tuple()
+    radius: float = float(snapshot.sizes[index]) / 2
+    center: Vector = Vector(float(snapshot.positions[index, 0]) + radius + position_offset[0],
+                            float(snapshot.positions[index, 1]) + radius + position_offset[1])
+    position = add(multiply(center, scale_factor), Vector(offset, offset)).get_as_tuple()
 
     return SatelliteObservanceBorderView(color=color,
                                          position=position,
-                                         radius=(satellite.radius() + satellite.observance_radius) * scale_factor,
+                                         radius=(radius + float(snapshot.observance_radii[index])) * scale_factor,
                                          line_thickness=line_thickness)
 
     # =========================================================================== #
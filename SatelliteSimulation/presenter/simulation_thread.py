@@ -0,0 +1,163 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import logging
+import queue
+import threading
+import time
+
+from model.model import EXPECTED_FRAME_RATE, Space
+from presenter.frame_profiler import FrameProfiler
+from presenter.frame_snapshot import FrameSnapshot, create_snapshot
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# longest sleep between two checks for commands and the stop request, in seconds
+MAX_SLEEP_DURATION = 0.005
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class SnapshotBuffer:
+    """
+    Double buffer of FrameSnapshots: the simulation thread publishes into the back slot and swaps it to the front,
+    the GUI thread only reads the front slot.
+    """
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, snapshot: FrameSnapshot):
+        self.__slots: list = [snapshot, snapshot]
+        self.__front: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def publish(self, snapshot: FrameSnapshot):
+        back: int = 1 - self.__front
+        self.__slots[back] = snapshot
+        with self.__lock:
+            self.__front = back
+
+
+    def latest(self) -> FrameSnapshot:
+        with self.__lock:
+            return self.__slots[self.__front]
+
+
+class SimulationThread:
+    """
+    Calculates the steps of the Space on its own thread, so that slow frames of the GUI do not slow down
+    the simulation. After every step a FrameSnapshot is published into the SnapshotBuffer.
+    Other threads must not access the Space while the thread runs, changes are submitted as commands instead.
+    """
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, space: Space, profiler: FrameProfiler = None, with_arrows: bool = True):
+        self.__space: Space = space
+        self.__profiler: FrameProfiler = profiler
+        self.__with_arrows: bool = with_arrows
+        self.__commands: queue.Queue = queue.Queue()
+        self.__buffer: SnapshotBuffer = SnapshotBuffer(create_snapshot(space, with_arrows))
+        self.__stop_thread: bool = False
+        self.__thread: threading.Thread = threading.Thread()
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    def latest_snapshot(self) -> FrameSnapshot:
+        return self.__buffer.latest()
+
+
+    def interpolation_factor(self, snapshot: FrameSnapshot) -> float:
+        """
+        Share of the step after the snapshot that has elapsed until now.
+        """
+        elapsed_frames: float = (time.perf_counter() - snapshot.created_at) * EXPECTED_FRAME_RATE
+        return snapshot.interpolation_factor + elapsed_frames / self.__space.fixed_step_duration()
+
+
+    def set_with_arrows(self, with_arrows: bool):
+        self.__with_arrows = with_arrows
+
+
+    def is_alive(self) -> bool:
+        return self.__thread.is_alive()
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def start(self):
+        if not self.__thread.is_alive():
+            self.__stop_thread = False
+            self.__thread = threading.Thread(target=self.__run, args=(lambda: self.__stop_thread,))
+            self.__thread.daemon = True
+            self.__thread.start()
+
+
+    def stop(self):
+        if self.__thread.is_alive():
+            self.__stop_thread = True
+            self.__thread.join()
+
+
+    def submit(self, command):
+        """
+        command: function with the Space as its only parameter, it is called on the simulation thread before
+        the next step
+        """
+        self.__commands.put(command)
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    def __run(self, stop):
+        space: Space = self.__space
+        last_time: float = time.perf_counter()
+        while not stop():
+            self.__run_commands()
+
+            now: float = time.perf_counter()
+            space.set_delta_time((now - last_time) * EXPECTED_FRAME_RATE)
+            last_time = now
+            if space.advance(self.__profiler):
+                self.__buffer.publish(create_snapshot(space, self.__with_arrows))
+
+            remaining_frames: float = (1 - space.interpolation_factor()) * space.fixed_step_duration()
+            time.sleep(min(MAX_SLEEP_DURATION, remaining_frames / EXPECTED_FRAME_RATE))
+
+
+    def __run_commands(self):
+        while True:
+            try:
+                command = self.__commands.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                command(self.__space)
+            except Exception:
+                logging.exception("command of the simulation thread failed")
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
@@ -0,0 +1,47 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+from unittest import TestCase
+
+import numpy as np
+
+from SatelliteSimulation.model.basic_math.distance_predicates import closer_than, closer_than_distances, \
+    within_distance, within_distances
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestDistancePredicates(TestCase):
+    """
+    Test class for the comparisons on squared distances.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def test_predicates_match_the_comparisons_of_the_distances(self):
+        """
+        GIVEN:
+        points 5 apart and thresholds below, at and above their distance
+        WHEN:
+        the scalar and the vectorised predicates compare the points with the thresholds
+        THEN:
+        they give the results of comparing the distance itself
+        """
+        thresholds: list = [4.5, 5, 5.5]
+        self.assertEqual([False, True, True], [within_distance(1, 2, 4, 6, threshold) for threshold in thresholds])
+        self.assertEqual([False, False, True], [closer_than(1, 2, 4, 6, threshold) for threshold in thresholds])
+
+        differences: np.ndarray = np.array([[3.0, 4.0], [-3.0, -4.0], [0.0, 5.0]])
+        distances: np.ndarray = np.array(thresholds)
+        np.testing.assert_array_equal([False, True, True], within_distances(differences, distances))
+        np.testing.assert_array_equal([False, False, True], closer_than_distances(differences, distances))
+        np.testing.assert_array_equal([[False, True, True]],
+                                      within_distances(differences[np.newaxis], distances[np.newaxis]))
@@ -0,0 +1,207 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import random
+from unittest import TestCase
+
+import numpy as np
+
+from SatelliteSimulation.model.basic_math.motion import FutureCollisionDetector, Trajectory, TrajectoryBatch, \
+    TrajectoryCache, polynomial_roots, predict_collisions
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestMotion(TestCase):
+    """
+    Test class for the batched collision prediction.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def setUp(self) -> None:
+        random.seed(5)
+
+
+    def test_polynomial_roots_match_numpy_roots(self):
+        """
+        GIVEN:
+        polynomials with leading, trailing and only zeros
+        WHEN:
+        the roots of all polynomials are calculated at once
+        THEN:
+        every row holds the roots of np.roots in the same order, filled up with nan
+        """
+        coefficients = np.array([[1.0, -6, 11, -6, 0, 0, 0],
+                                 [0, 0, 2, 0, -8, 0, 0],
+                                 [0, 0, 0, 0, 0, 3, -1],
+                                 [0, 0, 0, 0, 0, 0, 0],
+                                 [0, 0, 0, 0, 0, 0, 4],
+                                 [1, 2, 3, 4, 5, 6, 7]])
+
+        roots = polynomial_roots(coefficients)
+
+        for row, polynomial in zip(roots, coefficients):
+            expected = np.roots(polynomial)
+            np.testing.assert_array_equal(expected, row[:len(expected)])
+            self.assertTrue(np.isnan(row[len(expected):]).all())
+
+
+    def test_batched_prediction_matches_collision_detector(self):
+        """
+        GIVEN:
+        pairs of trajectories with two and four points, standing and moving, accelerating and jerking
+        WHEN:
+        the collisions of all pairs are predicted at once
+        THEN:
+        the critical moments are the same as the ones of the FutureCollisionDetector for every pair
+        and the points of crash are almost the same
+        """
+        observed_positions = [self.__random_positions(random.choice([2, 4])) for _ in range(500)]
+        satellite_positions = [self.__random_positions(4) for _ in range(500)]
+        radii1 = np.array([random.uniform(5, 40) for _ in range(500)])
+        radii2 = np.array([random.uniform(5, 40) for _ in range(500)])
+
+        moments, points_of_crash = predict_collisions(radii1, radii2, TrajectoryBatch(observed_positions),
+                                                      TrajectoryBatch(satellite_positions))
+
+        collision_amount: int = 0
+        for index in range(500):
+            collision = FutureCollisionDetector(radii1[index], radii2[index], Trajectory(observed_positions[index]),
+                                                Trajectory(satellite_positions[index])).is_collision_possible()
+            if collision is None:
+                self.assertTrue(np.isnan(moments[index]))
+            else:
+                collision_amount += 1
+                self.assertEqual(collision.time(), moments[index])
+                np.testing.assert_allclose(collision.position().get_as_tuple(), points_of_crash[index])
+        self.assertGreater(collision_amount, 0)
+
+
+    def test_only_pairs_without_collision_are_excluded(self):
+        """
+        GIVEN:
+        pairs of trajectories, some of them moving apart
+        WHEN:
+        the pairs are checked if a collision is impossible before searching the roots of their distance polynomial
+        THEN:
+        no excluded pair has a collision by the root search, and the pairs moving apart are excluded
+        """
+        excluded_amount: int = 0
+        for index in range(500):
+            observed_positions: list = self.__random_positions(random.choice([2, 4]))
+            satellite_positions: list = [(x + 100 + 10 * t, y) for t, (x, y) in enumerate(observed_positions)] \
+                if index % 5 == 0 else self.__random_positions(4)
+            detector = FutureCollisionDetector(random.uniform(5, 40), random.uniform(5, 40),
+                                               Trajectory(observed_positions), Trajectory(satellite_positions))
+            if detector._collision_impossible():
+                excluded_amount += 1
+                self.assertIsNone(detector._solve_distance_equation_for_four())
+            elif index % 5 == 0:
+                self.fail(f"pair moving apart is not excluded: {observed_positions}, {satellite_positions}")
+        self.assertGreater(excluded_amount, 100)
+
+
+    def test_batched_motion_durations_match_trajectory(self):
+        """
+        GIVEN:
+        trajectories that start at rest and accelerate, and trajectories that keep moving
+        WHEN:
+        the motion durations of all trajectories are calculated at once
+        THEN:
+        they are the same as the motion durations of the single trajectories
+        """
+        positions = [[(0, 0), (0, 0), (random.randint(-3, 3), random.randint(-3, 3)),
+                      (random.randint(-6, 6), random.randint(-6, 6))] for _ in range(100)]
+        positions += [self.__random_positions(4) for _ in range(100)]
+
+        motion_durations = TrajectoryBatch(positions).motion_durations
+
+        for index, points in enumerate(positions):
+            self.assertEqual(Trajectory(points).motion_duration, motion_durations[index])
+
+
+    def test_trajectories_are_shared_by_key(self):
+        """
+        GIVEN:
+        the positions of some satellites, each of them in several pairs
+        WHEN:
+        the trajectories are fitted in a batch with keys and through the trajectory cache
+        THEN:
+        the features are the same as without sharing and the cache fits every trajectory once per frame
+        """
+        satellite_positions = [self.__random_positions(4) for _ in range(20)]
+        rows = [random.randrange(len(satellite_positions)) for _ in range(100)]
+        positions = [satellite_positions[row] for row in rows]
+
+        shared_trajectories = TrajectoryBatch(positions, keys=rows)
+        trajectories = TrajectoryBatch(positions)
+
+        for name in ("support_vectors", "velocities", "accelerations", "jerks", "motion_durations"):
+            np.testing.assert_array_equal(getattr(trajectories, name), getattr(shared_trajectories, name))
+
+        trajectory_cache = TrajectoryCache()
+        trajectory: Trajectory = trajectory_cache.get_trajectory(rows[0], 1, positions[0])
+        self.assertIs(trajectory, trajectory_cache.get_trajectory(rows[0], 1, list(positions[0])))
+        self.assertIsNot(trajectory, trajectory_cache.get_trajectory(rows[0], 2, positions[0]))
+        self.assertEqual(1, len(trajectory_cache))
+
+
+    def test_motion_durations_without_jerk_match_root_search(self):
+        """
+        GIVEN:
+        trajectories at rest, moving uniformly, starting at rest and accelerating or decelerating along their velocity
+        WHEN:
+        their motion durations are calculated without a root search
+        THEN:
+        they are the same as the ones from the roots of the speed polynomial
+        """
+        positions = [[(3, 4)] * random.randint(1, 4)]
+        for _ in range(200):
+            x, y = random.randint(0, 300), random.randint(0, 300)
+            v_x, v_y = random.choice([0, random.randint(-4, 4)]), random.randint(-4, 4)
+            a_x, a_y = random.choice([(random.randint(-2, 2), random.randint(-2, 2)), (-v_x / 2, -v_y / 2)])
+            positions.append([(x + v_x * t + a_x / 2 * t * t, y + v_y * t + a_y / 2 * t * t)
+                              for t in range(random.randint(2, 4))])
+
+        motion_durations = TrajectoryBatch(positions).motion_durations
+
+        for index, points in enumerate(positions):
+            trajectory = Trajectory(points)
+            self.assertFalse(trajectory.jerk.any())
+            self.assertEqual(self.__motion_duration_from_roots(trajectory), trajectory.motion_duration)
+            self.assertEqual(trajectory.motion_duration, motion_durations[index])
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    @staticmethod
+    def __random_positions(amount: int) -> list:
+        x, y = random.uniform(0, 300), random.uniform(0, 300)
+        if random.random() < 0.2:
+            return [(x, y)] * amount
+        v_x, v_y = random.uniform(-4, 4), random.uniform(-4, 4)
+        a_x, a_y = random.choice([0, random.uniform(-0.3, 0.3)]), random.choice([0, random.uniform(-0.3, 0.3)])
+        return [(x + v_x * t + a_x / 2 * t * t + random.choice([0, random.uniform(-0.05, 0.05)]),
+                 y + v_y * t + a_y / 2 * t * t) for t in range(amount)]
+
+
+    @staticmethod
+    def __motion_duration_from_roots(trajectory: Trajectory) -> float:
+        (j_x, j_y), (a_x, a_y), (v_x, v_y) = trajectory.jerk, trajectory.acceleration, trajectory.velocity
+        roots = np.roots([(j_x * j_x + j_y * j_y) / 4, j_x * a_x + j_y * a_y,
+                          j_x * v_x + j_y * v_y + a_x * a_x + a_y * a_y, 2 * (a_x * v_x + a_y * v_y),
+                          v_x * v_x + v_y * v_y])
+        rational_roots_from_zero = [z.real for z in roots if z.imag == 0 and z.real >= 0]
+        if len(rational_roots_from_zero) == 2 and rational_roots_from_zero[0] == 0:
+            return rational_roots_from_zero[1]
+        return 1E5
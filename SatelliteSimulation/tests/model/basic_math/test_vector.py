@@ -0,0 +1,56 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+from unittest import TestCase
+
+from SatelliteSimulation.model.basic_math.vector import Vector, add, calculate_coordinate_distance, \
+    calculate_distance, calculate_distance_squared, multiply, subtract
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestVector(TestCase):
+    """
+    Test class for the Vector.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def test_in_place_variants_match_the_functions(self):
+        """
+        GIVEN:
+        two vectors
+        WHEN:
+        they are added, subtracted and scaled in place and their distance is calculated on the coordinates
+        THEN:
+        the results are the ones of the functions that create new vectors
+        """
+        vector1 = Vector(1.5, -2.25)
+        vector2 = Vector(-0.75, 4)
+
+        added = Vector(1.5, -2.25)
+        added.add_vector(vector2)
+        self.assertEqual(add(vector1, vector2).get_as_tuple(), added.get_as_tuple())
+
+        subtracted = Vector(1.5, -2.25)
+        subtracted.subtract_vector(vector2)
+        self.assertEqual(subtract(vector1, vector2).get_as_tuple(), subtracted.get_as_tuple())
+
+        scaled = Vector(1.5, -2.25)
+        scaled.scale(-3)
+        self.assertEqual(multiply(vector1, -3).get_as_tuple(), scaled.get_as_tuple())
+
+        distance: float = calculate_distance(vector1, vector2)
+        self.assertEqual(subtract(vector1, vector2).magnitude(), distance)
+        self.assertEqual(distance, calculate_coordinate_distance(1.5, -2.25, -0.75, 4))
+        self.assertEqual(subtract(vector1, vector2).magnitude_squared(),
+                         calculate_distance_squared(1.5, -2.25, -0.75, 4))
+        self.assertFalse(hasattr(vector1, "__dict__"))
@@ -0,0 +1,99 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import math
+from unittest import TestCase
+
+import numpy as np
+
+from SatelliteSimulation.model.collision.collision_event_queue import CollisionEventQueue
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestCollisionEventQueue(TestCase):
+    """
+    Test class for the CollisionEventQueue.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def test_predictions_are_kept_until_a_satellite_is_perturbed(self):
+        """
+        GIVEN:
+        two satellites moving on straight lines with constant velocities, one pair predicted to collide and one predicted to stay apart
+        WHEN:
+        the satellites keep moving and the first one is pushed off its line afterwards
+        THEN:
+        the predictions are kept with the moment counted from the current frame until the push,
+        a prediction made while the pushed centre is one of the 4 newest ones is not kept
+        """
+        collision_events = CollisionEventQueue(horizon=10)
+        collision_events.update(self.__recorded_centers(0), frame=0)
+        collision_events.add_prediction(0, 1, frame=0, moment_of_crash=6.5, point_of_crash=(1, 2))
+        collision_events.add_prediction(1, 0, frame=0, moment_of_crash=math.nan)
+
+        for frame in range(1, 4):
+            collision_events.update(self.__recorded_centers(frame), frame)
+            self.assertEqual((6.5 - frame, (1, 2)), collision_events.stable_prediction(0, 1, frame))
+            moment_of_crash, point_of_crash = collision_events.stable_prediction(1, 0, frame)
+            self.assertTrue(math.isnan(moment_of_crash))
+            self.assertIsNone(point_of_crash)
+
+        recorded_centers: np.ndarray = self.__recorded_centers(4)
+        recorded_centers[0, 0] += 1
+        collision_events.update(recorded_centers, frame=4)
+        self.assertIsNone(collision_events.stable_prediction(0, 1, frame=4))
+        self.assertIsNone(collision_events.stable_prediction(1, 0, frame=4))
+
+        collision_events.add_prediction(0, 1, frame=4, moment_of_crash=6.5, point_of_crash=(1, 2))
+        recorded_centers = self.__recorded_centers(5)
+        recorded_centers[0, 1] += 1
+        collision_events.update(recorded_centers, frame=5)
+        self.assertIsNone(collision_events.stable_prediction(0, 1, frame=5))
+
+
+    def test_predictions_are_dropped_when_they_are_due(self):
+        """
+        GIVEN:
+        two satellites moving on straight lines with constant velocities, one pair predicted to collide and one predicted to stay apart
+        WHEN:
+        the frames pass without a perturbation
+        THEN:
+        the collision is predicted again at its moment and the other pair at the horizon
+        """
+        collision_events = CollisionEventQueue(horizon=5)
+        collision_events.update(self.__recorded_centers(0), frame=0)
+        collision_events.add_prediction(0, 1, frame=0, moment_of_crash=2.5, point_of_crash=(1, 2))
+        collision_events.add_prediction(1, 0, frame=0, moment_of_crash=math.nan)
+
+        for frame in range(1, 4):
+            collision_events.update(self.__recorded_centers(frame), frame)
+        self.assertIsNone(collision_events.stable_prediction(0, 1, frame=3))
+        self.assertIsNotNone(collision_events.stable_prediction(1, 0, frame=3))
+        self.assertEqual(1, len(collision_events))
+
+        for frame in range(4, 6):
+            collision_events.update(self.__recorded_centers(frame), frame)
+        self.assertIsNone(collision_events.stable_prediction(1, 0, frame=5))
+        self.assertEqual(0, len(collision_events))
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    @staticmethod
+    def __recorded_centers(frame: int) -> np.ndarray:
+        # the 4 newest centres of two satellites with constant velocities, newest centre first
+        times: np.ndarray = frame - np.arange(4.0)
+        first_centers: np.ndarray = np.stack([100 + 2 * times, 50 - 0.5 * times], axis=1)
+        second_centers: np.ndarray = np.stack([300 - times, np.full(4, 80.0)], axis=1)
+        return np.stack([first_centers, second_centers])
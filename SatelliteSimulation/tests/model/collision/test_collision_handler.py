@@ -0,0 +1,59 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+from unittest import TestCase
+
+import numpy as np
+
+from SatelliteSimulation.model.basic_math.vector import Vector
+from SatelliteSimulation.model.border import Border
+from SatelliteSimulation.model.collision.collision_handler import resolve_border_collisions, RELAXATION_TOLERANCE
+from SatelliteSimulation.model.model import Space
+from SatelliteSimulation.model.satellite.satellite import SatelliteA
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestCollisionHandler(TestCase):
+    """
+    Test class for the border collisions of the collision handler.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def test_cluster_pushed_against_the_border_is_relaxed(self):
+        """
+        GIVEN:
+        a row of moving satellites left of the border and a satellite right of the border
+        WHEN:
+        the border collisions are resolved
+        THEN:
+        all satellites are inside the border, the satellites do not overlap anymore
+        and only the satellites that were out of the border lost their velocity
+        """
+        border = Border(x=0, y=0, width=1000, height=500, padding=30)
+        space = Space(satellite_amount=0, border=border, satellite_size=40)
+        satellites: list = [SatelliteA(Vector(-300 + 45 * index, 200 + 3 * index), 40) for index in range(6)]
+        satellites.append(SatelliteA(Vector(600, 200), 40))
+        for satellite in satellites:
+            satellite.velocity_handler.set_navigation_velocity(Vector(1, 2))
+        space.add_satellites(satellites)
+        store = space.get_store()
+
+        passes, remaining_overlap = resolve_border_collisions(border, satellites, store)
+
+        self.assertTrue(store.inside_border(border).all())
+        self.assertLessEqual(remaining_overlap, RELAXATION_TOLERANCE)
+        self.assertGreater(passes, 0)
+        distances: np.ndarray = store.distance_matrix() + np.diag(np.full(len(satellites), np.inf))
+        self.assertTrue((distances >= 40 - RELAXATION_TOLERANCE).all())
+        self.assertEqual([0] * 6 + [Vector(1, 2).magnitude()],
+                         [satellite.velocity_handler.velocity().magnitude() for satellite in satellites])
@@ -0,0 +1,119 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import copy
+import random
+from unittest import TestCase
+
+import numpy as np
+
+from SatelliteSimulation.model.basic_math.vector import Vector
+from SatelliteSimulation.model.border import Border
+from SatelliteSimulation.model.model import Space
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestUniformGrid(TestCase):
+    """
+    Test class for the spatial index of the satellite observance.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def setUp(self) -> None:
+        random.seed(42)
+        self.space = Space(satellite_amount=15, border=Border(x=0, y=0, width=1920, height=1080, padding=30),
+                           rng=np.random.default_rng(42))
+
+
+    def test_observed_satellites_match_brute_force_search(self):
+        """
+        GIVEN:
+        satellites at random positions, also outside of the border, with random observance radii
+        WHEN:
+        the observance is updated with and without the spatial index
+        THEN:
+        every satellite observes the same satellites in the same order
+        """
+        for _ in range(20):
+            for satellite in self.space.get_satellites():
+                satellite.position.set_xy(random.uniform(-200, 2100), random.uniform(-200, 1300))
+                satellite.observance_radius = random.uniform(0, 300)
+
+            self.space.set_spatial_index_enabled(False)
+            expected = self.__observed_satellites_after_update()
+
+            self.space.set_spatial_index_enabled(True)
+            actual = self.__observed_satellites_after_update()
+
+            self.assertEqual(expected, actual)
+
+
+    def test_observed_satellites_on_the_observance_border(self):
+        """
+        GIVEN:
+        two satellites exactly at the largest distance at which they still observe each other
+        WHEN:
+        the observance is updated with the spatial index
+        THEN:
+        the satellites observe each other
+        """
+        satellites: list = self.space.get_satellites()
+        for satellite in satellites:
+            satellite.position.set_xy(10000, 10000)
+        first, second = satellites[0], satellites[1]
+        first.observance_radius = 300
+        second.observance_radius = 300
+        first.position.set_xy(0, 0)
+        distance: float = first.radius() + first.observance_radius + second.radius()
+        second.position.set_xy(first.radius() + distance - second.radius(), first.radius() - second.radius())
+
+        self.space.update_satellite_observance()
+
+        self.assertIn(second, first.observed_satellites())
+        self.assertIn(first, second.observed_satellites())
+
+
+    def test_collision_responses_match_brute_force_pairs(self):
+        """
+        GIVEN:
+        moving satellites packed so closely that many of them overlap
+        WHEN:
+        the collisions are handled with the broad phase of the spatial index and with all satellite pairs
+        THEN:
+        the resulting positions and velocities are identical
+        """
+        for satellite in self.space.get_satellites():
+            satellite.position.set_xy(random.uniform(0, 400), random.uniform(0, 300))
+            satellite.velocity_handler.set_navigation_velocity(Vector(random.uniform(-4, 4), random.uniform(-4, 4)))
+        brute_force_space: Space = copy.deepcopy(self.space)
+        brute_force_space.set_spatial_index_enabled(False)
+
+        for space in (self.space, brute_force_space):
+            space.update_satellite_observance()
+            space.check_and_handle_collisions()
+
+        for satellite, expected in zip(self.space.get_satellites(), brute_force_space.get_satellites()):
+            self.assertEqual(expected.position.get_as_tuple(), satellite.position.get_as_tuple())
+            self.assertEqual(expected.velocity_handler.velocity().get_as_tuple(),
+                             satellite.velocity_handler.velocity().get_as_tuple())
+            self.assertEqual(expected.is_crashed(), satellite.is_crashed())
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    def __observed_satellites_after_update(self) -> list:
+        for satellite in self.space.get_satellites():
+            satellite.update_observed_satellites({})
+        self.space.update_satellite_observance()
+        return [list(satellite.observed_satellites()) for satellite in self.space.get_satellites()]
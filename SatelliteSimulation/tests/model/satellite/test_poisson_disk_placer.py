@@ -0,0 +1,82 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+from unittest import TestCase
+
+import numpy as np
+
+from SatelliteSimulation.model.border import Border
+from SatelliteSimulation.model.satellite.poisson_disk_placer import PoissonDiskPlacer
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestPoissonDiskPlacer(TestCase):
+    """
+    Test class for the PoissonDiskPlacer.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def test_satellites_are_placed_until_the_border_is_full(self):
+        """
+        GIVEN:
+        a placer for satellites of two sizes and reaches
+        WHEN:
+        satellites are placed until no position is free
+        THEN:
+        every satellite is inside the border, every two satellites are at least their reaches apart
+        and no position on a fine grid is left for another satellite
+        """
+        border = Border(x=0, y=0, width=1000, height=600, padding=30)
+        placer = PoissonDiskPlacer(border, max_reach=60, rng=np.random.default_rng(4))
+        satellite_types: list = [(20, 40), (40, 60)]
+        centers, reaches = [], []
+        with self.assertRaises(ValueError):
+            while True:
+                size, reach = satellite_types[len(placer) % 2]
+                x, y = placer.place(size, reach)
+                self.assertTrue(border.left() <= x <= border.right() - size)
+                self.assertTrue(border.top() <= y <= border.bottom() - size)
+                centers.append((x + size / 2, y + size / 2))
+                reaches.append(reach)
+
+        centers, reaches = np.array(centers), np.array(reaches)
+        self.assertEqual(len(centers), len(placer))
+        distances: np.ndarray = np.hypot(*(centers[:, np.newaxis] - centers[np.newaxis]).transpose(2, 0, 1))
+        np.fill_diagonal(distances, np.inf)
+        self.assertTrue((distances >= reaches[:, np.newaxis] + reaches[np.newaxis]).all())
+
+        # the centres the satellite that did not fit could have had
+        size, reach = satellite_types[len(placer) % 2]
+        grid_x, grid_y = np.meshgrid(np.arange(border.left() + size / 2, border.right() - size / 2, 0.5),
+                                     np.arange(border.top() + size / 2, border.bottom() - size / 2, 0.5))
+        free: np.ndarray = np.ones(grid_x.shape, dtype=bool)
+        for (center_x, center_y), placed_reach in zip(centers, reaches):
+            free &= np.hypot(grid_x - center_x, grid_y - center_y) >= placed_reach + reach
+        self.assertFalse(free.any())
+
+
+    def test_satellite_larger_than_the_border_is_not_placed(self):
+        """
+        GIVEN:
+        a placer for a small border
+        WHEN:
+        a satellite larger than the border is placed
+        THEN:
+        a ValueError is raised and nothing is placed
+        """
+        placer = PoissonDiskPlacer(Border(x=0, y=0, width=100, height=100, padding=30), max_reach=60,
+                                   rng=np.random.default_rng(4))
+
+        with self.assertRaises(ValueError):
+            placer.place(50, 60)
+        self.assertEqual(0, len(placer))
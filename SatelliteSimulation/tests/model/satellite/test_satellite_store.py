@@ -0,0 +1,216 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import copy
+import random
+from unittest import TestCase
+
+import numpy as np
+
+from SatelliteSimulation.model.basic_math.vector import Vector, calculate_distance
+from SatelliteSimulation.model.border import Border
+from SatelliteSimulation.model.disturbance.disturbance import GravitationalDisturbance, MagneticDisturbance, \
+    Malfunction, SolarRadiationDisturbance
+from SatelliteSimulation.model.model import Space, append_disturbance_to_satellite
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestSatelliteStore(TestCase):
+    """
+    Test class for the SatelliteStore and the satellite views on it.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def setUp(self) -> None:
+        random.seed(7)
+        self.border = Border(x=0, y=0, width=1920, height=1080, padding=30)
+        self.space = Space(satellite_amount=15, border=self.border, rng=np.random.default_rng(7))
+        self.store = self.space.get_store()
+        self.satellites = self.space.get_satellites()
+
+
+    def test_satellites_are_views_on_the_shared_store(self):
+        """
+        GIVEN:
+        the satellites of a space
+        WHEN:
+        the position and velocity of a satellite are changed through the satellite
+        THEN:
+        the rows of the shared store change and the other rows stay the same
+        """
+        satellite = self.satellites[3]
+        other_position: tuple = tuple(self.store.positions[4])
+
+        satellite.position.set_xy(12.5, 34.5)
+        satellite.velocity_handler.set_navigation_velocity(Vector(1, -2))
+
+        self.assertIs(self.store, satellite.store())
+        self.assertEqual(3, satellite.store_index())
+        self.assertEqual((12.5, 34.5), tuple(self.store.positions[3]))
+        self.assertEqual((1, -2), tuple(self.store.total_velocities()[3]))
+        self.assertEqual(other_position, tuple(self.store.positions[4]))
+
+
+    def test_bulk_operations_match_satellite_api(self):
+        """
+        GIVEN:
+        satellites at random positions, also outside of the border, with random velocities
+        WHEN:
+        the bulk operations of the store are used
+        THEN:
+        they return the same values as the satellite methods
+        """
+        for satellite in self.satellites:
+            satellite.position.set_xy(random.uniform(-100, 2000), random.uniform(-100, 1200))
+            satellite.velocity_handler.set_navigation_velocity(Vector(random.uniform(-4, 4), random.uniform(-4, 4)))
+            satellite.velocity_handler.collision_velocity().set_xy(random.uniform(-4, 4), random.uniform(-4, 4))
+
+        centers = self.store.centers()
+        velocities = self.store.total_velocities()
+        inside_border = self.store.inside_border(self.border)
+        distances = self.store.distance_matrix()
+        for index, satellite in enumerate(self.satellites):
+            self.assertEqual(satellite.center().get_as_tuple(), tuple(centers[index]))
+            self.assertEqual(satellite.velocity_handler.velocity().get_as_tuple(), tuple(velocities[index]))
+            self.assertEqual(self.border.is_object_inside_border(satellite.center(), satellite.radius()),
+                             inside_border[index])
+            for other_index, other_satellite in enumerate(self.satellites):
+                self.assertAlmostEqual(calculate_distance(satellite.center(), other_satellite.center()),
+                                       distances[index, other_index])
+
+
+    def test_adopted_satellites_keep_their_state(self):
+        """
+        GIVEN:
+        a satellite of a space with a crashed state, a position and a velocity
+        WHEN:
+        the satellite is adopted by a new space store
+        THEN:
+        the satellite keeps its state and writes to the new store
+        """
+        satellite = self.satellites[0]
+        satellite.update_crashed_status()
+        satellite.velocity_handler.collision_velocity().set_xy(3, 4)
+        position: tuple = satellite.position.get_as_tuple()
+        other_space = Space(satellite_amount=1, border=self.border, rng=np.random.default_rng(8))
+
+        other_space.get_store().adopt([satellite])
+        satellite.position.add_to_x(1)
+
+        self.assertIs(other_space.get_store(), satellite.store())
+        self.assertTrue(satellite.is_crashed())
+        self.assertEqual((3, 4), satellite.velocity_handler.collision_velocity().get_as_tuple())
+        self.assertEqual(position[0] + 1, satellite.position.x())
+        self.assertEqual(position, tuple(self.store.positions[0]))
+
+
+    def test_vectorised_step_matches_moving_every_satellite(self):
+        """
+        GIVEN:
+        a seeded space with disturbances of every type and colliding satellites
+        WHEN:
+        the frames are calculated with the vectorised step and with moving every satellite on its own
+        THEN:
+        the trajectories and velocities are bit for bit the same
+        """
+        for satellite in self.satellites:
+            satellite.velocity_handler.set_navigation_velocity(Vector(random.uniform(-4, 4), random.uniform(-4, 4)))
+        per_object_space: Space = copy.deepcopy(self.space)
+        per_object_space.set_vectorised_step_enabled(False)
+
+        for space in (self.space, per_object_space):
+            rng: np.random.Generator = np.random.default_rng(11)
+            for frame in range(300):
+                if frame % 20 == 0:
+                    self.__create_disturbances(space, rng)
+                space.move_satellites()
+                space.update_satellite_observance()
+                space.check_and_handle_collisions()
+
+        self.assertGreater(self.store.disturbance_amount(), 0)
+        for satellite, expected in zip(self.satellites, per_object_space.get_satellites()):
+            self.assertEqual(expected.position.get_as_tuple(), satellite.position.get_as_tuple())
+            self.assertEqual(expected.velocity_handler.velocity().get_as_tuple(),
+                             satellite.velocity_handler.velocity().get_as_tuple())
+            self.assertEqual(len(expected.disturbances()), len(satellite.disturbances()))
+        self.assertTrue((per_object_space.get_store().previous_centers[:len(self.store)] ==
+                         self.store.previous_centers[:len(self.store)]).all())
+
+
+    def test_observed_history_is_read_from_the_recorded_centers(self):
+        """
+        GIVEN:
+        a satellite that observes a moving satellite for some frames
+        WHEN:
+        the recorded centres of the observed satellite and the collision candidates are read twice
+        THEN:
+        they are the newest 4 centres of the observed satellite, from the oldest to the newest one, both times
+        """
+        observer, observed_satellite = self.satellites[0], self.satellites[1]
+        observed_satellite.velocity_handler.set_navigation_velocity(Vector(2, 1))
+        centers: list = []
+        for frame in range(6):
+            self.store.step()
+            self.store.observance_frame += 1
+            observer.update_observance([observed_satellite])
+            centers.append(observed_satellite.center().get_as_tuple())
+            self.assertEqual(centers[-min(len(centers), 4):], observer.recorded_centers(observed_satellite))
+
+        candidates: list = observer.collision_candidates()
+        self.assertEqual(candidates, observer.collision_candidates())
+        self.assertEqual(centers[-4:], candidates[0][1])
+
+        observer.update_observance([])
+        self.assertEqual({}, observer.observed_satellites())
+
+
+    def test_cached_center_follows_every_position_change(self):
+        """
+        GIVEN:
+        satellites whose centre was read
+        WHEN:
+        the positions change through a view, through the vectorised step and through a row copy
+        THEN:
+        every centre read afterwards is the one of the current position
+        """
+        satellite = self.satellites[2]
+        other_satellite = self.satellites[5]
+        for read_satellite in (satellite, other_satellite):
+            read_satellite.center()
+
+        satellite.position.set_xy(100, 200)
+        self.assertEqual((100 + satellite.radius(), 200 + satellite.radius()), satellite.center_xy())
+
+        for read_satellite in self.satellites:
+            read_satellite.velocity_handler.set_navigation_velocity(Vector(1, -2))
+        self.store.step()
+        self.assertEqual((101 + satellite.radius(), 198 + satellite.radius()), satellite.center_xy())
+
+        self.store.copy_row(5, self.store, 2)
+        self.assertEqual(satellite.center().get_as_tuple(), other_satellite.center_xy())
+        self.assertEqual(tuple(self.store.centers()[5]), other_satellite.center_xy())
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    @staticmethod
+    def __create_disturbances(space: Space, rng: np.random.Generator):
+        satellites: list = space.get_satellites()
+        satellites[rng.integers(len(satellites))].append_disturbance(Malfunction(rng))
+        disturbance = [SolarRadiationDisturbance(max_surface=10000, rng=rng), GravitationalDisturbance(120, rng),
+                       MagneticDisturbance(120, rng)][rng.integers(3)]
+        for satellite in satellites:
+            influence: float = satellite.surface() if isinstance(disturbance, SolarRadiationDisturbance) \
+                else satellite.mass()
+            append_disturbance_to_satellite(disturbance, satellite, influence)
@@ -0,0 +1,186 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+from unittest import TestCase
+
+import numpy as np
+
+from SatelliteSimulation.model.basic_math.vector import Vector
+from SatelliteSimulation.model.border import Border
+from SatelliteSimulation.model.disturbance.disturbance import GravitationalDisturbance, Malfunction
+from SatelliteSimulation.model.model import Space, append_disturbance_to_satellite, MAX_CATCH_UP_STEPS
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestSpace(TestCase):
+    """
+    Test class for the Space.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def test_same_seed_gives_identical_trajectories(self):
+        """
+        GIVEN:
+        two spaces created with generators of the same seed
+        WHEN:
+        both spaces run the same frames with disturbances drawn from their generators
+        THEN:
+        the satellites and their trajectories are identical
+        """
+        trajectories: list = [self.__run_seeded_space(seed=3) for _ in range(2)]
+
+        self.assertEqual(trajectories[0], trajectories[1])
+        self.assertNotEqual(trajectories[0], self.__run_seeded_space(seed=4))
+
+
+    def test_collision_event_queue_keeps_the_collisions(self):
+        """
+        GIVEN:
+        two spaces created with generators of the same seed, one with and one without the collision event queue,
+        whose satellites fly with whole velocities, so that the queue keeps the predictions of many pairs
+        WHEN:
+        both spaces run the same frames
+        THEN:
+        the satellites crash in the same frames and have identical trajectories
+        """
+        for seed in range(3):
+            self.assertEqual(self.__run_space_with_whole_velocities(seed=seed, use_collision_events=False),
+                             self.__run_space_with_whole_velocities(seed=seed, use_collision_events=True))
+
+
+    def test_advance_interpolates_between_the_last_two_steps(self):
+        """
+        GIVEN:
+        two spaces created with generators of the same seed
+        WHEN:
+        the first space advances by 2.5 fixed steps and the second one calculates two frames
+        THEN:
+        the first space calculated two steps, its positions equal the ones of the second space
+        and its interpolated positions are halfway between the last two frames of the second space
+        """
+        space: Space = self.__create_seeded_space(seed=5)
+        space.set_delta_time(2.5)
+        steps: int = space.advance()
+
+        reference: Space = self.__create_seeded_space(seed=5)
+        reference.next_frame()
+        previous_positions: np.ndarray = reference.get_store().positions[:15].copy()
+        reference.next_frame()
+        positions: np.ndarray = reference.get_store().positions[:15]
+
+        self.assertEqual(2, steps)
+        self.assertAlmostEqual(0.5, space.interpolation_factor())
+        self.assertTrue(np.any(positions != previous_positions))
+        np.testing.assert_array_equal(positions, space.get_store().positions[:15])
+        np.testing.assert_allclose((positions + previous_positions) / 2,
+                                   positions + space.interpolated_position_offsets())
+
+
+    def test_advance_caps_the_catch_up_steps(self):
+        """
+        GIVEN:
+        a space
+        WHEN:
+        the space advances by far more fixed steps than it may catch up
+        THEN:
+        only MAX_CATCH_UP_STEPS steps are calculated and the remaining time is dropped
+        """
+        space: Space = self.__create_seeded_space(seed=5)
+        space.set_delta_time(MAX_CATCH_UP_STEPS + 10.25)
+
+        self.assertEqual(MAX_CATCH_UP_STEPS, space.advance())
+        self.assertAlmostEqual(0.25, space.interpolation_factor())
+
+
+    def test_too_many_satellites_for_the_border_raise_an_error(self):
+        """
+        GIVEN:
+        a border that fits about 20 satellites
+        WHEN:
+        a space with 20 and a space with 100 satellites is created
+        THEN:
+        the first one places all satellites inside the border, the second one raises a ValueError
+        """
+        border = Border(x=0, y=0, width=1920, height=1080, padding=30)
+
+        space = Space(satellite_amount=20, border=border, rng=np.random.default_rng(5))
+
+        self.assertEqual(20, len(space.get_satellites()))
+        self.assertTrue(space.get_store().inside_border(border).all())
+        with self.assertRaises(ValueError):
+            Space(satellite_amount=100, border=border, rng=np.random.default_rng(5))
+
+
+    def test_crowded_border_is_filled_with_smaller_satellites(self):
+        """
+        GIVEN:
+        a border of 1366x768 that fits about 16 satellites
+        WHEN:
+        spaces with 16 satellites are created with different seeds
+        THEN:
+        every space places all satellites inside the border, with smaller types where larger ones do not fit
+        """
+        border = Border(x=0, y=0, width=1366, height=768, padding=30)
+
+        for seed in range(10):
+            space = Space(satellite_amount=16, border=border, rng=np.random.default_rng(seed))
+
+            self.assertEqual(16, len(space.get_satellites()))
+            self.assertTrue(space.get_store().inside_border(border).all())
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    @staticmethod
+    def __create_seeded_space(seed: int) -> Space:
+        space = Space(satellite_amount=15, border=Border(x=0, y=0, width=1920, height=1080, padding=30),
+                      rng=np.random.default_rng(seed))
+        for satellite in space.get_satellites():
+            if not satellite.is_crashed():
+                satellite.velocity_handler.set_navigation_velocity(Vector(2, -1))
+        return space
+
+
+    @staticmethod
+    def __run_seeded_space(seed: int) -> list:
+        space = Space(satellite_amount=15, border=Border(x=0, y=0, width=1920, height=1080, padding=30),
+                      rng=np.random.default_rng(seed))
+        satellites: list = space.get_satellites()
+        rng: np.random.Generator = space.get_rng()
+        trajectories: list = []
+        for frame in range(100):
+            if frame % 20 == 0:
+                satellites[rng.integers(len(satellites))].append_disturbance(Malfunction(rng))
+                disturbance = GravitationalDisturbance(max_mass=120, rng=rng)
+                for satellite in satellites:
+                    append_disturbance_to_satellite(disturbance, satellite, satellite.mass())
+            space.next_frame()
+            trajectories.append([satellite.position.get_as_tuple() for satellite in satellites])
+        return trajectories
+
+
+    @staticmethod
+    def __run_space_with_whole_velocities(seed: int, use_collision_events: bool) -> list:
+        space = Space(satellite_amount=15, border=Border(x=0, y=0, width=1920, height=1080, padding=30),
+                      rng=np.random.default_rng(seed), use_collision_events=use_collision_events)
+        satellites: list = space.get_satellites()
+        for satellite in satellites:
+            satellite.velocity_handler.set_navigation_velocity(
+                Vector(*space.get_rng().integers(-3, 4, size=2).tolist()))
+        trajectories: list = []
+        for frame in range(300):
+            space.next_frame()
+            trajectories.append([(satellite.position.get_as_tuple(), satellite.is_crashed())
+                                 for satellite in satellites])
+        return trajectories
@@ -0,0 +1,77 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import csv
+import os
+import tempfile
+from unittest import TestCase
+
+from SatelliteSimulation.presenter.frame_profiler import FrameProfiler, CSV_HEADER
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestFrameProfiler(TestCase):
+    """
+    Test class for the FrameProfiler.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def test_rolling_statistics_only_cover_the_window(self):
+        """
+        GIVEN:
+        a profiler with a window of 100 frames
+        WHEN:
+        one phase is recorded 200 times, the last 100 durations being 1 to 100 ms
+        THEN:
+        p50, p95 and maximum are calculated of the last 100 durations, the frame count covers all 200
+        """
+        profiler = FrameProfiler(window_size=100)
+        for _ in range(100):
+            profiler.record("move", 1.0)
+        for milliseconds in range(1, 101):
+            profiler.record("move", milliseconds / 1000)
+
+        statistics = profiler.statistics()
+        self.assertEqual(1, len(statistics))
+        self.assertEqual("move", statistics[0].name)
+        self.assertAlmostEqual(50.5, statistics[0].p50)
+        self.assertAlmostEqual(95.05, statistics[0].p95)
+        self.assertAlmostEqual(100, statistics[0].maximum)
+        self.assertEqual(200, statistics[0].frames)
+
+
+    def test_phases_are_written_to_csv_in_order(self):
+        """
+        GIVEN:
+        a profiler
+        WHEN:
+        two phases are timed with the context manager and the profiler is written to a CSV file
+        THEN:
+        the file has the header and one row per phase in the order they were timed
+        """
+        profiler = FrameProfiler()
+        for _ in range(3):
+            with profiler.phase("avoidance"):
+                pass
+            with profiler.phase("gui update"):
+                pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path: str = os.path.join(directory, "frame_profile.csv")
+            profiler.write_csv(file_path)
+            with open(file_path, newline="") as file:
+                rows: list = list(csv.reader(file))
+
+        self.assertEqual(CSV_HEADER, rows[0])
+        self.assertEqual(["avoidance", "gui update"], [row[0] for row in rows[1:]])
+        self.assertEqual(["3", "3"], [row[1] for row in rows[1:]])
@@ -0,0 +1,67 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import threading
+import time
+from unittest import TestCase
+
+import numpy as np
+
+from SatelliteSimulation.model.basic_math.vector import Vector
+from SatelliteSimulation.model.border import Border
+from SatelliteSimulation.model.model import Space
+from SatelliteSimulation.presenter.simulation_thread import SimulationThread
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+TIMEOUT = 5
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestSimulationThread(TestCase):
+    """
+    Test class for the SimulationThread.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def test_steps_are_published_as_read_only_snapshots(self):
+        """
+        GIVEN:
+        a simulation thread of a space with moving satellites
+        WHEN:
+        the thread runs and a command is submitted
+        THEN:
+        the command is called on the simulation thread and new read only snapshots with moved satellites are published
+        """
+        space = Space(satellite_amount=10, border=Border(x=0, y=0, width=1920, height=1080, padding=30),
+                      rng=np.random.default_rng(11))
+        for satellite in space.get_satellites():
+            if not satellite.is_crashed():
+                satellite.velocity_handler.set_navigation_velocity(Vector(1, 1))
+        simulation_thread = SimulationThread(space)
+        first_snapshot = simulation_thread.latest_snapshot()
+        command_threads: list = []
+
+        simulation_thread.start()
+        simulation_thread.submit(lambda submitted_space: command_threads.append(threading.current_thread()))
+        deadline: float = time.perf_counter() + TIMEOUT
+        while simulation_thread.latest_snapshot() is first_snapshot and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        simulation_thread.stop()
+
+        snapshot = simulation_thread.latest_snapshot()
+        self.assertFalse(simulation_thread.is_alive())
+        self.assertIsNot(first_snapshot, snapshot)
+        self.assertEqual(1, len(command_threads))
+        self.assertIsNot(threading.current_thread(), command_threads[0])
+        self.assertTrue(np.any(snapshot.positions != first_snapshot.positions))
+        self.assertFalse(snapshot.positions.flags.writeable)
+        self.assertEqual(len(snapshot.arrows), len(snapshot.arrow_owners))
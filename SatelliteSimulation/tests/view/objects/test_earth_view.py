@@ -0,0 +1,46 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import math
+from unittest import TestCase
+
+from SatelliteSimulation.view.objects.earth_view import calculate_atlas_frame_amount, MAX_ATLAS_BYTES, \
+    MAX_ATLAS_FRAMES
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class TestEarthView(TestCase):
+    """
+    Test class for the rotation atlas of the EarthView.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def test_atlas_memory_is_capped(self):
+        """
+        GIVEN:
+        earth images of increasing size
+        WHEN:
+        the amount of atlas frames is calculated
+        THEN:
+        small earths get an angle per degree, larger ones fewer angles within the memory cap
+        and the largest ones no atlas at all
+        """
+        self.assertEqual(MAX_ATLAS_FRAMES, calculate_atlas_frame_amount(100))
+
+        for earth_size in [300, 450, 600]:
+            frame_amount: int = calculate_atlas_frame_amount(earth_size)
+            rotated_size: int = math.ceil(earth_size * math.sqrt(2))
+            self.assertLess(0, frame_amount)
+            self.assertLessEqual(frame_amount * rotated_size * (rotated_size // 2 + 1) * 4, MAX_ATLAS_BYTES)
+
+        self.assertEqual(0, calculate_atlas_frame_amount(2000))
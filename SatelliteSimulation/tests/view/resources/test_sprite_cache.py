@@ -0,0 +1,100 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+from unittest import TestCase
+
+import pygame
+
+from SatelliteSimulation.view.resources.sprite_cache import SpriteCache
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class SourceImages:
+    """
+    Stands in for the Images singleton, which needs a display to load the assets.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    def get_satellite(self, satellite_type: int, is_crashed: bool) -> pygame.Surface:
+        return pygame.Surface((10 + satellite_type, 10))
+
+
+    def get_asteroid(self) -> pygame.Surface:
+        return pygame.Surface((20, 20))
+
+
+class TestSpriteCache(TestCase):
+    """
+    Test class for the SpriteCache.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def test_scaled_sprites_are_reused(self):
+        """
+        GIVEN:
+        a sprite cache
+        WHEN:
+        the same satellite sprite is requested twice
+        THEN:
+        the image is scaled once to the requested size and the same surface is returned
+        """
+        sprite_cache = SpriteCache(SourceImages())
+        sprite: pygame.Surface = sprite_cache.get_satellite(2, False, (30, 30))
+
+        self.assertEqual((30, 30), sprite.get_size())
+        self.assertIs(sprite, sprite_cache.get_satellite(2, False, (30, 30)))
+        self.assertIsNot(sprite, sprite_cache.get_satellite(2, True, (30, 30)))
+        self.assertEqual(2, len(sprite_cache))
+
+
+    def test_least_recently_used_sprite_is_dropped(self):
+        """
+        GIVEN:
+        a sprite cache for two sprites
+        WHEN:
+        three sprites are requested, the first one again before the third one
+        THEN:
+        the second sprite is dropped and clearing the cache drops the remaining ones
+        """
+        sprite_cache = SpriteCache(SourceImages(), max_sprites=2)
+        first_sprite: pygame.Surface = sprite_cache.get_satellite(1, False, (10, 10))
+        second_sprite: pygame.Surface = sprite_cache.get_satellite(5, False, (10, 10))
+        sprite_cache.get_satellite(1, False, (10, 10))
+        sprite_cache.get_satellite(3, False, (10, 10))
+
+        self.assertEqual(2, len(sprite_cache))
+        self.assertIs(first_sprite, sprite_cache.get_satellite(1, False, (10, 10)))
+        self.assertIsNot(second_sprite, sprite_cache.get_satellite(5, False, (10, 10)))
+
+        sprite_cache.clear()
+        self.assertEqual(0, len(sprite_cache))
+
+
+    def test_circles_are_transparent_outside_the_outline(self):
+        """
+        GIVEN:
+        a sprite cache
+        WHEN:
+        a circle sprite is requested twice
+        THEN:
+        the same square sprite is returned, with the outline in the color and a transparent center
+        """
+        sprite_cache = SpriteCache(SourceImages())
+        circle: pygame.Surface = sprite_cache.get_circle((160, 38, 38), 20, 2)
+
+        self.assertIs(circle, sprite_cache.get_circle((160, 38, 38), 20, 2))
+        self.assertEqual((40, 40), circle.get_size())
+        self.assertEqual((160, 38, 38), tuple(circle.get_at((20, 0)))[:3])
+        self.assertEqual(circle.get_colorkey(), circle.get_at((20, 20)))
@@ -0,0 +1,103 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import os
+import random
+from unittest import TestCase
+
+import numpy as np
+import pygame
+
+from SatelliteSimulation.view.objects.arrow_view import ArrowView
+from SatelliteSimulation.view.objects.button.button_data import ButtonData, ToggleButtonData
+from SatelliteSimulation.view.objects.satellite_observance_border_view import SatelliteObservanceBorderView
+from SatelliteSimulation.view.objects.satellite_view import SatelliteView
+from SatelliteSimulation.view.view import GUI
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class Controller:
+    """
+    The GUI only calls back the controller on events, which the tests do not create.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def quit(self):
+        pass
+
+
+class TestGUI(TestCase):
+    """
+    Test class for the GUI, drawn on a display without a window.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+
+    def test_dirty_rectangles_draw_the_same_frame_as_a_full_redraw(self):
+        """
+        GIVEN:
+        a GUI that has drawn some frames with moving satellites
+        WHEN:
+        the next frame is drawn by restoring only the changed areas
+        THEN:
+        apart from the rotating earth it is the same as the frame drawn from scratch
+        """
+        gui = GUI(Controller(), border_width=1920, border_height=1080, border_padding=30,
+                  button_data=[ButtonData("DISTURBANCE", lambda name: None),
+                               ToggleButtonData("MODE", lambda is_selected: None, is_selected=True)])
+        surface: pygame.Surface = pygame.display.get_surface()
+        for frame in range(3):
+            gui.update(*self.__create_views(surface, seed=frame))
+        dirty_frame: np.ndarray = pygame.surfarray.array3d(surface)
+
+        gui.quit()
+        gui = GUI(Controller(), border_width=1920, border_height=1080, border_padding=30,
+                  button_data=[ButtonData("DISTURBANCE", lambda name: None),
+                               ToggleButtonData("MODE", lambda is_selected: None, is_selected=True)])
+        surface = pygame.display.get_surface()
+        gui.update(*self.__create_views(surface, seed=2))
+        full_frame: np.ndarray = pygame.surfarray.array3d(surface)
+
+        earth_area: pygame.Rect = gui._GUI__view_store.earth.get_earth_area(surface)
+        outside_earth: np.ndarray = np.ones(surface.get_size(), dtype=bool)
+        outside_earth[earth_area.left:earth_area.right, earth_area.top:earth_area.bottom] = False
+        np.testing.assert_array_equal(full_frame[outside_earth], dirty_frame[outside_earth])
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    @staticmethod
+    def __create_views(surface: pygame.Surface, seed: int) -> tuple:
+        rng = random.Random(seed)
+        width, height = surface.get_size()
+        satellites: list = [SatelliteView(rng.uniform(0, width), rng.uniform(0, height), rng.choice([10, 20]),
+                                          rng.random() < 0.2, rng.randint(1, 5)) for _ in range(30)]
+        arrows: list = [ArrowView((satellite.x, satellite.y), (satellite.x + 20, satellite.y),
+                                  [(satellite.x + 20, satellite.y - 4), (satellite.x + 20, satellite.y + 4),
+                                   (satellite.x + 28, satellite.y)], 2, (158, 38, 38))
+                        for satellite in satellites[:10]]
+        observance_borders: list = [SatelliteObservanceBorderView((189, 122, 34), (satellite.x, satellite.y), 30, 2)
+                                    for satellite in satellites]
+        return satellites, arrows, observance_borders
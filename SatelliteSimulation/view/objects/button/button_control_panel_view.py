@@ -98,6 +98,12 @@ class ButtonControlPanelView:
         return self.__button_data
 
 
+    @property
+    def bottom(self) -> float:
+        last_button: Button = list(self.__buttons.values())[-1]
+        return last_button.y + last_button.get_height()
+
+
     def get_button(self, button_name: str) -> Button:
         return self.__buttons[button_name]
 
@@ -111,6 +117,10 @@ class ButtonControlPanelView:
             self.__buttons[button_name].draw(surface)
 
 
+    def get_appearance(self) -> tuple:
+        return tuple(button.appearance() for button in self.__buttons.values())
+
+
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Private Methods
     # ----------------------------------------------------------------------- #
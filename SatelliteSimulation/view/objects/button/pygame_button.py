@@ -90,6 +90,13 @@ class Button:
         self.__draw_text(surface)
 
 
+    def appearance(self) -> tuple:
+        """
+        Everything the drawn button depends on, it only has to be drawn again when this changes.
+        """
+        return self.__state, self._body_color, self._bottom_border_color, self.__body.y
+
+
     def disable(self):
         self.__set_state(ButtonState.DISABLED, int(self.y), GREY)
         self._body_color = MEDIUM_GREY
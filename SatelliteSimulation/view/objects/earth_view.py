@@ -1,6 +1,8 @@
 # =========================================================================== #
 #  SECTION: Imports
 # =========================================================================== #
+import math
+
 import pygame
 
 from view.resources.images import Images
@@ -9,6 +11,15 @@ from view.resources.images import Images
 #  SECTION: Global definitions
 # =========================================================================== #
 
+# rotation of the earth per drawn frame in degrees
+EARTH_ROTATION_SPEED = 0.2
+
+# the rotated earth images are kept in an atlas of at most this many angles of one revolution
+MAX_ATLAS_FRAMES = 360
+# and at most this many bytes, fewer angles are used for large earth images
+MAX_ATLAS_BYTES = 64 * 1024 * 1024
+# earth images that are too large for this many angles are rotated in every frame instead
+MIN_ATLAS_FRAMES = 36
 
 # =========================================================================== #
 #  SECTION: Class definitions
@@ -31,6 +42,8 @@ class EarthView:
         self.__center_x = center_x
         self.__dotted_circle_padding = dotted_circle_padding
         self.__earth_img_angle = 0
+        # filled when an angle is drawn for the first time
+        self.__atlas: list = [None] * calculate_atlas_frame_amount(earth_size)
 
         self.__earth_size = earth_size
         self.__surface_height = surface_height
@@ -60,14 +73,36 @@ class EarthView:
     def dotted_circle_padding(self) -> float:
         return self.__dotted_circle_padding
 
+    @property
+    def atlas_frame_amount(self) -> int:
+        return len(self.__atlas)
+
     # ----------------------------------------------------------------------- #
     #  SUBSECTION: Public Methods
     # ----------------------------------------------------------------------- #
     def draw(self, surface: pygame.Surface):
+        self.draw_dotted_circle(surface)
+        self.draw_earth(surface)
+
+
+    def draw_dotted_circle(self, surface: pygame.Surface):
         surface.blit(self.__dotted_circle, self.__dotted_circle_position)
+
+
+    def draw_earth(self, surface: pygame.Surface):
         self.__rotate_and_draw_earth(surface)
 
 
+    def get_earth_area(self, surface: pygame.Surface) -> pygame.Rect:
+        """
+        The area the earth covers in any rotation.
+        """
+        size: int = math.ceil(self.__earth_size * math.sqrt(2)) + 2
+        area = pygame.Rect(0, 0, size, size)
+        area.center = (int(self.__center_x), surface.get_height())
+        return area.clip(surface.get_rect())
+
+
     def get_dotted_circle_position(self) -> tuple:
         return self.__dotted_circle_position[0], self.__dotted_circle_position[1]
 
@@ -82,18 +117,43 @@ class EarthView:
 
 
     def __rotate_and_draw_earth(self, surface: pygame.Surface):
-        self.__earth_img_angle -= 0.2
-        earth_img_rotated = pygame.transform.rotozoom(self.__earth_img, self.__earth_img_angle, 1)
+        self.__earth_img_angle -= EARTH_ROTATION_SPEED
+        if self.__atlas:
+            frame_index: int = round(self.__earth_img_angle / 360 * len(self.__atlas)) % len(self.__atlas)
+            if self.__atlas[frame_index] is None:
+                self.__atlas[frame_index] = self.__rotate_upper_half(frame_index * 360 / len(self.__atlas))
+            earth_img_rotated, full_height = self.__atlas[frame_index]
+        else:
+            earth_img_rotated, full_height = self.__rotate_upper_half(self.__earth_img_angle)
         image_position = (self.__center_x - earth_img_rotated.get_width() // 2), \
-                         surface.get_height() - earth_img_rotated.get_height() // 2
+                         surface.get_height() - full_height // 2
 
         surface.blit(earth_img_rotated, image_position)
 
 
+    def __rotate_upper_half(self, angle: float) -> tuple:
+        """
+        The earth rotated by the angle and the height of the rotated image.
+        Only the upper half is kept, the earth center lies on the bottom of the window.
+        """
+        earth_img_rotated: pygame.Surface = pygame.transform.rotozoom(self.__earth_img, angle, 1)
+        full_height: int = earth_img_rotated.get_height()
+        upper_half = pygame.Rect(0, 0, earth_img_rotated.get_width(), full_height // 2)
+        return earth_img_rotated.subsurface(upper_half).copy(), full_height
+
+
 # =========================================================================== #
 #  SECTION: Function definitions
 # =========================================================================== #
 
+
+def calculate_atlas_frame_amount(earth_size: float) -> int:
+    # the rotated images are as large as the earth rotated by 45 degrees, of which the upper half is kept
+    rotated_size: int = math.ceil(earth_size * math.sqrt(2))
+    frame_bytes: int = rotated_size * (rotated_size // 2 + 1) * 4
+    frame_amount: int = min(MAX_ATLAS_FRAMES, MAX_ATLAS_BYTES // frame_bytes)
+    return frame_amount if frame_amount >= MIN_ATLAS_FRAMES else 0
+
 # =========================================================================== #
 #  SECTION: Main Body
 # =========================================================================== #
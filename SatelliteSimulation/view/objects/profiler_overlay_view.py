@@ -0,0 +1,93 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+import pygame
+
+from view.resources.Color import LIGHT_GREY, MEDIUM_GREY
+
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+HEADER = ("PHASE", "P50 MS", "P95 MS", "MAX MS")
+
+# share of the overlay width where the columns start
+COLUMN_OFFSETS = (0, 0.4, 0.6, 0.8)
+LINE_SPACING = 1.3
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+
+
+class ProfilerOverlayView:
+    """
+    Table of the rolling frame phase durations, drawn below the button control panel.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, x: float, y: float, width: float, font_size: float):
+        self.__x: float = x
+        self.__y: float = y
+        self.__width: float = width
+        self.__font_size: float = font_size
+        self.__font = pygame.font.SysFont("Verdana", max(1, int(font_size)))
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    @property
+    def x(self) -> float:
+        return self.__x
+
+
+    @property
+    def y(self) -> float:
+        return self.__y
+
+
+    @property
+    def width(self) -> float:
+        return self.__width
+
+
+    @property
+    def font_size(self) -> float:
+        return self.__font_size
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def draw(self, surface: pygame.Surface, rows: list) -> pygame.Rect:
+        """
+        rows: one tuple of (phase name, p50, p95, maximum) texts per phase
+        Returns the area that was drawn.
+        """
+        line_height: float = self.__font_size * LINE_SPACING
+        area: pygame.Rect = self.__draw_row(surface, HEADER, self.__y, MEDIUM_GREY)
+        for index, row in enumerate(rows):
+            area.union_ip(self.__draw_row(surface, row, self.__y + line_height * (index + 1), LIGHT_GREY))
+        return area
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    def __draw_row(self, surface: pygame.Surface, texts: tuple, y: float, color: tuple) -> pygame.Rect:
+        areas: list = [surface.blit(self.__font.render(text, True, color), (self.__x + self.__width * column_offset, y))
+                       for text, column_offset in zip(texts, COLUMN_OFFSETS)]
+        return areas[0].unionall(areas[1:])
+
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
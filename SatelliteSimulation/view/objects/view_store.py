@@ -12,12 +12,14 @@ from view.objects.border_view import BorderView
 from view.objects.button.button_control_panel_view import ButtonControlPanelView
 from view.objects.button.button_data import ButtonData
 from view.objects.earth_view import EarthView
+from view.objects.profiler_overlay_view import ProfilerOverlayView
 
 BORDER_PERCENTAGE = 0.75
 MARGIN_PERCENTAGE = 0.01
 MINI_BORDER_SCALE = 0.04
 FONT_SIZE = 24
 DEFAULT_BUTTON_OFFSET = 50
+PROFILER_FONT_SCALE = 0.8
 
 
 # =========================================================================== #
@@ -83,6 +85,7 @@ class ViewStore:
         self.__button_control_panel = self.__scale_button_control_panel(1, self.__button_control_panel_reference.button_data)
         self.__earth = self.__scale_earth(1)
         self.__mini_border = self.__scale_border_view(self.__mini_border_reference, 1)
+        self.__profiler_overlay = self.__create_profiler_overlay(self.__button_control_panel)
 
 
     # ----------------------------------------------------------------------- #
@@ -112,11 +115,16 @@ class ViewStore:
     def button_control_panel(self) -> ButtonControlPanelView:
         return self.__button_control_panel
 
+    @property
+    def profiler_overlay(self) -> ProfilerOverlayView:
+        return self.__profiler_overlay
+
     def scale_views(self, scale_factor: float):
         self.__earth = self.__scale_earth(scale_factor)
         self.__button_control_panel = self.__scale_button_control_panel(scale_factor,  self.__button_control_panel.button_data)
         self.__border = self.__scale_border_view(self.__border_reference, scale_factor)
         self.__mini_border = self.__scale_border_view(self.__mini_border_reference, scale_factor)
+        self.__profiler_overlay = self.__create_profiler_overlay(self.__button_control_panel)
 
 
     # ----------------------------------------------------------------------- #
@@ -142,6 +150,13 @@ class ViewStore:
         return ButtonControlPanelView(x, y, width, padding, font_size, button_data)
 
 
+    def __create_profiler_overlay(self, button_control_panel: ButtonControlPanelView) -> ProfilerOverlayView:
+        # the same distance to the last button as the first button has to the top
+        y: float = button_control_panel.bottom + button_control_panel.y
+        return ProfilerOverlayView(button_control_panel.x, y, button_control_panel.width,
+                                   button_control_panel.font * PROFILER_FONT_SCALE)
+
+
     def __scale_border_view(self, border: BorderView, scale_factor:float):
         border_as_rectangle: pygame.Rect = border.get_border_rectangle()
         x: float = border_as_rectangle.x * scale_factor
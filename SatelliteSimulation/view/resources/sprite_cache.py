@@ -0,0 +1,109 @@
+# =========================================================================== #
+#  SECTION: Imports
+# =========================================================================== #
+from collections import OrderedDict
+
+import pygame
+
+from view.resources.images import Images
+
+# =========================================================================== #
+#  SECTION: Global definitions
+# =========================================================================== #
+
+# 5 images in both states and the circles of 3 colors at some sizes each, enough for one window scale
+DEFAULT_MAX_SPRITES = 128
+
+# satellite types above this one are drawn as asteroid
+MAX_SATELLITE_IMAGE_TYPE = 4
+
+# transparent color of the circle sprites, no observance circle is drawn in this color
+CIRCLE_COLOR_KEY = (255, 0, 255)
+
+
+# =========================================================================== #
+#  SECTION: Class definitions
+# =========================================================================== #
+class SpriteCache:
+    """
+    The satellite images scaled to the sizes they are drawn with, keyed by (type, crashed, size),
+    and the observance circles, keyed by (color, radius, line thickness).
+    The least recently used sprite is dropped when more than max_sprites are cached.
+    """
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Constructor
+    # ----------------------------------------------------------------------- #
+    def __init__(self, images: Images, max_sprites: int = DEFAULT_MAX_SPRITES):
+        self.__images: Images = images
+        self.__max_sprites: int = max_sprites
+        self.__sprites: OrderedDict = OrderedDict()
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Getter/Setter
+    # ----------------------------------------------------------------------- #
+    def get_satellite(self, satellite_type: int, is_crashed: bool, size: tuple) -> pygame.Surface:
+        key: tuple = (satellite_type, is_crashed, size)
+        sprite: pygame.Surface = self.__sprites.get(key)
+        if sprite is not None:
+            self.__sprites.move_to_end(key)
+            return sprite
+
+        if satellite_type > MAX_SATELLITE_IMAGE_TYPE:
+            image: pygame.Surface = self.__images.get_asteroid()
+        else:
+            image: pygame.Surface = self.__images.get_satellite(satellite_type, is_crashed)
+        return self.__add(key, pygame.transform.scale(image, size))
+
+
+    def get_circle(self, color: tuple, radius: int, line_thickness: int) -> pygame.Surface:
+        """
+        A square surface with the circle outline around its center.
+        A run length encoded color key makes the rest transparent, blitting it only copies the outline,
+        unlike a per pixel alpha surface that would be blended as a whole.
+        """
+        key: tuple = (color, radius, line_thickness)
+        sprite: pygame.Surface = self.__sprites.get(key)
+        if sprite is not None:
+            self.__sprites.move_to_end(key)
+            return sprite
+
+        sprite = pygame.Surface((2 * radius, 2 * radius))
+        sprite.fill(CIRCLE_COLOR_KEY)
+        pygame.draw.circle(sprite, color, (radius, radius), radius, line_thickness)
+        sprite.set_colorkey(CIRCLE_COLOR_KEY, pygame.RLEACCEL)
+        return self.__add(key, sprite)
+
+
+    def __len__(self) -> int:
+        return len(self.__sprites)
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Public Methods
+    # ----------------------------------------------------------------------- #
+    def clear(self):
+        """
+        Drops all sprites, e.g. after the window was resized and all satellites are drawn with new sizes.
+        """
+        self.__sprites.clear()
+
+
+    # ----------------------------------------------------------------------- #
+    #  SUBSECTION: Private Methods
+    # ----------------------------------------------------------------------- #
+    def __add(self, key: tuple, sprite: pygame.Surface) -> pygame.Surface:
+        self.__sprites[key] = sprite
+        if len(self.__sprites) > self.__max_sprites:
+            self.__sprites.popitem(last=False)
+        return sprite
+
+
+# =========================================================================== #
+#  SECTION: Function definitions
+# =========================================================================== #
+
+# =========================================================================== #
+#  SECTION: Main Body
+# =========================================================================== #
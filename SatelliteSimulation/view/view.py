@@ -3,6 +3,7 @@
 # =========================================================================== #
 import pygame
 
+from model.model import EXPECTED_FRAME_RATE
 from view.navigation_handler import NavigationHandler
 from view.objects.arrow_view import ArrowView
 from view.objects.button.button_control_panel_view import ButtonControlPanelView
@@ -11,13 +12,16 @@ from view.objects.satellite_view import SatelliteView
 from view.objects.view_store import ViewStore
 from view.resources import Color
 from view.resources.images import Images
+from view.resources.sprite_cache import SpriteCache
 
 # =========================================================================== #
 #  SECTION: Global definitions
 # =========================================================================== #
 
 FRAME_RATE = 60
-EXPECTED_FRAME_RATE = 60
+
+# with more changed areas, updating the whole display is faster than updating the areas one by one
+MAX_DIRTY_RECTS = 600
 
 
 # =========================================================================== #
@@ -54,6 +58,14 @@ class GUI:
         self.__images = Images()
         self.__background_img = self.__images.get_background()
         self.__background_img = pygame.transform.scale(self.__background_img, self.__surface.get_size())
+        self.__sprite_cache: SpriteCache = SpriteCache(self.__images)
+
+        # the static layers are composed once and only drawn again where something moved
+        self.__background_layer: pygame.Surface = None
+        self.__static_layer: pygame.Surface = None
+        self.__foreground_layer: pygame.Surface = None
+        self.__button_appearance: tuple = None
+        self.__dirty_rects: list = []
 
         self.__controller = controller
         self.__navigation_handler: NavigationHandler = NavigationHandler()
@@ -82,49 +94,66 @@ class GUI:
     # ----------------------------------------------------------------------- #
 
 
-    def update(self, satellites: list, arrows=None, satellite_observance_borders=None):
+    def update(self, satellites: list, arrows=None, satellite_observance_borders=None, profiler_rows=None):
         if satellite_observance_borders is None:
             satellite_observance_borders = []
         if arrows is None:
             arrows = []
         surface = self.__surface
 
-        surface.blit(self.__background_img, (0, 0))
-        self.__view_store.earth.draw(self.__surface)
-        self.__draw_border_connection_lines(surface)
-        self.__view_store.border.draw(surface)
-        self.__view_store.mini_border.draw(surface)
+        button_appearance: tuple = self.__view_store.button_control_panel.get_appearance()
+        redraw_everything: bool = self.__static_layer is None or button_appearance != self.__button_appearance
+        if redraw_everything:
+            self.__compose_static_layers()
+            self.__button_appearance = button_appearance
+            surface.blit(self.__static_layer, (0, 0))
+        else:
+            # restore the areas that were drawn over in the last frame
+            surface.blits([(self.__static_layer, rect, rect) for rect in self.__dirty_rects], doreturn=False)
+
+        # the earth lies below the border connection lines and the mini border
+        earth_area: pygame.Rect = self.__view_store.earth.get_earth_area(surface)
+        surface.blit(self.__background_layer, earth_area, earth_area)
+        self.__view_store.earth.draw_earth(surface)
+        surface.blit(self.__foreground_layer, earth_area, earth_area)
+        dirty_rects: list = [earth_area]
 
-        self.__view_store.button_control_panel.draw(surface)
+        if profiler_rows:
+            dirty_rects.append(self.__view_store.profiler_overlay.draw(surface, profiler_rows))
 
+        # one blits call per layer of sprites
         if satellite_observance_borders:
-            for observance_border in satellite_observance_borders:
-                self.__draw_satellite_observance_border(observance_border)
+            dirty_rects += surface.blits([self.__observance_border_blit(observance_border)
+                                          for observance_border in satellite_observance_borders])
 
         if arrows:
             for arrow in arrows:
-                self.__draw_satellite_velocity_arrow(arrow)
+                dirty_rects += self.__draw_satellite_velocity_arrow(arrow)
 
         if satellites:
-            for satellite in satellites:
-                self.__draw_satellite(satellite)
+            dirty_rects += surface.blits([self.__satellite_blit(satellite) for satellite in satellites])
 
-        pygame.display.update()
+        if redraw_everything or len(dirty_rects) + len(self.__dirty_rects) > MAX_DIRTY_RECTS:
+            pygame.display.update()
+        else:
+            pygame.display.update(self.__dirty_rects + dirty_rects)
+        self.__dirty_rects = dirty_rects
 
 
-    def __draw_satellite_velocity_arrow(self, arrow: ArrowView):
+    def __draw_satellite_velocity_arrow(self, arrow: ArrowView) -> tuple:
         # arrow body
-        pygame.draw.line(self.__surface, arrow.color, arrow.end_of_line, arrow.start_of_line, arrow.line_thickness)
+        body: pygame.Rect = pygame.draw.line(self.__surface, arrow.color, arrow.end_of_line, arrow.start_of_line,
+                                             arrow.line_thickness)
         # arrow head
-        pygame.draw.polygon(self.__surface, arrow.color, arrow.arrow_head)
+        head: pygame.Rect = pygame.draw.polygon(self.__surface, arrow.color, arrow.arrow_head)
+        return body, head
 
 
-    def __draw_satellite_observance_border(self, observance_border: SatelliteObservanceBorderView):
-        pygame.draw.circle(self.__surface,
-                           observance_border.color,
-                           observance_border.position,
-                           observance_border.radius,
-                           observance_border.line_thickness)
+    def __observance_border_blit(self, observance_border: SatelliteObservanceBorderView) -> tuple:
+        radius: int = round(observance_border.radius)
+        circle = self.__sprite_cache.get_circle(observance_border.color, radius, observance_border.line_thickness)
+        x, y = observance_border.position
+        return circle, (x - radius, y - radius)
 
 
     def __draw_border_connection_lines(self, surface):
@@ -160,16 +189,36 @@ class GUI:
         self.__view_store.scale_views(scale_factor)
         self.__background_img = self.__images.get_background()
         self.__background_img = pygame.transform.scale(self.__background_img, self.__surface.get_size())
+        self.__static_layer = None
 
 
-    def __draw_satellite(self, satellite: SatelliteView):
-        if satellite.type > 4:
-            image = self.__images.get_asteroid()
-        else:
-            image = self.__images.get_satellite(satellite.type, satellite.is_crashed)
+    def __compose_static_layers(self):
+        """
+        background layer: background and dotted earth circle, below the earth
+        foreground layer: border connection lines, border and mini border, which may lie above the earth
+        static layer: everything that does not move, the background and foreground layer and the buttons
+        """
+        # without per pixel alpha, restoring an area is a plain copy
+        self.__background_layer = self.__background_img.convert()
+        self.__view_store.earth.draw_dotted_circle(self.__background_layer)
+
+        self.__foreground_layer = pygame.Surface(self.__surface.get_size(), pygame.SRCALPHA)
+        self.__draw_foreground(self.__foreground_layer)
+
+        self.__static_layer = self.__background_layer.copy()
+        self.__draw_foreground(self.__static_layer)
+        self.__view_store.button_control_panel.draw(self.__static_layer)
+
+
+    def __draw_foreground(self, surface: pygame.Surface):
+        self.__draw_border_connection_lines(surface)
+        self.__view_store.border.draw(surface)
+        self.__view_store.mini_border.draw(surface)
+
 
-        image = pygame.transform.scale(image, satellite.size)
-        self.__surface.blit(image, (satellite.x, satellite.y))
+    def __satellite_blit(self, satellite: SatelliteView) -> tuple:
+        image = self.__sprite_cache.get_satellite(satellite.type, satellite.is_crashed, satellite.size)
+        return image, (satellite.x, satellite.y)
 
 
     def calculate_delta_time(self):
@@ -188,6 +237,7 @@ class GUI:
 
                 self.__scale_factor = self.__surface.get_height() / self.__initial_height
                 self.__scale_on_changed(self.__scale_factor)
+                self.__sprite_cache.clear()
 
 
     def calculate_button_states_and_handle_click_events(self):